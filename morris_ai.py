@@ -0,0 +1,573 @@
+"""
+Nine Men's Morris Game - computer opponent (SL)
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+"""
+
+import random
+import threading
+import time
+import morris_batch
+import morris_board
+import morris_book
+import morris_endgame
+import morris_mcts
+import morris_pool
+import morris_tt
+from morris_tt import EXACT, LOWER, UPPER
+from morris_board import SYMMETRIES, SYMMETRY_INVERSE, popcount
+from morris_eval import evaluate
+from morris_game import NO_MOVE_CODE, decode_move, encode_move
+from morris_pool import get_executor, worker_count
+
+# difficulty levels understood by choose_move (menu order) /
+# von choose_move verstandene Schwierigkeitsstufen (Reihenfolge im Menü)
+DIFFICULTIES = ("Leicht", "Mittel", "Schwer", "Monte Carlo")
+
+# search depth of the difficulty "Schwer" in half moves (move + removal = one) /
+# Suchtiefe der Stufe "Schwer" in Halbzügen (Zug + Entfernen = einer)
+SEARCH_DEPTH = 4
+
+# upper limit for iterative deepening / Obergrenze für die iterative Vertiefung
+MAX_DEPTH = 32
+
+# score of a won position; reduced per ply so faster wins score higher /
+# Bewertung einer gewonnenen Stellung; pro Halbzug verringert, damit schnellere Siege besser sind
+WIN_SCORE = 100000
+# scores beyond this are wins/losses at a distance / darüber: Sieg/Niederlage in n Halbzügen
+WIN_BOUND = WIN_SCORE - 1000
+
+# root move lists from this length are scored in one NumPy batch; shorter ones /
+# one by one, which is faster there (morris_bench.py batch) / Wurzelzüge ab dieser
+# Anzahl werden in einem NumPy-Batch bewertet, kürzere einzeln, was dort schneller ist
+BATCH_ORDER_MIN = 40
+
+# a ponder hit keeps at least this share of the think time /
+# ein Ponder-Treffer behält mindestens diesen Anteil der Bedenkzeit
+PONDER_MIN_SHARE = 0.2
+
+# memory of the shared transposition table / Speicher der gemeinsamen Transpositionstabelle
+TT_SIZE_MB = 16
+_table = None
+
+
+def get_table():
+    """Gemeinsame Transpositionstabelle (wird beim ersten Aufruf angelegt)."""
+    global _table
+    if _table is None:
+        _table = morris_tt.TranspositionTable(TT_SIZE_MB)
+    return _table
+
+
+_endgame = None
+_book = None
+
+
+def get_book():
+    """Eröffnungsbuch aus morris_book.BOOK_FILE (leer, wenn nicht vorhanden)."""
+    global _book
+    if _book is None:
+        _book = morris_book.OpeningBook.load()
+    return _book
+
+
+def get_endgame():
+    """Endspiel-Datenbank aus morris_endgame.ENDGAME_DIR (None, wenn nicht gebaut)."""
+    global _endgame
+    if _endgame is None:
+        db = morris_endgame.EndgameDB.load()
+        _endgame = db if db.subspaces() else False
+    return _endgame or None
+
+
+def block_mask(game, player):
+    """Freie Punkte, auf denen der Gegner von player eine Mühle schließen würde."""
+    opp = game.bits[3 - player]
+    empty = game.empty()
+    mask = 0
+    for m in morris_board.MILL_MASKS:
+        if empty & m and popcount(opp & m) == 2:
+            mask |= empty & m
+    return mask
+
+
+def map_move(move, perm):
+    """Bildet einen Zug mit einer Punktpermutation (Symmetrie) ab."""
+    if move is None:
+        return None
+    frm, to, rem = move
+    return (perm[frm] if frm >= 0 else frm, perm[to], perm[rem] if rem >= 0 else rem)
+
+
+class SearchTimeout(Exception):
+    """Zeitbudget der Suche abgelaufen."""
+
+
+class Searcher:
+    """Negamax mit Alpha-Beta über zusammengesetzte Züge (Zug + Entfernen).
+    deadline: time.perf_counter()-Zeitpunkt, nach dem die Suche abbricht (None = ohne Limit).
+    stop: optionales threading.Event; gesetzt bricht die Suche ebenfalls ab.
+    tt: optionale Transpositionstabelle (morris_tt.TranspositionTable).
+    endgame: optionale Endspiel-Datenbank (morris_endgame.EndgameDB), nur für "Entschärft".
+    Zugsortierung: Tabellenzug, Mühlen, Blocken, Killerzüge, dann nach History.
+    """
+
+    # check the clock only every n nodes / Uhr nur alle n Knoten prüfen
+    CHECK_EVERY = 1024
+
+    def __init__(self, deadline=None, tt=None, endgame=None, stop=None):
+        self.deadline = deadline
+        self.stop = stop
+        self.tt = tt
+        self.endgame = endgame
+        self.nodes = 0
+        # two quiet moves per ply that caused a cutoff (kept between depths) /
+        # je Halbzug zwei ruhige Züge, die abgeschnitten haben (bleiben über die Tiefen erhalten)
+        self.killers = [[None, None] for _ in range(MAX_DEPTH + 1)]
+        # cutoff count of quiet moves, index (from + 1) * 24 + to, weighted by depth² /
+        # Abschnitte ruhiger Züge, Index (from + 1) * 24 + to, gewichtet mit Tiefe²
+        self.history = [0] * (25 * 24)
+        # beta cutoffs, and those by the first move searched /
+        # Beta-Abschnitte und die davon durch den ersten durchsuchten Zug
+        self.cutoffs = 0
+        self.first_cutoffs = 0
+
+    def stats(self):
+        """Knoten und Abschnitte als dict; first_cutoff_rate misst die Zugsortierung."""
+        return {
+            "nodes": self.nodes,
+            "cutoffs": self.cutoffs,
+            "first_cutoffs": self.first_cutoffs,
+            "first_cutoff_rate": self.first_cutoffs / self.cutoffs if self.cutoffs else 0.0,
+        }
+
+    def order(self, game, moves, tt_move, ply):
+        """Sortiert moves an Ort und Stelle: Tabellenzug, Mühlen, Blocken (Punkt, auf dem
+        der Gegner eine Mühle schließen würde), Killerzüge dieses Halbzugs, Rest nach History."""
+        if len(moves) < 2:
+            return
+        blocks = block_mask(game, game.current_player)
+        killers = self.killers[ply] if ply <= MAX_DEPTH else ()
+        history = self.history
+
+        def key(m):
+            if m[2] >= 0:
+                return 1 << 31
+            if blocks >> m[1] & 1:
+                return 1 << 30
+            if m in killers:
+                return 1 << 29
+            return history[(m[0] + 1) * 24 + m[1]]
+
+        moves.sort(key=key, reverse=True)
+        # best move of an earlier search first /
+        # bester Zug einer früheren Suche zuerst
+        if tt_move is not None and tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+
+    def cutoff(self, move, depth, ply, first):
+        """Merkt sich einen Beta-Abschnitt von move (ruhige Züge: Killer und History)."""
+        self.cutoffs += 1
+        if first:
+            self.first_cutoffs += 1
+        if move[2] >= 0:
+            return
+        history = self.history
+        i = (move[0] + 1) * 24 + move[1]
+        history[i] += depth * depth
+        # keep the values below the mill/block/killer classes of order() /
+        # Werte unter den Klassen Mühle/Blocken/Killer von order() halten
+        if history[i] >= 1 << 28:
+            self.history = [h >> 1 for h in history]
+        if ply <= MAX_DEPTH:
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+
+    def negamax(self, game, depth, alpha, beta, ply):
+        self.nodes += 1
+        if not self.nodes % self.CHECK_EVERY:
+            if self.deadline is not None and time.perf_counter() >= self.deadline:
+                raise SearchTimeout
+            if self.stop is not None and self.stop.is_set():
+                raise SearchTimeout
+        player = game.current_player
+        # fewer than 3 stones left or blocked: side to move has lost /
+        # weniger als 3 Steine oder eingesperrt: die Seite am Zug hat verloren
+        if game.stones_on_board(player) + game.in_hand(player) < 3:
+            return -WIN_SCORE + ply
+        if game.is_draw():
+            return 0
+        # solved endgame: exact result instead of the heuristic; the database /
+        # knows neither anti-pendulum nor draw rules, so not for "Turnier" /
+        # gelöstes Endspiel: exaktes Ergebnis statt Heuristik; die Datenbank kennt
+        # weder Anti-Pendeln noch Remisregeln, daher nicht für "Turnier"
+        if self.endgame is not None and not game.tournament and not game.in_placement():
+            hit = self.endgame.lookup(game.bits[player], game.bits[3 - player])
+            if hit is not None:
+                result, dist = hit
+                # without stored distances every win counts as "far" /
+                # ohne gespeicherte Distanzen gilt jeder Sieg als "weit"
+                if dist is None:
+                    dist = 254
+                if result == morris_endgame.WIN:
+                    return WIN_SCORE - ply - dist
+                if result == morris_endgame.LOSS:
+                    return -WIN_SCORE + ply + dist
+                return 0
+        if depth <= 0:
+            if not game.has_moves():
+                return -WIN_SCORE + ply
+            return evaluate(game, player)
+        tt = self.tt
+        tt_code = NO_MOVE_CODE
+        if tt is not None:
+            # symmetric positions share one entry / symmetrische Stellungen teilen einen Eintrag
+            key, sym = game.canonical_hash()
+            entry = tt.probe(key)
+            if entry is not None:
+                tt_depth, flag, score, tt_code = entry
+                # the key knows neither the anti-pendulum rule nor repetitions, so /
+                # "Turnier" uses the stored move only for ordering / der Schlüssel kennt
+                # weder Anti-Pendeln noch Wiederholungen, daher nutzt "Turnier" nur den Zug
+                if tt_depth >= depth and not game.tournament:
+                    # win distances are stored relative to this node /
+                    # Sieg-Abstände sind relativ zu diesem Knoten gespeichert
+                    if score > WIN_BOUND:
+                        score -= ply
+                    elif score < -WIN_BOUND:
+                        score += ply
+                    if flag == EXACT or (flag == LOWER and score >= beta) or (flag == UPPER and score <= alpha):
+                        return score
+        moves = game.legal_moves()
+        if not moves:
+            return -WIN_SCORE + ply
+        # the stored move is unpacked only when the moves are searched /
+        # der gespeicherte Zug wird erst ausgepackt, wenn die Züge durchsucht werden
+        tt_move = None
+        if tt_code != NO_MOVE_CODE:
+            tt_move = map_move(decode_move(tt_code), SYMMETRIES[SYMMETRY_INVERSE[sym]])
+        self.order(game, moves, tt_move, ply)
+        alpha_start = alpha
+        best = -WIN_SCORE - 1
+        best_move = None
+        for i, move in enumerate(moves):
+            game.apply(move)
+            try:
+                score = -self.negamax(game, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                game.undo()
+            if score > best:
+                best = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        self.cutoff(move, depth, ply, i == 0)
+                        break
+        if tt is not None:
+            if best >= beta:
+                flag = LOWER
+            elif best > alpha_start:
+                flag = EXACT
+            else:
+                flag = UPPER
+            score = best
+            if score > WIN_BOUND:
+                score += ply
+            elif score < -WIN_BOUND:
+                score -= ply
+            tt.store(key, depth, flag, score, encode_move(map_move(best_move, SYMMETRIES[sym])))
+        return best
+
+    def root(self, game, moves, depth):
+        """Sucht alle moves mit depth Halbzügen; liefert (score, bester Zug)."""
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        best_move = moves[0]
+        for move in moves:
+            game.apply(move)
+            try:
+                score = -self.negamax(game, depth - 1, -beta, -alpha, 1)
+            finally:
+                game.undo()
+            if score > alpha:
+                alpha = score
+                best_move = move
+        return alpha, best_move
+
+
+_last_stats = {}
+
+
+def search_stats():
+    """Searcher.stats() der letzten abgeschlossenen Suche im eigenen Prozess (leer vor der ersten)."""
+    return _last_stats
+
+
+def _root_moves(game, rng):
+    moves = game.legal_moves()
+    # shuffled, so equal moves are picked at random; best static score first /
+    # gemischt, damit gleichwertige Züge zufällig gewählt werden; beste statische
+    # Bewertung zuerst
+    rng.shuffle(moves)
+    if len(moves) >= BATCH_ORDER_MIN and morris_batch.available():
+        # static score of all children in one NumPy batch /
+        # statische Bewertung aller Folgestellungen in einem NumPy-Batch
+        return morris_batch.order_moves(game, moves)
+    player = game.current_player
+    scores = {}
+    for move in moves:
+        game.apply(move)
+        scores[move] = evaluate(game, player)
+        game.undo()
+    moves.sort(key=scores.__getitem__, reverse=True)
+    return moves
+
+
+def search(game, depth=SEARCH_DEPTH, rng=random, tt=None, stop=None):
+    """Alpha-Beta-Suche mit fester Tiefe (tt: Standard ist die gemeinsame Tabelle).
+    Liefert (score, move) aus Sicht der Seite am Zug; move ist None ohne legale Züge.
+    Mit gesetztem stop wird SearchTimeout ausgelöst.
+    """
+    global _last_stats
+    moves = _root_moves(game, rng)
+    if not moves:
+        return -WIN_SCORE, None
+    searcher = Searcher(tt=tt or get_table(), endgame=get_endgame(), stop=stop)
+    result = searcher.root(game, moves, depth)
+    _last_stats = searcher.stats()
+    return result
+
+
+def iterative_deepening(game, time_limit, max_depth=MAX_DEPTH, rng=random, tt=None, stop=None):
+    """Sucht Tiefe 1, 2, ... bis das Zeitbudget (Sekunden) abläuft oder stop gesetzt wird
+    (time_limit None: bis max_depth). Liefert (score, move, depth) der letzten vollständig durchsuchten Tiefe.
+    """
+    global _last_stats
+    moves = _root_moves(game, rng)
+    if not moves:
+        return -WIN_SCORE, None, 0
+    deadline = time.perf_counter() + time_limit if time_limit else None
+    searcher = Searcher(deadline, tt or get_table(), get_endgame(), stop)
+    score, best, done = 0, moves[0], 0
+    for depth in range(1, max_depth + 1):
+        try:
+            score, best = searcher.root(game, moves, depth)
+        except SearchTimeout:
+            break
+        done = depth
+        # won or lost for sure: deeper search changes nothing /
+        # sicher gewonnen oder verloren: tiefere Suche ändert nichts
+        if abs(score) > WIN_BOUND:
+            break
+        # best move of this depth is searched first next time /
+        # bester Zug dieser Tiefe wird als nächstes zuerst durchsucht
+        moves.remove(best)
+        moves.insert(0, best)
+    _last_stats = searcher.stats()
+    return score, best, done
+
+
+# ---------------- root-parallel search / Wurzel-parallele Suche ----------------
+def _search_root_moves(game, moves, depth, time_left):
+    # runs in a worker process with its own table; None if the time ran out or /
+    # the pool was stopped / läuft in einem Worker-Prozess mit eigener Tabelle;
+    # None bei Zeitablauf oder wenn der Pool gestoppt wurde
+    deadline = None if time_left is None else time.perf_counter() + time_left
+    searcher = Searcher(deadline, get_table(), get_endgame(), morris_pool.worker_stop())
+    try:
+        return searcher.root(game, moves, depth)
+    except SearchTimeout:
+        return None
+
+
+def parallel_search(game, time_limit=None, depth=None, workers=None, rng=random, stop=None):
+    """Wurzel-parallele iterative Vertiefung: die Wurzelzüge werden auf die Worker
+    verteilt, jede Tiefe endet, wenn alle Worker fertig sind. stop beendet auch die
+    laufenden Aufgaben der Worker.
+    Ohne time_limit wird bis depth gesucht. Liefert (score, move, depth) wie iterative_deepening.
+    """
+    moves = _root_moves(game, rng)
+    if not moves:
+        return -WIN_SCORE, None, 0
+    # the pool keeps its size, fewer moves only mean fewer tasks /
+    # der Pool behält seine Größe, weniger Züge heißen nur weniger Aufgaben
+    executor = get_executor(worker_count(workers))
+    n = min(worker_count(workers), len(moves))
+    deadline = time.perf_counter() + time_limit if time_limit else None
+    score, best, done = 0, moves[0], 0
+    for d in range(1, (depth or MAX_DEPTH) + 1):
+        if stop is not None and stop.is_set():
+            break
+        time_left = None
+        if deadline is not None:
+            time_left = deadline - time.perf_counter()
+            if time_left <= 0:
+                break
+        # round robin, so every worker gets good and bad moves /
+        # reihum, damit jeder Worker gute und schlechte Züge bekommt
+        futures = [executor.submit(_search_root_moves, game, moves[i::n], d, time_left) for i in range(n)]
+        results = morris_pool.results(futures, stop)
+        if results is None or None in results:
+            break
+        score, best = max(results, key=lambda r: r[0])
+        done = d
+        if abs(score) > WIN_BOUND:
+            break
+        moves.remove(best)
+        moves.insert(0, best)
+    return score, best, done
+
+
+def choose_move(game, difficulty="Leicht", rng=random, depth=None, time_limit=None, workers=None, stop=None,
+                tt=None, playouts=None, tree=None):
+    """Wählt einen Zug (from, to, removed) für die Seite am Zug.
+    Leicht: zufällig; Mittel: Mühle > Blocken > zufällig;
+    Schwer: in den ersten Setzzügen das Eröffnungsbuch, sonst mit time_limit (Sekunden)
+    iterative Vertiefung bis zum Zeitbudget oder Alpha-Beta-Suche mit depth Halbzügen
+    (Standard SEARCH_DEPTH); mit mehr als einem Worker (workers, Standard
+    morris_pool.PARALLEL_WORKERS) wurzel-parallel über den Prozess-Pool.
+    stop (threading.Event) bricht die Suche ab; tt: eigene Transpositionstabelle
+    (Standard: die gemeinsame, nur im eigenen Prozess).
+    Monte Carlo: UCT-Suche (morris_mcts) mit playouts Playouts oder time_limit
+    (tree: eigener Suchbaum, Standard der des Prozesses).
+    """
+    if difficulty == "Monte Carlo":
+        return morris_mcts.choose_move(game, rng, playouts, time_limit, workers, stop, tree)
+    if difficulty == "Schwer":
+        # opening book first: no search needed / zuerst das Eröffnungsbuch: keine Suche nötig
+        if game.in_placement() and sum(game.stones_set) < morris_book.BOOK_PLIES:
+            move = get_book().probe(game)
+            if move is not None:
+                return move
+        if worker_count(workers) > 1:
+            return parallel_search(game, time_limit, depth or (None if time_limit else SEARCH_DEPTH), workers, rng, stop)[1]
+        if time_limit:
+            return iterative_deepening(game, time_limit, depth or MAX_DEPTH, rng, tt, stop)[1]
+        return search(game, depth or SEARCH_DEPTH, rng, tt, stop)[1]
+    moves = game.legal_moves()
+    if not moves:
+        return None
+    player = game.current_player
+    # (from, to) without removal choice, order kept /
+    # (from, to) ohne Entfernen-Auswahl, Reihenfolge bleibt erhalten
+    pairs = list(dict.fromkeys((f, t) for f, t, _ in moves))
+    if difficulty == "Leicht":
+        frm, to = rng.choice(pairs)
+    else:  # "Mittel"
+        # 1) instantly form mill, 2) block opponent, 3) random /
+        # 1) Sofort Mühle bilden, 2) Blocken, 3) zufällig
+        mills_now = [(f, t) for f, t in pairs if game.forms_mill(f, t)]
+        blocks = block_mask(game, player)
+        blocking = [(f, t) for f, t in pairs if blocks >> t & 1]
+        frm, to = rng.choice(mills_now or blocking or pairs)
+    removals = [r for f, t, r in moves if f == frm and t == to]
+    return (frm, to, rng.choice(removals))
+
+
+class ThinkHandle:
+    """Sucht mit choose_move in einem Hintergrund-Thread (auf einer Kopie des Spiels),
+    damit die Bildschleife weiterläuft: done() abfragen, result() holt den Zug,
+    cancel() bricht die Suche ab.
+    """
+
+    def __init__(self, game, difficulty="Leicht", **kwargs):
+        self.stop = threading.Event()
+        self.started = time.perf_counter()
+        self.move = None
+        self.error = None
+        self._thread = threading.Thread(target=self._run, args=(game.copy(), difficulty, kwargs), daemon=True)
+        self._thread.start()
+
+    def _run(self, game, difficulty, kwargs):
+        try:
+            self.move = choose_move(game, difficulty, stop=self.stop, **kwargs)
+        except SearchTimeout:
+            # cancelled fixed-depth search / abgebrochene Suche mit fester Tiefe
+            pass
+        except Exception as exc:
+            self.error = exc
+
+    def done(self):
+        return not self._thread.is_alive()
+
+    def elapsed(self):
+        """Sekunden seit dem Start der Suche."""
+        return time.perf_counter() - self.started
+
+    def result(self):
+        """Gefundener Zug (wartet, falls die Suche noch läuft)."""
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+        return self.move
+
+    def cancel(self, timeout=1.0):
+        """Bricht die Suche ab (mit mehreren Workern auch deren laufende Aufgaben) und
+        wartet kurz auf das Ende des Threads."""
+        self.stop.set()
+        self._thread.join(timeout)
+
+
+def predict_move(game, tt=None):
+    """Erwarteter Zug der Seite am Zug: bester Zug aus der Tabelle, sonst flache Suche."""
+    tt = tt or get_table()
+    key, sym = game.canonical_hash()
+    entry = tt.probe(key)
+    if entry is not None and entry[3] != NO_MOVE_CODE:
+        move = map_move(decode_move(entry[3]), SYMMETRIES[SYMMETRY_INVERSE[sym]])
+        if move in game.legal_moves():
+            return move
+    return search(game, 2, tt=tt)[1]
+
+
+class Ponder:
+    """Denkt in der Zugzeit des Gegners: sagt dessen Zug voraus und durchsucht die
+    Stellung danach im Hintergrund-Thread (bis stop()). Die Ergebnisse landen in der
+    gemeinsamen Transpositionstabelle und werden von der folgenden Suche genutzt.
+    Nur für die Suche im eigenen Prozess sinnvoll: die Worker der parallelen Suche
+    haben eigene Tabellen, time_left() gibt dort das volle Budget zurück.
+    """
+
+    def __init__(self, game):
+        self.stop_event = threading.Event()
+        self.started = time.perf_counter()
+        self.pondered = 0.0
+        self.key = None
+        self.depth = 0
+        self._thread = threading.Thread(target=self._run, args=(game.copy(),), daemon=True)
+        self._thread.start()
+
+    def _run(self, game):
+        move = predict_move(game)
+        if move is None:
+            return
+        game.apply(move)
+        self.key = game.hash
+        if game.result() is None and not self.stop_event.is_set():
+            self.depth = iterative_deepening(game, None, stop=self.stop_event)[2]
+
+    def stop(self):
+        """Beendet das Pondern (wartet auf den Thread, die Tabelle ist danach frei)."""
+        self.stop_event.set()
+        self._thread.join()
+        self.pondered = time.perf_counter() - self.started
+
+    def hit(self, game):
+        """True, wenn game die vorausgesagte Stellung ist."""
+        return self.key is not None and self.key == game.hash
+
+    def time_left(self, game, time_limit, workers=None):
+        """Bedenkzeit nach dem Pondern: bei einem Treffer zählt die geponderte Zeit
+        mit (mindestens PONDER_MIN_SHARE des Budgets), sonst und bei paralleler Suche
+        (workers wie bei choose_move) das volle Budget."""
+        if not time_limit or not self.hit(game) or worker_count(workers) > 1:
+            return time_limit
+        return max(time_limit * PONDER_MIN_SHARE, time_limit - self.pondered)
@@ -0,0 +1,124 @@
+"""
+Nine Men's Morris Game - batch evaluation with NumPy
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+
+Scores many positions at once (N x 24 boards) with matrix products against
+the 24 x 16 mill incidence and the 24 x 24 adjacency matrix; same result as
+morris_eval.evaluate. NumPy is optional: without it available() is False and
+the AI scores its root moves one by one.
+
+Bewertet viele Stellungen auf einmal (N x 24 Bretter) mit Matrixprodukten;
+gleiches Ergebnis wie morris_eval.evaluate. NumPy ist optional.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional / numpy ist optional
+    np = None
+
+import morris_eval
+from morris_board import ADJACENT, MILLS, POINTS
+from morris_game import STONES_PER_PLAYER
+
+if np is not None:
+    # point x mill: 1 if the point belongs to the mill /
+    # Punkt x Mühle: 1, wenn der Punkt zur Mühle gehört
+    MILL_INCIDENCE = np.zeros((POINTS, len(MILLS)), dtype=np.float32)
+    for _k, _mill in enumerate(MILLS):
+        MILL_INCIDENCE[list(_mill), _k] = 1
+    # point x point: 1 if connected by a line /
+    # Punkt x Punkt: 1, wenn durch eine Linie verbunden
+    ADJACENCY = np.zeros((POINTS, POINTS), dtype=np.float32)
+    for _i, _neighbours in enumerate(ADJACENT):
+        ADJACENCY[_i, list(_neighbours)] = 1
+    # both sides in one product (float32, so BLAS does the work): /
+    # [own | opp] (N x 48) -> [own lines | opp lines | own neighbours | opp neighbours] /
+    # beide Seiten in einem Produkt (float32, damit BLAS rechnet):
+    # [eigen | Gegner] (N x 48) -> [eigene Linien | Gegner-Linien | eigene Nachbarn | Gegner-Nachbarn]
+    _M = len(MILLS)
+    _FEATURES = np.zeros((2 * POINTS, 2 * _M + 2 * POINTS), dtype=np.float32)
+    _FEATURES[:POINTS, :_M] = MILL_INCIDENCE
+    _FEATURES[POINTS:, _M:2 * _M] = MILL_INCIDENCE
+    _FEATURES[:POINTS, 2 * _M:2 * _M + POINTS] = ADJACENCY
+    _FEATURES[POINTS:, 2 * _M + POINTS:] = ADJACENCY
+
+
+def available():
+    return np is not None
+
+
+def terms_batch(boards, player, hand_own, hand_opp):
+    """Bewertungsterme von N Stellungen aus Sicht von player als N x 8 int-Array, in der
+    Reihenfolge von morris_eval.WEIGHTS (Mühlen, offene Zweier, Mobilität, Steine; eigene,
+    dann gegnerische). boards: N x 24 (0 leer, 1 weiß, 2 schwarz); hand_own/hand_opp:
+    Steine in der Hand (Zahl oder Array der Länge N).
+    """
+    boards = np.asarray(boards)
+    own = boards == player
+    opp = boards == 3 - player
+    empty = ~(own | opp)
+    m = _M
+    f = np.concatenate((own, opp), axis=1).astype(np.float32) @ _FEATURES
+    # stones per mill line / Steine pro Mühlenlinie
+    own_lines = f[:, :m]
+    opp_lines = f[:, m:2 * m]
+    mills_own = (own_lines == 3).sum(axis=1)
+    mills_opp = (opp_lines == 3).sum(axis=1)
+    twos_own = ((own_lines == 2) & (opp_lines == 0)).sum(axis=1)
+    twos_opp = ((opp_lines == 2) & (own_lines == 0)).sum(axis=1)
+    # mobility: own neighbours of every empty point / Mobilität: eigene Nachbarn jedes freien Punktes
+    mob_own = (f[:, 2 * m:2 * m + POINTS] * empty).sum(axis=1).astype(np.int64)
+    mob_opp = (f[:, 2 * m + POINTS:] * empty).sum(axis=1).astype(np.int64)
+    n_own = own.sum(axis=1)
+    n_opp = opp.sum(axis=1)
+    n_empty = POINTS - n_own - n_opp
+    hand_own = np.broadcast_to(hand_own, n_own.shape)
+    hand_opp = np.broadcast_to(hand_opp, n_opp.shape)
+    # flying: every empty point is reachable / Springen: jeder freie Punkt ist erreichbar
+    mob_own = np.where((n_own == 3) & (hand_own == 0), n_empty, mob_own)
+    mob_opp = np.where((n_opp == 3) & (hand_opp == 0), n_empty, mob_opp)
+    return np.stack((mills_own, twos_own, mob_own, n_own + hand_own,
+                     mills_opp, twos_opp, mob_opp, n_opp + hand_opp), axis=1).astype(np.int64)
+
+
+def evaluate_batch(boards, player, hand_own, hand_opp, weights=None):
+    """Bewertet N Stellungen aus Sicht von player (Argumente wie terms_batch;
+    weights: Standard morris_eval.WEIGHTS). Liefert ein int-Array der Länge N.
+    """
+    w_mills, w_twos, w_mob, w_stones, o_mills, o_twos, o_mob, o_stones = weights or morris_eval.WEIGHTS
+    sign = np.array((w_mills, w_twos, w_mob, w_stones, -o_mills, -o_twos, -o_mob, -o_stones), dtype=np.int64)
+    return terms_batch(boards, player, hand_own, hand_opp) @ sign
+
+
+def child_boards(game, moves):
+    """Bretter (N x 24) nach jedem Zug (from, to, removed) und die Steine in der Hand
+    der ziehenden Seite danach."""
+    p = game.current_player
+    moves = np.asarray(moves)
+    frm, to, rem = moves[:, 0], moves[:, 1], moves[:, 2]
+    rows = np.arange(len(moves))
+    boards = np.repeat(np.asarray(game.state, dtype=np.int8)[None, :], len(moves), axis=0)
+    placed = frm < 0
+    boards[rows[~placed], frm[~placed]] = 0
+    boards[rows, to] = p
+    removed = rem >= 0
+    boards[rows[removed], rem[removed]] = 0
+    hand = STONES_PER_PLAYER - game.stones_set[p - 1] - placed
+    return boards, hand
+
+
+def order_moves(game, moves):
+    """Sortiert Züge nach der statischen Bewertung der Folgestellung (beste zuerst);
+    bei Gleichstand bleibt die Reihenfolge erhalten."""
+    if len(moves) < 2:
+        return list(moves)
+    p = game.current_player
+    boards, hand = child_boards(game, moves)
+    scores = evaluate_batch(boards, p, hand, game.in_hand(3 - p))
+    return [moves[i] for i in np.argsort(-scores, kind="stable")]
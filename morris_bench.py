@@ -0,0 +1,211 @@
+"""
+Nine Men's Morris Game - search benchmarks
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+
+Counts and times move generation from the start position (perft), counts
+nodes and first-move cutoffs of the search (move ordering), compares single
+and NumPy batch evaluation (also for ordering the root moves), and measures
+the speedup of the root-parallel search against one core:
+
+    python3 morris_bench.py perft --depth 5
+    python3 morris_bench.py search --depth 6
+    python3 morris_bench.py batch --sizes 16 64 1024
+    python3 morris_bench.py parallel --depth 6 --workers 2 4 8
+
+Zählt und misst die Zuggenerierung ab der Startstellung (perft), zählt Knoten und
+Abschnitte durch den ersten Zug der Suche (Zugsortierung), vergleicht einzelne
+und NumPy-Batch-Bewertung (auch beim Sortieren der Wurzelzüge) und misst den
+Geschwindigkeitsgewinn der wurzel-parallelen Suche gegenüber einem Kern.
+"""
+
+import argparse
+import os
+import random
+import time
+
+import morris_ai
+import morris_batch
+import morris_game
+import morris_pool
+
+# perft from the start position (same for both rulesets) /
+# perft ab der Startstellung (für beide Regelwerke gleich)
+PERFT_START = {1: 24, 2: 552, 3: 12144, 4: 255024, 5: 5140800, 6: 99274176}
+
+
+def sample_positions(count, plies=(6, 30), seed=1):
+    """Reproduzierbare Teststellungen aus zufälligen Partien (laufend, nicht entschieden)."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        game = morris_game.MorrisGame()
+        for _ in range(rng.randint(*plies)):
+            if game.result() is not None:
+                break
+            game.apply(rng.choice(game.legal_moves()))
+        if game.result() is None:
+            positions.append(game)
+    return positions
+
+
+def bench_perft(depth, ruleset="Entschärft", log=print):
+    """perft(1..depth) mit Zeit und Knoten pro Sekunde; prüft gegen PERFT_START.
+    Liefert False bei einer Abweichung."""
+    ok = True
+    for d in range(1, depth + 1):
+        start = time.perf_counter()
+        nodes = morris_game.perft(d, morris_game.MorrisGame(ruleset))
+        elapsed = time.perf_counter() - start
+        expected = PERFT_START.get(d)
+        check = ""
+        if expected is not None:
+            check = "ok" if nodes == expected else f"FALSCH, erwartet {expected}"
+            ok = ok and nodes == expected
+        log(f"  perft({d}) = {nodes:10d}  {elapsed:7.2f} s  {nodes / max(elapsed, 1e-9):10.0f} /s  {check}")
+    return ok
+
+
+def bench_search(positions, depth, log=print):
+    """Suche jeder Stellung bis depth (leere Tabelle, gleiche Wurzelreihenfolge): Knoten,
+    Zeit und Anteil der Beta-Abschnitte durch den ersten Zug. Liefert die Summen als dict."""
+    total = {"nodes": 0, "cutoffs": 0, "first_cutoffs": 0, "seconds": 0.0}
+    table = morris_ai.get_table()
+    for game in positions:
+        table.clear()
+        start = time.perf_counter()
+        morris_ai.search(game, depth, random.Random(0), table)
+        total["seconds"] += time.perf_counter() - start
+        for name in ("nodes", "cutoffs", "first_cutoffs"):
+            total[name] += morris_ai.search_stats()[name]
+    rate = total["first_cutoffs"] / max(total["cutoffs"], 1)
+    log(f"  Tiefe {depth}: {total['nodes']} Knoten  {total['seconds']:.2f} s  "
+        f"{total['nodes'] / max(total['seconds'], 1e-9):.0f} /s  erster Zug schneidet ab: {rate:.1%}")
+    return total
+
+
+def bench_batch(positions, sizes, repeat=5, log=print):
+    """Mikrosekunden pro Stellung: morris_ai.evaluate einzeln gegen evaluate_batch
+    mit Batches der Größen sizes (aus den Stellungen positions)."""
+    import numpy as np
+    boards = np.array([g.state for g in positions], dtype=np.int8)
+    hands = [np.array([g.in_hand(p) for g in positions]) for p in (1, 2)]
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for game in positions:
+            morris_ai.evaluate(game, 1)
+    single = (time.perf_counter() - start) / repeat / len(positions) * 1e6
+    log(f"  einzeln        {single:6.2f} us/Stellung")
+    for size in sizes:
+        size = min(size, len(positions))
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for i in range(0, len(positions) - size + 1, size):
+                morris_batch.evaluate_batch(boards[i:i + size], 1, hands[0][i:i + size], hands[1][i:i + size])
+        per = (time.perf_counter() - start) / repeat / (len(positions) // size * size) * 1e6
+        log(f"  Batch {size:5d}   {per:6.2f} us/Stellung   Faktor {single / per:5.2f}")
+
+
+def bench_order(positions, repeat=20, log=print):
+    """Mikrosekunden pro Sortierung der Wurzelzüge: apply/evaluate/undo je Zug gegen
+    morris_batch.order_moves, nach Anzahl der Züge gruppiert (siehe morris_ai.BATCH_ORDER_MIN)."""
+    times = {}
+    for game in positions:
+        moves = game.legal_moves()
+        if not moves:
+            continue
+        player = game.current_player
+        start = time.perf_counter()
+        for _ in range(repeat):
+            scores = {}
+            for move in moves:
+                game.apply(move)
+                scores[move] = morris_ai.evaluate(game, player)
+                game.undo()
+            sorted(moves, key=scores.__getitem__, reverse=True)
+        single = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(repeat):
+            morris_batch.order_moves(game, moves)
+        batch = time.perf_counter() - start
+        total = times.setdefault(len(moves) // 8 * 8, [0.0, 0.0, 0])
+        total[0] += single
+        total[1] += batch
+        total[2] += 1
+    for size in sorted(times):
+        single, batch, count = times[size]
+        log(f"  {size:3d}-{size + 7:3d} Züge  einzeln {single / count / repeat * 1e6:7.1f} us"
+            f"   Batch {batch / count / repeat * 1e6:7.1f} us   Faktor {single / batch:5.2f}")
+
+
+def bench_parallel(positions, depth, worker_counts, log=print):
+    """Suchzeit bis depth für jede Worker-Anzahl; Basis ist die Suche im eigenen Prozess.
+    Tabellen werden vor jedem Lauf geleert (neue Worker-Prozesse), damit kein Lauf vom
+    vorherigen profitiert. Liefert {workers: Sekunden}, 1 = ein Kern ohne Pool.
+    """
+    times = {}
+    morris_ai.get_table().clear()
+    start = time.perf_counter()
+    for game in positions:
+        morris_ai.iterative_deepening(game, None, depth, random.Random(0))
+    times[1] = time.perf_counter() - start
+    log(f"  1 Kern     {times[1]:8.2f} s")
+    for n in worker_counts:
+        if n <= 1:
+            continue
+        morris_pool.shutdown_executor()
+        morris_pool.start_workers(n)
+        start = time.perf_counter()
+        for game in positions:
+            morris_ai.parallel_search(game, depth=depth, workers=n, rng=random.Random(0))
+        times[n] = time.perf_counter() - start
+        log(f"  {n:2d} Worker  {times[n]:8.2f} s   Speedup {times[1] / times[n]:5.2f}")
+    morris_pool.shutdown_executor()
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks der Mühle-KI")
+    sub = parser.add_subparsers(dest="command", required=True)
+    prf = sub.add_parser("perft", help="Zuggenerierung ab der Startstellung zählen und messen")
+    prf.add_argument("--depth", type=int, default=5, help="Tiefe in Halbzügen")
+    prf.add_argument("--ruleset", default="Entschärft", choices=["Entschärft", "Turnier"])
+    sea = sub.add_parser("search", help="Knoten und Abschnitte der Suche (Zugsortierung)")
+    sea.add_argument("--depth", type=int, default=6, help="Suchtiefe in Halbzügen")
+    sea.add_argument("--positions", type=int, default=20, help="Anzahl Teststellungen")
+    sea.add_argument("--seed", type=int, default=1)
+    bat = sub.add_parser("batch", help="NumPy-Batch-Bewertung gegen einzelne Bewertung")
+    bat.add_argument("--positions", type=int, default=2048, help="Anzahl Teststellungen")
+    bat.add_argument("--sizes", type=int, nargs="+", default=[16, 64, 256, 1024], help="Batch-Größen")
+    bat.add_argument("--seed", type=int, default=1)
+    par = sub.add_parser("parallel", help="wurzel-parallele Suche gegen einen Kern")
+    par.add_argument("--depth", type=int, default=6, help="Suchtiefe in Halbzügen")
+    par.add_argument("--positions", type=int, default=20, help="Anzahl Teststellungen")
+    par.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8], help="Worker-Anzahlen")
+    par.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.command == "perft":
+        if not bench_perft(args.depth, args.ruleset):
+            raise SystemExit(1)
+    elif args.command == "search":
+        bench_search(sample_positions(args.positions, seed=args.seed), args.depth)
+    elif args.command == "batch":
+        if not morris_batch.available():
+            raise SystemExit("NumPy ist nicht installiert")
+        positions = sample_positions(args.positions, seed=args.seed)
+        bench_batch(positions, args.sizes)
+        print("Sortierung der Wurzelzüge")
+        bench_order(positions[:400])
+    elif args.command == "parallel":
+        print(f"{os.cpu_count()} Kerne, {args.positions} Stellungen, Tiefe {args.depth}")
+        bench_parallel(sample_positions(args.positions, seed=args.seed), args.depth, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Nine Men's Morris Game - bitboard core
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+"""
+
+# every side is stored as a 24 bit integer, bit i = point i /
+# jede Seite wird als 24-Bit-Ganzzahl gespeichert, Bit i = Punkt i
+#
+#  0-----------1-----------2
+#  |           |           |
+#  |   8-------9------10   |
+#  |   |       |       |   |
+#  |   |  16--17--18   |   |
+#  |   |   |       |   |   |
+#  7--15--23      19--11---3
+#  |   |   |       |   |   |
+#  |   |  22--21--20   |   |
+#  |   |       |       |   |
+#  |  14------13------12   |
+#  |           |           |
+#  6-----------5-----------4
+
+POINTS = 24
+FULL = (1 << POINTS) - 1
+
+# connections between points (same as the drawn lines) /
+# Verbindungen zwischen Punkten (wie die gezeichneten Linien)
+LINES = (
+    (0,1),(1,2),(2,3),(3,4),(4,5),(5,6),(6,7),(7,0),
+    (8,9),(9,10),(10,11),(11,12),(12,13),(13,14),(14,15),(15,8),
+    (16,17),(17,18),(18,19),(19,20),(20,21),(21,22),(22,23),(23,16),
+    (1,9),(3,11),(5,13),(7,15),
+    (9,17),(11,19),(13,21),(15,23)
+)
+
+# all 16 mills; corners are no mill connections /
+# alle 16 Mühlen; Eckpunkte sind keine Mühlenverbindungen
+MILLS = (
+    (0,1,2), (2,3,4), (4,5,6), (6,7,0),
+    (8,9,10), (10,11,12), (12,13,14), (14,15,8),
+    (16,17,18), (18,19,20), (20,21,22), (22,23,16),
+    (1,9,17), (3,11,19), (5,13,21), (7,15,23)
+)
+
+MILL_MASKS = tuple((1 << a) | (1 << b) | (1 << c) for a, b, c in MILLS)
+
+# neighbours of each point as bit mask /
+# Nachbarn jedes Punktes als Bitmaske
+ADJ_MASK = tuple(
+    sum(1 << (b if a == i else a) for a, b in LINES if i in (a, b))
+    for i in range(POINTS)
+)
+
+# neighbours of each point as index tuple (no bit scan needed) /
+# Nachbarn jedes Punktes als Index-Tupel (ohne Bit-Suche)
+ADJACENT = tuple(
+    tuple(sorted(b if a == i else a for a, b in LINES if i in (a, b)))
+    for i in range(POINTS)
+)
+
+# indices into MILLS of the two mills each point belongs to /
+# Indizes (in MILLS) der beiden Mühlen, zu denen jeder Punkt gehört
+POINT_MILLS = tuple(
+    tuple(k for k, mill in enumerate(MILLS) if i in mill)
+    for i in range(POINTS)
+)
+
+# the two mills running through each point /
+# die beiden Mühlen, die durch jeden Punkt laufen
+POINT_MILL_MASKS = tuple(
+    tuple(MILL_MASKS[k] for k in POINT_MILLS[i])
+    for i in range(POINTS)
+)
+
+# the other two points of both mills through each point: a stone on i closes a mill /
+# if own covers one of the two masks /
+# die beiden anderen Punkte beider Mühlen durch jeden Punkt: ein Stein auf i schließt
+# eine Mühle, wenn own eine der beiden Masken abdeckt
+MILL_PARTNERS = tuple(
+    tuple(m & ~(1 << i) for m in POINT_MILL_MASKS[i])
+    for i in range(POINTS)
+)
+
+# set bits of every byte as point indices, one table per ring (byte) /
+# gesetzte Bits jedes Bytes als Punktindizes, eine Tabelle pro Ring (Byte)
+_BYTE_POINTS = tuple(
+    tuple(tuple(r * 8 + k for k in range(8) if byte >> k & 1) for byte in range(256))
+    for r in range(3)
+)
+
+
+# the 16 board symmetries as point permutations: 4 rotations x mirror x inner/outer /
+# ring swap. Point r*8+k lies on ring r (0 outer, 1 middle, 2 inner) at position k /
+# (0 top left, clockwise); SYMMETRIES[s][i] is the image of point i /
+# die 16 Brettsymmetrien als Punktpermutationen: 4 Drehungen x Spiegelung x Tausch
+# von Innen-/Außenring. Punkt r*8+k liegt auf Ring r (0 außen, 1 Mitte, 2 innen) an
+# Position k (0 links oben, im Uhrzeigersinn); SYMMETRIES[s][i] ist das Bild von Punkt i
+def _symmetry(rot, mirror, swap):
+    perm = []
+    for i in range(POINTS):
+        r, k = divmod(i, 8)
+        if mirror:
+            k = (2 - k) % 8
+        k = (k + 2 * rot) % 8
+        if swap:
+            r = 2 - r
+        perm.append(r * 8 + k)
+    return tuple(perm)
+
+
+SYMMETRIES = tuple(
+    _symmetry(rot, mirror, swap)
+    for swap in (0, 1) for mirror in (0, 1) for rot in range(4)
+)
+
+# index of the inverse symmetry / Index der inversen Symmetrie
+SYMMETRY_INVERSE = tuple(
+    next(t for t, q in enumerate(SYMMETRIES) if all(q[p[i]] == i for i in range(POINTS)))
+    for p in SYMMETRIES
+)
+
+# every ring is one byte of the mask, so a symmetry maps each byte through a /
+# 256 entry table: SYM_BYTE_TABLES[s][ring][byte] /
+# jeder Ring ist ein Byte der Maske, eine Symmetrie bildet daher jedes Byte über
+# eine Tabelle mit 256 Einträgen ab: SYM_BYTE_TABLES[s][Ring][Byte]
+SYM_BYTE_TABLES = tuple(
+    tuple(
+        tuple(
+            sum(1 << perm[ring * 8 + j] for j in range(8) if v >> j & 1)
+            for v in range(256)
+        )
+        for ring in range(3)
+    )
+    for perm in SYMMETRIES
+)
+
+
+def transform(mask, sym):
+    """Wendet Symmetrie sym (Index in SYMMETRIES) auf eine Bitmaske an."""
+    t0, t1, t2 = SYM_BYTE_TABLES[sym]
+    return t0[mask & 255] | t1[mask >> 8 & 255] | t2[mask >> 16]
+
+
+def canonical(white, black):
+    """Kanonische Form einer Stellung unter den 16 Symmetrien.
+    Liefert (white, black, sym) mit dem kleinsten Wert white | black << 24.
+    """
+    w0, w1, w2 = white & 255, white >> 8 & 255, white >> 16
+    b0, b1, b2 = black & 255, black >> 8 & 255, black >> 16
+    best = None
+    best_sym = 0
+    for sym, (t0, t1, t2) in enumerate(SYM_BYTE_TABLES):
+        key = t0[w0] | t1[w1] | t2[w2] | (t0[b0] | t1[b1] | t2[b2]) << 24
+        if best is None or key < best:
+            best = key
+            best_sym = sym
+    return best & FULL, best >> 24, best_sym
+
+
+try:
+    popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def popcount(x):
+        return bin(x).count("1")
+
+
+def iter_bits(mask):
+    """Indizes aller gesetzten Bits (aufsteigend) als Tupel, über die Byte-Tabellen."""
+    return _BYTE_POINTS[0][mask & 255] + _BYTE_POINTS[1][mask >> 8 & 255] + _BYTE_POINTS[2][mask >> 16 & 255]
+
+
+def from_state(state):
+    """Wandelt die 24er-Liste (0/1/2) in Bitboards [0, weiß, schwarz] um."""
+    bits = [0, 0, 0]
+    for i, v in enumerate(state):
+        if v:
+            bits[v] |= 1 << i
+    return bits
+
+
+def to_state(bits):
+    """Wandelt Bitboards [0, weiß, schwarz] zurück in die 24er-Liste."""
+    w, b = bits[1], bits[2]
+    return [1 if w >> i & 1 else (2 if b >> i & 1 else 0) for i in range(POINTS)]
+
+
+def forms_mill(own, pos):
+    """True, wenn ein Stein auf pos zusammen mit own eine Mühle bildet
+    (ob pos selbst in own enthalten ist, spielt keine Rolle)."""
+    a, b = MILL_PARTNERS[pos]
+    return own & a == a or own & b == b
+
+
+# same check, named for removal rules /
+# gleiche Prüfung, benannt für die Entfernen-Regel
+in_mill = forms_mill
+
+
+def mill_count(own):
+    return sum(1 for m in MILL_MASKS if own & m == m)
+
+
+def open_twos(own, opp):
+    # two own stones and the third point empty /
+    # zwei eigene Steine und der dritte Punkt frei
+    c = 0
+    for m in MILL_MASKS:
+        if not opp & m and popcount(own & m) == 2:
+            c += 1
+    return c
+
+
+def stones_in_mills(own):
+    mask = 0
+    for m in MILL_MASKS:
+        if own & m == m:
+            mask |= m
+    return mask
+
+
+def removable(opp):
+    """Entfernbare gegnerische Steine: nicht aus Mühlen, außer alle stehen in Mühlen."""
+    free = opp & ~stones_in_mills(opp)
+    return free if free else opp
+
+
+# bit-parallel neighbours: every ring is one byte, so ring neighbours are a rotation /
+# inside each byte; spokes join the odd positions of neighbouring rings /
+# bitparallele Nachbarn: jeder Ring ist ein Byte, Ringnachbarn sind also eine Rotation
+# innerhalb jedes Bytes; Speichen verbinden die ungeraden Positionen benachbarter Ringe
+_SPOKES = 0x00AAAA
+
+
+def mobility(own, empty, flying=False):
+    """Anzahl möglicher Zielfelder (Stein, Ziel) für own, ohne Schleife über die Steine."""
+    if flying:
+        return popcount(empty)
+    return (popcount(own & (((empty << 1) & 0xFEFEFE) | ((empty >> 7) & 0x010101)))
+            + popcount(own & (((empty >> 1) & 0x7F7F7F) | ((empty << 7) & 0x808080)))
+            + popcount(own & (empty << 8) & (_SPOKES << 8))
+            + popcount(own & (empty >> 8) & _SPOKES))
+
+
+def has_moves(own, empty, flying=False, forbidden=(-1, -1)):
+    """True, wenn own mindestens einen Zug hat.
+    forbidden = (from, to) des letzten eigenen Zuges; das sofortige Zurückziehen
+    (to -> from) ist dann verboten (Anti-Pendeln).
+    """
+    lm_from, lm_to = forbidden
+    if flying:
+        count = popcount(own) * popcount(empty)
+        if lm_to >= 0 and own >> lm_to & 1 and empty >> lm_from & 1:
+            count -= 1
+        return count > 0
+    for s in iter_bits(own):
+        targets = ADJ_MASK[s] & empty
+        if s == lm_to and lm_from >= 0:
+            targets &= ~(1 << lm_from)
+        if targets:
+            return True
+    return False
@@ -0,0 +1,136 @@
+"""
+Nine Men's Morris Game - opening book for the setting phase
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+
+Maps canonical positions of the first placements to the best move found
+by a deep search. Build or extend the book by self-play:
+
+    python3 morris_book.py --plies 8 --games 200 --time 2
+
+Ordnet kanonischen Stellungen der ersten Setzzüge den besten Zug einer
+tiefen Suche zu. Das Buch wird durch Selbstspiel gebaut oder erweitert.
+"""
+
+import argparse
+import os
+import random
+import struct
+import time
+
+import morris_ai
+import morris_game
+from morris_board import SYMMETRIES, SYMMETRY_INVERSE
+
+BOOK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "opening_book.bin")
+
+# book is probed during the first BOOK_PLIES placements (both sides together) /
+# das Buch wird in den ersten BOOK_PLIES Setzzügen (beide Seiten zusammen) abgefragt
+BOOK_PLIES = 8
+
+# file: magic, version, count; then per entry canonical hash and move /
+# (from + 1, to, removed + 1), sorted by hash /
+# Datei: Magic, Version, Anzahl; dann je Eintrag kanonischer Hash und Zug
+# (from + 1, to, removed + 1), nach Hash sortiert
+MAGIC = b"MILLBOOK"
+VERSION = 1
+_HEADER = struct.Struct("<8sHI")
+_ENTRY = struct.Struct("<QBBB")
+
+
+class OpeningBook:
+    """Eröffnungsbuch: kanonischer Hash -> bester Zug (in kanonischer Ausrichtung)."""
+
+    def __init__(self):
+        self.moves = {}
+
+    def __len__(self):
+        return len(self.moves)
+
+    def probe(self, game):
+        """Buchzug für die Stellung oder None (nur legale Züge werden geliefert)."""
+        key, sym = game.canonical_hash()
+        move = self.moves.get(key)
+        if move is None:
+            return None
+        move = morris_ai.map_move(move, SYMMETRIES[SYMMETRY_INVERSE[sym]])
+        return move if move in game.legal_moves() else None
+
+    def add(self, game, move):
+        key, sym = game.canonical_hash()
+        self.moves[key] = morris_ai.map_move(move, SYMMETRIES[sym])
+
+    def save(self, path=None):
+        path = path or BOOK_FILE
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(self.moves)))
+            for key in sorted(self.moves):
+                frm, to, rem = self.moves[key]
+                f.write(_ENTRY.pack(key, frm + 1, to, rem + 1))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=None):
+        """Lädt das Buch (ohne Datei: leeres Buch)."""
+        path = path or BOOK_FILE
+        book = cls()
+        if not os.path.exists(path):
+            return book
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: kein Eröffnungsbuch (Version {VERSION})")
+        for key, frm, to, rem in _ENTRY.iter_unpack(data[_HEADER.size:_HEADER.size + count * _ENTRY.size]):
+            book.moves[key] = (frm - 1, to, rem - 1)
+        return book
+
+
+def build(book, plies=BOOK_PLIES, games=100, time_limit=2.0, explore=0.3, rng=random, log=print):
+    """Selbstspiel: jede Stellung der ersten plies Setzzüge wird gesucht und eingetragen.
+    Mit Wahrscheinlichkeit explore spielt eine Seite statt des besten Zuges einen
+    zufälligen, damit das Buch auch Abweichungen abdeckt.
+    """
+    start = time.time()
+    for n in range(games):
+        game = morris_game.MorrisGame()
+        for _ in range(plies):
+            move = book.probe(game)
+            if move is None:
+                move = morris_ai.iterative_deepening(game, time_limit, rng=rng)[1]
+                book.add(game, move)
+            if rng.random() < explore:
+                move = rng.choice(game.legal_moves())
+            game.apply(move)
+        log(f"  Partie {n + 1}/{games}: {len(book)} Stellungen ({time.time() - start:.0f} s)")
+    return book
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Eröffnungsbuch für Mühle durch Selbstspiel bauen/erweitern")
+    parser.add_argument("--plies", type=int, default=BOOK_PLIES, help="Setzzüge pro Partie (beide Seiten)")
+    parser.add_argument("--games", type=int, default=100, help="Anzahl Selbstspiel-Partien")
+    parser.add_argument("--time", type=float, default=2.0, help="Suchzeit pro neuer Stellung in Sekunden")
+    parser.add_argument("--explore", type=float, default=0.3, help="Anteil zufälliger Abweichungen")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--out", default=BOOK_FILE, help="Buchdatei (wird erweitert, falls vorhanden)")
+    args = parser.parse_args()
+    book = OpeningBook.load(args.out)
+    print(f"{args.out}: {len(book)} Stellungen vorhanden")
+    try:
+        build(book, args.plies, args.games, args.time, args.explore, random.Random(args.seed))
+    except KeyboardInterrupt:
+        # keep what was found so far / bisher Gefundenes behalten
+        print("abgebrochen")
+    book.save(args.out)
+    print(f"{args.out}: {len(book)} Stellungen gespeichert")
+
+
+if __name__ == "__main__":
+    main()
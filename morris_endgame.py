@@ -0,0 +1,581 @@
+"""
+Nine Men's Morris Game - endgame database (retrograde analysis)
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+
+Solves the moving/flying phase (all stones placed, rules "Entschärft")
+per subspace (stones of side to move, stones of opponent) and writes
+one memory-mapped file (see file layout below). Build:
+
+    python3 morris_endgame.py 3v3 3v4 4v3 4v4
+
+Löst die Zug-/Springphase (alle Steine gesetzt, Regeln "Entschärft")
+je Teilraum (Steine der Seite am Zug, Steine des Gegners) und schreibt
+eine per mmap eingeblendete Datei (Aufbau siehe unten).
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from math import comb
+
+import morris_board
+from morris_board import FULL, ADJ_MASK, POINTS, SYMMETRIES, SYM_BYTE_TABLES, iter_bits, popcount
+
+ENDGAME_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "endgame")
+
+# largest subspaces that can be built / größte baubare Teilräume
+MAX_STONES = 4
+
+# result byte per position: 0 = draw, else distance-to-result + 1; /
+# wins have odd distances (even byte), losses even distances (odd byte) /
+# Ergebnis-Byte pro Stellung: 0 = Remis, sonst Distanz bis zum Ergebnis + 1;
+# Siege haben ungerade Distanzen (gerades Byte), Niederlagen gerade (ungerades Byte)
+DRAW = 0
+WIN = 1
+LOSS = 2
+
+
+# file layout (little endian) / Dateiaufbau (Little Endian):
+#   header: magic, version, number of subspaces /
+#           Magic, Version, Anzahl Teilräume
+#   per subspace: a, b, positions, canonical opponent masks, own ranks, offsets of the /
+#                 index, WLD and distance sections (distance 0 = not stored) /
+#   je Teilraum:  a, b, Stellungen, kanonische Gegnermasken, eigene Ränge, Offsets des
+#                 Index-, WLD- und Distanz-Abschnitts (Distanz 0 = nicht gespeichert)
+#   index section: per canonical opponent mask (ascending) opp, first position, first /
+#                  and number of own ranks (uint32 each), then all own ranks (uint16), /
+#                  see CanonicalIndex /
+#   Index-Abschnitt: je kanonischer Gegnermaske (aufsteigend) opp, erste Stellung, erster
+#                  und Anzahl eigener Ränge (je uint32), danach alle eigenen Ränge (uint16),
+#                  siehe CanonicalIndex
+#   WLD section: 2 bit per position (0 draw, 1 win, 2 loss), 4 per byte, /
+#                position i in bits 2*(i%4) of byte i//4 /
+#   WLD-Abschnitt: 2 Bit pro Stellung (0 Remis, 1 Sieg, 2 Niederlage), 4 pro Byte,
+#                Stellung i in Bits 2*(i%4) von Byte i//4
+#   distance section: one result byte per position (see encode) /
+#   Distanz-Abschnitt: ein Ergebnis-Byte pro Stellung (siehe encode)
+# position i is CanonicalIndex.index() of the canonical position: only canonical positions /
+# (about 1 in 16) are stored / Stellung i ist CanonicalIndex.index() der kanonischen Stellung:
+# nur kanonische Stellungen (etwa jede 16.) werden gespeichert
+DB_FILENAME = "mill_endgame.db"
+MAGIC = b"MILLEGDB"
+VERSION = 2
+_HEADER = struct.Struct("<8sHH")
+_ENTRY = struct.Struct("<BBxxIIIQQQ")
+_OPP_RECORD = struct.Struct("<IIII")
+
+# result byte -> WLD code / Ergebnis-Byte -> WLD-Code
+_WLD_CODES = bytes(DRAW if not v else (WIN if (v - 1) & 1 else LOSS) for v in range(256))
+
+
+def _pack_wld(table):
+    codes = bytes(table).translate(_WLD_CODES)
+    codes += bytes(-len(codes) % 4)
+    # every code is < 4, so shifting whole byte strings as big ints packs 4 per byte /
+    # jeder Code ist < 4, daher packt das Schieben ganzer Byte-Folgen als Ganzzahl 4 pro Byte
+    n = len(codes) // 4
+    packed = 0
+    for k in range(4):
+        packed |= int.from_bytes(codes[k::4], "little") << (2 * k)
+    return packed.to_bytes(n, "little")
+
+
+def encode(result, distance):
+    """Ergebnis-Byte zu (result, distance); sehr lange Distanzen werden gekappt, ohne die
+    Parität zu ändern, aus der decode Gewinn und Verlust liest."""
+    if result == DRAW:
+        return 0
+    # wins have odd distances, losses even ones / Gewinne haben ungerade Distanzen, Verluste gerade
+    return min(distance, 253 if result == WIN else 254) + 1
+
+
+def decode(v):
+    """Liefert (result, distance) zu einem Ergebnis-Byte."""
+    if not v:
+        return DRAW, 0
+    d = v - 1
+    return (WIN if d & 1 else LOSS), d
+
+
+def subspace_size(a, b):
+    return comb(POINTS, a) * comb(POINTS - a, b)
+
+
+def _rank_within(own, opp):
+    """Rang von own unter den von opp freien Punkten (kombinatorisches Zahlensystem)."""
+    r = 0
+    k = 1
+    for p in iter_bits(own):
+        # position among the points not used by opp / Position unter den von opp freien Punkten
+        r += comb(p - popcount(opp & ((1 << p) - 1)), k)
+        k += 1
+    return r
+
+
+def _masks(n, within=FULL):
+    """Alle Masken mit n gesetzten Bits innerhalb von within."""
+    points = list(iter_bits(within))
+
+    def rec(start, left, mask):
+        if not left:
+            yield mask
+            return
+        for i in range(start, len(points) - left + 1):
+            yield from rec(i + 1, left - 1, mask | (1 << points[i]))
+    return rec(0, n, 0)
+
+
+def _successors(own, opp):
+    """Züge der Seite own als Liste (neues own, neues opp); Entfernen inklusive."""
+    empty = FULL & ~(own | opp)
+    flying = popcount(own) == 3
+    removable = None
+    out = []
+    for frm in iter_bits(own):
+        after = own & ~(1 << frm)
+        for to in iter_bits(empty if flying else ADJ_MASK[frm] & empty):
+            new_own = after | (1 << to)
+            if morris_board.forms_mill(new_own, to):
+                if removable is None:
+                    removable = list(iter_bits(morris_board.removable(opp)))
+                for r in removable:
+                    out.append((new_own, opp & ~(1 << r)))
+            else:
+                out.append((new_own, opp))
+    return out
+
+
+def _predecessors(own, opp):
+    """Stellungen (Seite am Zug, Gegner), aus denen der Gegner von own durch
+    einen Zug ohne Mühle nach (own am Zug, opp) gekommen ist."""
+    empty = FULL & ~(own | opp)
+    flying = popcount(opp) == 3
+    out = []
+    for to in iter_bits(opp):
+        # a move closing a mill would have removed a stone / Zug mit Mühle hätte geschlagen
+        if morris_board.forms_mill(opp, to):
+            continue
+        before = opp & ~(1 << to)
+        for frm in iter_bits(empty if flying else ADJ_MASK[to] & empty):
+            out.append((before | (1 << frm), own))
+    return out
+
+
+class CanonicalIndex:
+    """Rang der kanonischen Stellungen (own am Zug, a Steine; opp mit b Steinen) eines
+    Teilraums in 0 .. size - 1. Kanonische Gegnermasken sind aufsteigend sortiert (opps) und
+    belegen ab bases[k] einen Block: hat opp keine Symmetrie außer der Identität, ist jede
+    Verteilung von own kanonisch und der Rang unter den freien Punkten der Platz im Block;
+    sonst steht der Platz in der sortierten Liste ranks[k] der kanonischen Ränge.
+    """
+
+    def __init__(self, a, b, opps, bases, ranks, size):
+        self.a, self.b = a, b
+        self.opps = opps
+        self.bases = bases
+        self.ranks = ranks  # per opp: None (all own masks) or array('H') / je opp: None (alle) oder array('H')
+        self.size = size
+
+    @classmethod
+    def build(cls, a, b, canon=None):
+        canon = canon or _Canonicaliser()
+        free = comb(POINTS - b, a)
+        blocks = []
+        for opp in _masks(b):
+            c_opp, tables = canon._opp(opp)
+            if c_opp != opp:
+                continue
+            if len(tables) == 1:
+                blocks.append((opp, None))
+            else:
+                blocks.append((opp, array("H", sorted(
+                    _rank_within(own, opp) for own in _masks(a, FULL & ~opp)
+                    if canon.key(own, opp) & FULL == own))))
+        blocks.sort(key=lambda block: block[0])
+        bases = []
+        size = 0
+        for _, ranks in blocks:
+            bases.append(size)
+            size += free if ranks is None else len(ranks)
+        return cls(a, b, [opp for opp, _ in blocks], bases, [ranks for _, ranks in blocks], size)
+
+    def index(self, own, opp):
+        """Rang der kanonischen Stellung (own, opp), wie von morris_board.canonical geliefert."""
+        k = bisect_left(self.opps, opp)
+        r = _rank_within(own, opp)
+        ranks = self.ranks[k]
+        return self.bases[k] + (r if ranks is None else bisect_left(ranks, r))
+
+    def to_bytes(self):
+        records = []
+        flat = array("H")
+        for opp, base, ranks in zip(self.opps, self.bases, self.ranks):
+            records.append(_OPP_RECORD.pack(opp, base, len(flat), 0 if ranks is None else len(ranks)))
+            if ranks is not None:
+                flat.extend(ranks)
+        if sys.byteorder == "big":
+            flat.byteswap()
+        return b"".join(records) + flat.tobytes()
+
+    @classmethod
+    def from_buffer(cls, a, b, buf, offset, n_opps, n_ranks):
+        flat = array("H")
+        start = offset + n_opps * _OPP_RECORD.size
+        flat.frombytes(buf[start:start + 2 * n_ranks])
+        if sys.byteorder == "big":
+            flat.byteswap()
+        opps, bases, ranks = [], [], []
+        for k in range(n_opps):
+            opp, base, first, count = _OPP_RECORD.unpack_from(buf, offset + k * _OPP_RECORD.size)
+            opps.append(opp)
+            bases.append(base)
+            ranks.append(flat[first:first + count] if count else None)
+        size = 0
+        if opps:
+            size = bases[-1] + (comb(POINTS - b, a) if ranks[-1] is None else len(ranks[-1]))
+        return cls(a, b, opps, bases, ranks, size)
+
+
+class EndgameDB:
+    """Endspiel-Datenbank: eine Datei, per mmap eingeblendet (nicht in den Python-Heap geladen),
+    plus frisch gelöste Teilräume im Speicher (nur beim Bauen).
+    Nur kanonische Stellungen werden gespeichert (CanonicalIndex).
+    """
+
+    def __init__(self):
+        self.tables = {}  # (a, b) -> result bytes in memory / Ergebnis-Bytes im Speicher
+        self.sections = {}  # (a, b) -> (positions, wld_offset, dist_offset) in the file / in der Datei
+        self.indexes = {}  # (a, b) -> CanonicalIndex
+        self.mm = None
+        self._file = None
+
+    def has(self, a, b):
+        return (a, b) in self.tables or (a, b) in self.sections
+
+    def subspaces(self):
+        return sorted(set(self.tables) | set(self.sections))
+
+    def lookup(self, own, opp):
+        """(result, distance) für own am Zug oder None, wenn der Teilraum fehlt.
+        distance ist None, wenn die Datei ohne Distanzen gebaut wurde."""
+        a, b = popcount(own), popcount(opp)
+        table = self.tables.get((a, b))
+        if table is None:
+            section = self.sections.get((a, b))
+            if section is None:
+                return None
+        cown, copp, _ = morris_board.canonical(own, opp)
+        i = self.indexes[(a, b)].index(cown, copp)
+        if table is not None:
+            return decode(table[i])
+        _, wld_offset, dist_offset = section
+        if dist_offset:
+            return decode(self.mm[dist_offset + i])
+        # 2 bit per position, 4 per byte / 2 Bit pro Stellung, 4 pro Byte
+        return self.mm[wld_offset + (i >> 2)] >> ((i & 3) << 1) & 3, None
+
+    def result_bytes(self, a, b):
+        """Ergebnis-Bytes eines Teilraums (Kopie aus der Datei oder aus dem Speicher)."""
+        table = self.tables.get((a, b))
+        if table is not None:
+            return table
+        positions, _, dist_offset = self.sections[(a, b)]
+        if not dist_offset:
+            raise ValueError(f"{a}v{b}: Datei enthält keine Distanzen")
+        return bytearray(self.mm[dist_offset:dist_offset + positions])
+
+    # ---------------- file / Datei ----------------
+    @staticmethod
+    def filename(directory=None):
+        return os.path.join(directory or ENDGAME_DIR, DB_FILENAME)
+
+    def save(self, directory=None, distances=True):
+        """Schreibt alle Teilräume in eine Datei (Header, WLD- und Distanz-Abschnitte)."""
+        path = self.filename(directory)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        subs = self.subspaces()
+        data = {sub: self.result_bytes(*sub) for sub in subs}
+        indexes = {sub: self.indexes[sub] for sub in subs}
+        self.close()
+        offset = _HEADER.size + _ENTRY.size * len(subs)
+        entries = []
+        for sub in subs:
+            positions = len(data[sub])
+            index_data = indexes[sub].to_bytes()
+            index_offset = offset
+            offset += len(index_data)
+            wld_offset = offset
+            offset += (positions + 3) >> 2
+            dist_offset = 0
+            if distances:
+                dist_offset = offset
+                offset += positions
+            entries.append((sub, positions, index_data, index_offset, wld_offset, dist_offset))
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(subs)))
+            for (a, b), positions, index_data, index_offset, wld_offset, dist_offset in entries:
+                index = indexes[(a, b)]
+                f.write(_ENTRY.pack(a, b, positions, len(index.opps), sum(len(r) for r in index.ranks if r),
+                                    index_offset, wld_offset, dist_offset))
+            for sub, positions, index_data, index_offset, wld_offset, dist_offset in entries:
+                f.write(index_data)
+                f.write(_pack_wld(data[sub]))
+                if dist_offset:
+                    f.write(data[sub])
+        os.replace(tmp, path)
+        self.tables = {}
+        self._open(path)
+
+    @classmethod
+    def load(cls, directory=None):
+        """Blendet die Datenbankdatei per mmap ein (ohne Datei: leere Datenbank)."""
+        db = cls()
+        path = cls.filename(directory)
+        if os.path.exists(path):
+            db._open(path)
+        return db
+
+    def _open(self, path):
+        self._file = open(path, "rb")
+        try:
+            self.mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, count = _HEADER.unpack_from(self.mm, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path}: keine Endspiel-Datenbank (Version {VERSION})")
+            for n in range(count):
+                a, b, positions, n_opps, n_ranks, index_offset, wld_offset, dist_offset = _ENTRY.unpack_from(
+                    self.mm, _HEADER.size + n * _ENTRY.size)
+                index = CanonicalIndex.from_buffer(a, b, self.mm, index_offset, n_opps, n_ranks)
+                if index.size != positions:
+                    raise ValueError(f"{path}: Teilraum {a}v{b} hat falsche Größe")
+                self.indexes[(a, b)] = index
+                self.sections[(a, b)] = (positions, wld_offset, dist_offset)
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        for sub in self.sections:
+            if sub not in self.tables:
+                del self.indexes[sub]
+        self.sections = {}
+
+    # ---------------- retrograde analysis / Retrograde Analyse ----------------
+    def solve(self, group, log=print):
+        """Löst eine Gruppe von Teilräumen, die nur untereinander ohne Schlagen
+        erreichbar sind ({(a, a)} oder {(a, b), (b, a)}). Kleinere Teilräume
+        (nach dem Schlagen) müssen bereits gelöst sein.
+        """
+        group = sorted(set(group))
+        start = time.time()
+        canon = _Canonicaliser()
+        # per subspace: result bytes, open successors, tentative win distance, /
+        # minimum loss distance (from captures into solved subspaces) /
+        # je Teilraum: Ergebnis-Bytes, offene Nachfolger, vorläufige Siegdistanz,
+        # Mindest-Niederlagendistanz (aus Schlagzügen in gelöste Teilräume)
+        tables, open_count, tentative, floors = {}, {}, {}, {}
+        indexes = {}
+        for sub in group:
+            indexes[sub] = CanonicalIndex.build(*sub, canon)
+            size = indexes[sub].size
+            tables[sub] = bytearray(size)
+            open_count[sub] = bytearray(size)
+            tentative[sub] = bytearray(size)
+            floors[sub] = bytearray(size)
+        wins = [[] for _ in range(256)]
+        losses = [[] for _ in range(256)]
+        total = 0
+        for a, b in group:
+            count = 0
+            sub = (a, b)
+            t_open, t_tent, t_floor = open_count[sub], tentative[sub], floors[sub]
+            index = indexes[sub].index
+            for own, opp in canon.representatives(a, b):
+                count += 1
+                i = index(own, opp)
+                key = own | opp << 24
+                succs = _successors(own, opp)
+                if not succs:
+                    # blocked: lost at once / eingesperrt: sofort verloren
+                    losses[0].append(key)
+                    continue
+                pending = set()
+                best_win = 0
+                floor = 0
+                for new_own, new_opp in succs:
+                    n_opp = popcount(new_opp)
+                    if n_opp < 3:
+                        best_win = 1
+                        break
+                    if n_opp < b:
+                        # capture: lower subspace, already solved /
+                        # geschlagen: kleinerer Teilraum, bereits gelöst
+                        res, dist = self.lookup(new_opp, new_own)
+                        if res == LOSS:
+                            if not best_win or dist + 1 < best_win:
+                                best_win = dist + 1
+                        elif res == WIN:
+                            floor = max(floor, dist + 1)
+                        else:
+                            pending.add(-1)  # draw keeps it open / Remis hält offen
+                    else:
+                        pending.add(canon.key(new_opp, new_own))
+                if best_win:
+                    best_win = min(best_win, 255)
+                    t_tent[i] = best_win
+                    wins[best_win].append(key)
+                elif not pending:
+                    losses[min(floor, 255)].append(key)
+                else:
+                    t_open[i] = len(pending)
+                    t_floor[i] = min(floor, 255)
+            total += count
+            log(f"  {a}v{b}: {count} kanonische von {subspace_size(a, b)} Stellungen ({time.time() - start:.1f} s)")
+        # propagate in order of distance / in Reihenfolge der Distanz ausbreiten
+        n_wins = n_losses = 0
+        for d in range(256):
+            nd = min(d + 1, 255)
+            for res, bucket in ((WIN, wins[d]), (LOSS, losses[d])):
+                while bucket:
+                    key = bucket.pop()
+                    own, opp = key & FULL, key >> 24
+                    a, b = popcount(own), popcount(opp)
+                    i = indexes[(a, b)].index(own, opp)
+                    table = tables[(a, b)]
+                    if table[i]:
+                        continue
+                    if res == WIN:
+                        if tentative[(a, b)][i] != d:
+                            continue
+                        n_wins += 1
+                    else:
+                        n_losses += 1
+                    table[i] = encode(res, d)
+                    # parents lie in subspace (b, a) / Vorgänger liegen im Teilraum (b, a)
+                    p_table, p_tent = tables[(b, a)], tentative[(b, a)]
+                    p_open, p_floor = open_count[(b, a)], floors[(b, a)]
+                    p_index = indexes[(b, a)].index
+                    for pkey in {canon.key(p_own, p_opp) for p_own, p_opp in _predecessors(own, opp)}:
+                        p_own, p_opp = pkey & FULL, pkey >> 24
+                        j = p_index(p_own, p_opp)
+                        if p_table[j]:
+                            continue
+                        if res == LOSS:
+                            old = p_tent[j]
+                            if not old or nd < old:
+                                p_tent[j] = nd
+                                wins[nd].append(pkey)
+                        elif not p_tent[j]:
+                            n = p_open[j] - 1
+                            p_open[j] = n
+                            if not n:
+                                losses[max(nd, p_floor[j])].append(pkey)
+        self.tables.update(tables)
+        self.indexes.update(indexes)
+        log(f"  {'+'.join(f'{a}v{b}' for a, b in group)}: {n_wins} Siege, {n_losses} Niederlagen, "
+            f"{total - n_wins - n_losses} Remis ({time.time() - start:.1f} s)")
+
+
+class _Canonicaliser:
+    """Schnelle Kanonisierung für den Builder: die Symmetrien, die die Gegnersteine
+    minimal machen, werden je Maske zwischengespeichert."""
+
+    def __init__(self):
+        self.opp_cache = {}
+
+    def _opp(self, opp):
+        e = self.opp_cache.get(opp)
+        if e is None:
+            images = [morris_board.transform(opp, s) for s in range(len(SYMMETRIES))]
+            best = min(images)
+            e = (best, tuple(SYM_BYTE_TABLES[s] for s, m in enumerate(images) if m == best))
+            self.opp_cache[opp] = e
+        return e
+
+    def key(self, own, opp):
+        """Kanonischer Schlüssel own | opp << 24 (wie morris_board.canonical)."""
+        c_opp, tables = self._opp(opp)
+        w0, w1, w2 = own & 255, own >> 8 & 255, own >> 16
+        best = None
+        for t0, t1, t2 in tables:
+            m = t0[w0] | t1[w1] | t2[w2]
+            if best is None or m < best:
+                best = m
+        return best | c_opp << 24
+
+    def representatives(self, a, b):
+        """Alle kanonischen Stellungen (own, opp) mit a bzw. b Steinen."""
+        for opp in _masks(b):
+            c_opp, tables = self._opp(opp)
+            if c_opp != opp:
+                continue
+            for own in _masks(a, FULL & ~opp):
+                if len(tables) == 1 or self.key(own, opp) & FULL == own:
+                    yield own, opp
+
+
+def groups_for(subspaces):
+    """Sortiert Teilräume in lösbare Gruppen, inkl. benötigter kleinerer Teilräume."""
+    needed = set()
+    for a, b in subspaces:
+        for x in range(3, a + 1):
+            for y in range(3, b + 1):
+                needed.add((x, y))
+                needed.add((y, x))
+    groups = []
+    for total in sorted({a + b for a, b in needed}):
+        for a, b in sorted(needed):
+            if a + b == total and a <= b:
+                groups.append(sorted({(a, b), (b, a)}))
+    return groups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Endspiel-Datenbank für Mühle bauen (retrograde Analyse)")
+    parser.add_argument("subspaces", nargs="*", default=["3v3", "3v4", "4v3"],
+                        help="Teilräume wie 3v3 4v3 4v4 (Steine am Zug v Gegner)")
+    parser.add_argument("--out", default=ENDGAME_DIR, help="Zielverzeichnis")
+    parser.add_argument("--wld-only", action="store_true",
+                        help="nur Sieg/Remis/Niederlage speichern (2 Bit), ohne Distanzen")
+    args = parser.parse_args()
+    subs = []
+    for text in args.subspaces:
+        a, b = (int(x) for x in text.lower().split("v"))
+        if not (3 <= a <= MAX_STONES and 3 <= b <= MAX_STONES):
+            parser.error(f"Teilraum {text}: 3 bis {MAX_STONES} Steine je Seite")
+        subs.append((a, b))
+    db = EndgameDB.load(args.out)
+    for group in groups_for(subs):
+        if all(db.has(*sub) for sub in group):
+            print(f"{group}: vorhanden")
+            continue
+        print(f"{group}: wird gelöst ...")
+        db.solve(group)
+        # distances are needed while larger subspaces are solved /
+        # Distanzen werden beim Lösen größerer Teilräume gebraucht
+        db.save(args.out)
+    if args.wld_only:
+        db.save(args.out, distances=False)
+    print(f"{db.filename(args.out)}: {os.path.getsize(db.filename(args.out))} Bytes")
+
+
+if __name__ == "__main__":
+    main()
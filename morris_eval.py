@@ -0,0 +1,78 @@
+"""
+Nine Men's Morris Game - static evaluation
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+
+Evaluation weights (tuned by morris_tune.py) and the scalar evaluation used
+by the alpha-beta search, the Monte Carlo playouts and morris_batch. Set
+morris_eval.WEIGHTS to play with other weights.
+
+Bewertungsgewichte (von morris_tune.py getunt) und die einzelne Bewertung für
+die Alpha-Beta-Suche, die Monte-Carlo-Playouts und morris_batch.
+"""
+
+import json
+import os
+
+from morris_board import FULL, mobility, popcount
+from morris_game import TERM_MILLS, TERM_TWOS
+
+# evaluation weights: mills, open twos, mobility, stones (board + hand) of the /
+# evaluated side, then the same for the opponent /
+# Gewichte der Bewertung: Mühlen, offene Zweier, Mobilität, Steine (Brett + Hand)
+# der bewerteten Seite, danach dasselbe für den Gegner
+DEFAULT_WEIGHTS = (50, 12, 2, 3, 45, 12, 2, 3)
+
+# tuned weights (morris_tune.py), read at import / getunte Gewichte (morris_tune.py), beim Import gelesen
+WEIGHTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "eval_weights.json")
+
+
+def load_weights(path=None):
+    """Gewichte aus der Datei von morris_tune.py (Standard WEIGHTS_FILE);
+    ohne oder mit unbrauchbarer Datei DEFAULT_WEIGHTS."""
+    path = path or WEIGHTS_FILE
+    try:
+        with open(path, encoding="utf-8") as f:
+            weights = tuple(int(w) for w in json.load(f)["weights"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return DEFAULT_WEIGHTS
+    return weights if len(weights) == len(DEFAULT_WEIGHTS) else DEFAULT_WEIGHTS
+
+
+WEIGHTS = load_weights()
+
+
+def evaluate(game, player):
+    """Statische Bewertung aus Sicht von player (Mühlen, offene Zweier, Mobilität, Steine;
+    Gewichte in WEIGHTS).
+    Mühlen und Zweier führt MorrisGame in apply/undo mit, die Mobilität ist bitparallel.
+    """
+    opponent = 3 - player
+    own, opp = game.bits[player], game.bits[opponent]
+    empty = FULL & ~(own | opp)
+    # packed terms of each side moved to the white fields /
+    # gepackte Terme jeder Seite auf die Felder von Weiß geschoben
+    t_own = game.terms >> 8 * (player - 1)
+    t_opp = game.terms >> 8 * (opponent - 1)
+    # stones still in hand count as material, too /
+    # Steine in der Hand zählen ebenfalls als Material
+    hand_own = game.in_hand(player)
+    hand_opp = game.in_hand(opponent)
+    n_own = popcount(own)
+    n_opp = popcount(opp)
+    # flying: every empty point is reachable /
+    # Springen: jeder freie Punkt ist erreichbar
+    mob_own = mobility(own, empty, n_own == 3 and not hand_own)
+    mob_opp = mobility(opp, empty, n_opp == 3 and not hand_opp)
+    w_mills, w_twos, w_mob, w_stones, o_mills, o_twos, o_mob, o_stones = WEIGHTS
+    return (
+        w_mills * (t_own >> TERM_MILLS & 255) + w_twos * (t_own >> TERM_TWOS & 255)
+        + w_mob * mob_own + w_stones * (n_own + hand_own)
+        - o_mills * (t_opp >> TERM_MILLS & 255) - o_twos * (t_opp >> TERM_TWOS & 255)
+        - o_mob * mob_opp - o_stones * (n_opp + hand_opp)
+    )
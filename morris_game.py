@@ -0,0 +1,426 @@
+"""
+Nine Men's Morris Game - headless rules engine
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+"""
+
+import random
+import morris_board
+from morris_board import FULL, ADJ_MASK, ADJACENT, MILLS, POINT_MILLS, POINTS, iter_bits, popcount
+
+STONES_PER_PLAYER = 9
+
+# a move is (from, to, removed): from = -1 in the setting phase, /
+# removed = -1 if no mill was closed /
+# Ein Zug ist (from, to, removed): from = -1 in der Setzphase,
+# removed = -1, wenn keine Mühle geschlossen wurde
+NO_POS = -1
+
+# compact code of a move for tables (15 bit): (from + 1) << 10 | to << 5 | (removed + 1) /
+# kompakter Zugcode für Tabellen (15 Bit): (from + 1) << 10 | to << 5 | (removed + 1)
+NO_MOVE_CODE = (1 << 15) - 1
+
+
+def encode_move(move):
+    """Zug (from, to, removed) als Zahl; None wird NO_MOVE_CODE."""
+    if move is None:
+        return NO_MOVE_CODE
+    frm, to, rem = move
+    return (frm + 1) << 10 | to << 5 | (rem + 1)
+
+
+def decode_move(code):
+    """Umkehrung von encode_move."""
+    if code == NO_MOVE_CODE:
+        return None
+    return ((code >> 10) - 1, code >> 5 & 31, (code & 31) - 1)
+
+
+def _xor_all(values):
+    h = 0
+    for v in values:
+        h ^= v
+    return h
+
+
+# Zobrist keys (fixed seed, so hashes are stable between runs) /
+# Zobrist-Schlüssel (fester Seed, damit Hashes zwischen Läufen gleich bleiben)
+_rng = random.Random(0x4D75686C65)
+# [player][point], index 0 unused / [Spieler][Punkt], Index 0 unbenutzt
+ZOBRIST_STONE = [None] + [[_rng.getrandbits(64) for _ in range(POINTS)] for _ in (1, 2)]
+# [player][stones in hand] / [Spieler][Steine in der Hand]
+ZOBRIST_HAND = [None] + [[_rng.getrandbits(64) for _ in range(STONES_PER_PLAYER + 1)] for _ in (1, 2)]
+# black to move / Schwarz am Zug
+ZOBRIST_SIDE = _rng.getrandbits(64)
+del _rng
+
+# stone keys per ring byte, so a whole mask hashes with three lookups: /
+# ZOBRIST_BYTES[player][ring][byte] /
+# Steinschlüssel je Ring-Byte, damit eine ganze Maske mit drei Zugriffen gehasht wird:
+# ZOBRIST_BYTES[Spieler][Ring][Byte]
+ZOBRIST_BYTES = [None] + [
+    [
+        [
+            _xor_all(ZOBRIST_STONE[player][ring * 8 + j] for j in range(8) if v >> j & 1)
+            for v in range(256)
+        ]
+        for ring in range(3)
+    ]
+    for player in (1, 2)
+]
+
+# evaluation terms kept up to date by apply/undo, packed into MorrisGame.terms as /
+# 8 bit fields: mills and open twos (two stones, third point empty); white at the /
+# shift, black at shift + 8 /
+# Bewertungsterme, die apply/undo mitführen, gepackt in MorrisGame.terms als
+# 8-Bit-Felder: Mühlen und offene Zweier (zwei Steine, dritter Punkt frei);
+# Weiß beim Shift, Schwarz bei Shift + 8
+TERM_MILLS = 0
+TERM_TWOS = 16
+
+# every mill line is a 4 bit code (white count + 4 * black count) in MorrisGame.lines; /
+# _LINE_PUT[p][i] adds a stone of p to both lines through i with one addition /
+# jede Mühlenlinie ist ein 4-Bit-Kode (Anzahl Weiß + 4 * Anzahl Schwarz) in MorrisGame.lines;
+# _LINE_PUT[p][i] fügt beiden Linien durch i mit einer Addition einen Stein von p hinzu
+_LINE_STEP = (0, 1, 4)
+_LINE_SHIFTS = tuple((4 * a, 4 * b) for a, b in POINT_MILLS)
+_LINE_PUT = (None,) + tuple(
+    tuple(_LINE_STEP[p] << a | _LINE_STEP[p] << b for a, b in _LINE_SHIFTS)
+    for p in (1, 2)
+)
+
+
+def _line_terms(code):
+    w, b = code & 3, code >> 2
+    t = 0
+    for shift, own, opp in ((0, w, b), (8, b, w)):
+        if own == 3:
+            t += 1 << (TERM_MILLS + shift)
+        elif own == 2 and not opp:
+            t += 1 << (TERM_TWOS + shift)
+    return t
+
+
+_LINE_TERMS = tuple(_line_terms(code) for code in range(16))
+
+# change of the mill/two terms when p adds a stone to two lines with codes c1, c2, /
+# indexed by c1 | c2 << 4 (0 where a line would overflow; never used on legal boards) /
+# Änderung der Mühlen-/Zweier-Terme, wenn p beiden Linien mit Kodes c1, c2 einen Stein
+# hinzufügt, Index c1 | c2 << 4 (0 bei Überlauf einer Linie; auf legalen Brettern unbenutzt)
+_MILL_PUT = (None,) + tuple(
+    tuple(
+        _LINE_TERMS[(c & 15) + _LINE_STEP[p]] - _LINE_TERMS[c & 15]
+        + _LINE_TERMS[(c >> 4) + _LINE_STEP[p]] - _LINE_TERMS[c >> 4]
+        if (c & 15) + _LINE_STEP[p] < 16 and (c >> 4) + _LINE_STEP[p] < 16 else 0
+        for c in range(256)
+    )
+    for p in (1, 2)
+)
+
+
+class MorrisGame:
+    """Spielregeln ohne pygame: Setzphase, Zug-/Springphase, Entfernen nach Mühle,
+    Anti-Pendeln, 3-fach-Wiederholung und 100-Halbzüge-Remis (nur Turnier).
+
+    Spieler: 1 = Weiß, 2 = Schwarz. Weiß beginnt.
+    """
+
+    def __init__(self, ruleset="Entschärft"):
+        self.ruleset = ruleset
+        self.tournament = ruleset == "Turnier"
+        self.bits = [0, 0, 0]  # [unused, white, black] / [unbenutzt, weiß, schwarz]
+        self.stones_set = [0, 0]  # [white, black] / [weiß, schwarz]
+        self.current_player = 1
+        # per player (from, to) / pro Spieler (from, to)
+        self.last_move_by = {1: (-1, -1), 2: (-1, -1)}
+        self.halfmove_clock = 0
+        self.position_counts = {}
+        self.history = []
+        # mill line codes and packed evaluation terms (see TERM_MILLS) /
+        # Kodes der Mühlenlinien und gepackte Bewertungsterme (siehe TERM_MILLS)
+        self.lines, self.terms = self.compute_terms()
+        # Zobrist hash of board, side to move and stones in hand (phase follows from it) /
+        # Zobrist-Hash aus Brett, Seite am Zug und Steinen in der Hand (daraus folgt die Phase)
+        self.hash = self.compute_hash()
+
+    @classmethod
+    def from_state(cls, state, stones_set=None, current_player=1, ruleset="Entschärft"):
+        game = cls(ruleset)
+        game.bits = morris_board.from_state(state)
+        if stones_set is not None:
+            game.stones_set = list(stones_set)
+        game.current_player = current_player
+        game.lines, game.terms = game.compute_terms()
+        game.hash = game.compute_hash()
+        return game
+
+    def copy(self):
+        game = MorrisGame.__new__(MorrisGame)
+        game.__dict__.update(self.__dict__)
+        game.bits = list(self.bits)
+        game.stones_set = list(self.stones_set)
+        game.last_move_by = dict(self.last_move_by)
+        game.position_counts = dict(self.position_counts)
+        game.history = list(self.history)
+        return game
+
+    def compute_hash(self):
+        """Berechnet den Zobrist-Hash komplett neu (apply/undo aktualisieren ihn inkrementell)."""
+        h = ZOBRIST_SIDE if self.current_player == 2 else 0
+        for player in (1, 2):
+            for pos in iter_bits(self.bits[player]):
+                h ^= ZOBRIST_STONE[player][pos]
+            h ^= ZOBRIST_HAND[player][self.in_hand(player)]
+        return h
+
+    def compute_terms(self):
+        """Berechnet Linienkodes und Bewertungsterme komplett neu; liefert (lines, terms)."""
+        w, b = self.bits[1], self.bits[2]
+        lines = 0
+        terms = 0
+        for k, mill in enumerate(MILLS):
+            code = sum(_LINE_STEP[1] * (w >> i & 1) + _LINE_STEP[2] * (b >> i & 1) for i in mill)
+            lines |= code << 4 * k
+            terms += _LINE_TERMS[code]
+        return lines, terms
+
+    def term(self, shift, player):
+        """Ein Bewertungsterm (TERM_MILLS, TERM_TWOS) von player."""
+        return self.terms >> (shift + 8 * (player - 1)) & 255
+
+    def canonical_hash(self):
+        """Zobrist-Hash der kanonischen Form unter den 16 Brettsymmetrien.
+        Liefert (hash, sym); sym bildet die aktuelle Stellung auf die kanonische ab.
+        """
+        w, b, sym = morris_board.canonical(self.bits[1], self.bits[2])
+        w0, w1, w2 = ZOBRIST_BYTES[1]
+        b0, b1, b2 = ZOBRIST_BYTES[2]
+        h = (w0[w & 255] ^ w1[w >> 8 & 255] ^ w2[w >> 16]
+             ^ b0[b & 255] ^ b1[b >> 8 & 255] ^ b2[b >> 16]
+             ^ ZOBRIST_HAND[1][self.in_hand(1)] ^ ZOBRIST_HAND[2][self.in_hand(2)])
+        if self.current_player == 2:
+            h ^= ZOBRIST_SIDE
+        return h, sym
+
+    # ---------------- state queries / Zustandsabfragen ----------------
+    @property
+    def state(self):
+        """24er-Liste (0 leer, 1 weiß, 2 schwarz) für Anzeige und Netzwerk."""
+        return morris_board.to_state(self.bits)
+
+    def empty(self):
+        return FULL & ~(self.bits[1] | self.bits[2])
+
+    def in_placement(self):
+        """Setzphase läuft, solange nicht beide Seiten 9 Steine gesetzt haben."""
+        return self.stones_set[0] < STONES_PER_PLAYER or self.stones_set[1] < STONES_PER_PLAYER
+
+    def in_hand(self, player):
+        return STONES_PER_PLAYER - self.stones_set[player - 1]
+
+    def stones_on_board(self, player):
+        return popcount(self.bits[player])
+
+    def is_flying(self, player):
+        return self.in_hand(player) == 0 and popcount(self.bits[player]) == 3
+
+    def position_key(self):
+        return (self.bits[1], self.bits[2], self.current_player)
+
+    def repetition_count(self, player):
+        """Wie oft die aktuelle Stellung mit player am Zug schon vorkam (Turnier)."""
+        return self.position_counts.get((self.bits[1], self.bits[2], player), 0)
+
+    def forms_mill(self, frm, to, player=None):
+        """True, wenn Setzen (frm = -1) oder Ziehen frm -> to eine Mühle schließt."""
+        if player is None:
+            player = self.current_player
+        own = self.bits[player]
+        if frm >= 0:
+            own &= ~(1 << frm)
+        return morris_board.forms_mill(own, to)
+
+    def removal_candidates(self, player=None):
+        """Gegnerische Steine, die player nach einer Mühle entfernen darf."""
+        if player is None:
+            player = self.current_player
+        return list(iter_bits(morris_board.removable(self.bits[3 - player])))
+
+    # ---------------- move generation / Zuggenerierung ----------------
+    def targets(self, frm, player=None):
+        """Erlaubte Zielfelder für den Stein auf frm (Ziehen, Springen, Anti-Pendeln)."""
+        if player is None:
+            player = self.current_player
+        empty = self.empty()
+        mask = empty if self.is_flying(player) else ADJ_MASK[frm] & empty
+        if self.tournament:
+            lm_from, lm_to = self.last_move_by[player]
+            if frm == lm_to and lm_from >= 0:
+                mask &= ~(1 << lm_from)
+        return list(iter_bits(mask))
+
+    def legal_moves(self):
+        """Alle Züge (from, to, removed) der Seite am Zug, inkl. jeder erlaubten Entfernung."""
+        p = self.current_player
+        own, opp = self.bits[p], self.bits[3 - p]
+        empty = FULL & ~(own | opp)
+        forms_mill = morris_board.forms_mill
+        removable = None
+        moves = []
+        if self.stones_set[p - 1] < STONES_PER_PLAYER:
+            for to in iter_bits(empty):
+                if forms_mill(own, to):
+                    if removable is None:
+                        removable = list(iter_bits(morris_board.removable(opp))) or [NO_POS]
+                    for r in removable:
+                        moves.append((NO_POS, to, r))
+                else:
+                    moves.append((NO_POS, to, NO_POS))
+            return moves
+        flying = popcount(own) == 3
+        lm_from, lm_to = self.last_move_by[p] if self.tournament else (-1, -1)
+        free = iter_bits(empty) if flying else None
+        for frm in iter_bits(own):
+            after = own & ~(1 << frm)
+            for to in free or ADJACENT[frm]:
+                if not empty >> to & 1 or (frm == lm_to and to == lm_from):
+                    continue
+                if forms_mill(after, to):
+                    if removable is None:
+                        removable = list(iter_bits(morris_board.removable(opp))) or [NO_POS]
+                    for r in removable:
+                        moves.append((frm, to, r))
+                else:
+                    moves.append((frm, to, NO_POS))
+        return moves
+
+    def has_moves(self, player=None):
+        if player is None:
+            player = self.current_player
+        if self.stones_set[player - 1] < STONES_PER_PLAYER:
+            return bool(self.empty())
+        forbidden = self.last_move_by[player] if self.tournament else (-1, -1)
+        own = self.bits[player]
+        return morris_board.has_moves(own, self.empty(), popcount(own) == 3, forbidden)
+
+    # ---------------- make / unmake / Zug ausführen und zurücknehmen ----------------
+    def apply(self, move):
+        """Führt einen Zug (from, to, removed) aus. Keine Legalitätsprüfung."""
+        frm, to, rem = move
+        p = self.current_player
+        bits = self.bits
+        key = None
+        last_move = self.last_move_by[p]
+        halfmove = self.halfmove_clock
+        # previous board, hash and terms for undo /
+        # bisheriges Brett, Hash und Terme für undo
+        white, black = bits[1], bits[2]
+        old_hash = self.hash
+        old_lines = lines = self.lines
+        old_terms = terms = self.terms
+        zs = ZOBRIST_STONE[p]
+        h = old_hash ^ ZOBRIST_SIDE ^ zs[to]
+        # only the two mill lines through each changed point are touched /
+        # nur die beiden Mühlenlinien durch jeden geänderten Punkt werden angefasst
+        if frm < 0:
+            hand = ZOBRIST_HAND[p]
+            n = self.stones_set[p - 1]
+            h ^= hand[STONES_PER_PLAYER - n] ^ hand[STONES_PER_PLAYER - n - 1]
+            self.stones_set[p - 1] = n + 1
+            bits[p] |= 1 << to
+        else:
+            h ^= zs[frm]
+            bits[p] ^= (1 << frm) | (1 << to)
+            self.last_move_by[p] = (frm, to)
+            lines -= _LINE_PUT[p][frm]
+            a, b = _LINE_SHIFTS[frm]
+            terms -= _MILL_PUT[p][(lines >> a & 15) | (lines >> b & 15) << 4]
+        a, b = _LINE_SHIFTS[to]
+        terms += _MILL_PUT[p][(lines >> a & 15) | (lines >> b & 15) << 4]
+        lines += _LINE_PUT[p][to]
+        if rem >= 0:
+            h ^= ZOBRIST_STONE[3 - p][rem]
+            bits[3 - p] &= ~(1 << rem)
+            lines -= _LINE_PUT[3 - p][rem]
+            a, b = _LINE_SHIFTS[rem]
+            terms -= _MILL_PUT[3 - p][(lines >> a & 15) | (lines >> b & 15) << 4]
+        self.lines = lines
+        self.terms = terms
+        self.hash = h
+        self.current_player = 3 - p
+        # tournament: repetition and halfmove clock only in the moving phase /
+        # Turnier: Wiederholung und Halbzugzähler nur in der Zugphase
+        if self.tournament and frm >= 0:
+            self.halfmove_clock = 0 if rem >= 0 else self.halfmove_clock + 1
+            key = (bits[1], bits[2], 3 - p)
+            self.position_counts[key] = self.position_counts.get(key, 0) + 1
+        self.history.append((move, last_move, halfmove, key, old_hash, old_lines, old_terms, white, black))
+
+    def undo(self):
+        """Nimmt den letzten Zug zurück (Brett, Hash und Terme kommen aus der Historie)."""
+        (frm, to, rem), last_move, halfmove, key, h, lines, terms, white, black = self.history.pop()
+        p = 3 - self.current_player
+        if key is not None:
+            n = self.position_counts[key] - 1
+            if n:
+                self.position_counts[key] = n
+            else:
+                del self.position_counts[key]
+        if frm < 0:
+            self.stones_set[p - 1] -= 1
+        bits = self.bits
+        bits[1] = white
+        bits[2] = black
+        self.hash = h
+        self.lines = lines
+        self.terms = terms
+        self.last_move_by[p] = last_move
+        self.halfmove_clock = halfmove
+        self.current_player = p
+
+    # ---------------- result / Ergebnis ----------------
+    def is_draw(self):
+        """Turnier-Remis: 3-fach-Wiederholung oder 100 Halbzüge ohne Schlagfall."""
+        if not self.tournament:
+            return False
+        if self.halfmove_clock >= 100:
+            return True
+        return self.position_counts.get(self.position_key(), 0) >= 3
+
+    def result(self):
+        """None = läuft noch, 1/2 = Sieger (Weiß/Schwarz), 0 = Remis."""
+        for player in (1, 2):
+            if popcount(self.bits[player]) + self.in_hand(player) < 3:
+                return 3 - player
+        if not self.has_moves():
+            return 3 - self.current_player
+        if self.is_draw():
+            return 0
+        return None
+
+
+def perft(depth, game=None):
+    """Anzahl der Zugfolgen mit depth Halbzügen ab game (Standard: Startstellung,
+    Regeln "Entschärft"); beendete Partien haben keine Züge.
+    Zum Prüfen und Messen der Zuggenerierung (Vergleichswerte in morris_bench.py).
+    """
+    if game is None:
+        game = MorrisGame()
+    if depth <= 0:
+        return 1
+    if game.result() is not None:
+        return 0
+    moves = game.legal_moves()
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        game.apply(move)
+        nodes += perft(depth - 1, game)
+        game.undo()
+    return nodes
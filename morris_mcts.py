@@ -0,0 +1,245 @@
+"""
+Nine Men's Morris Game - Monte Carlo tree search (UCT)
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+
+Alternative to the alpha-beta search of morris_ai, used by the difficulty
+"Monte Carlo": UCT over playouts on the bitboard game (apply/undo). Playouts
+close mills when they can and are cut off after PLAYOUT_PLIES, then scored
+by morris_eval.evaluate. The tree is kept between moves and reused when the
+new position is a child or grandchild of the last root. Strength grows with
+the playout budget or think time; with several workers every process of the
+shared pool (morris_pool) grows its own tree and the root statistics are
+added up.
+
+Alternative zur Alpha-Beta-Suche für die Stufe "Monte Carlo": UCT über
+Playouts auf dem Bitboard-Spiel. Der Baum wird zwischen den Zügen
+weiterverwendet; die Stärke wächst mit dem Playout-Budget bzw. der Bedenkzeit.
+"""
+
+import math
+import os
+import random
+import time
+
+import morris_eval
+import morris_pool
+
+# exploration constant of UCT (results are 0..1) /
+# Explorationskonstante von UCT (Ergebnisse 0..1)
+EXPLORATION = 1.4
+
+# playouts without think time / Playouts ohne Bedenkzeit
+PLAYOUTS = 2000
+
+# playouts are cut off after this many plies and scored statically /
+# Playouts enden nach so vielen Halbzügen und werden statisch bewertet
+PLAYOUT_PLIES = 24
+
+# sigmoid scale from evaluate to expected result /
+# Sigmoid-Skala von evaluate zum erwarteten Ergebnis
+EVAL_SCALE = 0.01
+
+# playouts between two checks of deadline and stop /
+# Playouts zwischen zwei Prüfungen von Zeitlimit und Abbruch
+BATCH = 32
+
+# the parallel search runs in rounds of at most this many seconds or playouts per worker, /
+# stop is checked between them / die parallele Suche läuft in Runden von höchstens so vielen
+# Sekunden bzw. Playouts pro Worker, stop wird dazwischen geprüft
+ROUND_TIME = 0.1
+ROUND_PLAYOUTS = 256
+
+
+class Node:
+    """Knoten des Suchbaums; value ist die Summe der Ergebnisse (0..1) aus Sicht von
+    player, der Seite, die move gezogen hat."""
+
+    __slots__ = ("move", "parent", "player", "key", "children", "untried", "visits", "value")
+
+    def __init__(self, game, move=None, parent=None):
+        self.move = move
+        self.parent = parent
+        self.player = 3 - game.current_player
+        self.key = game.hash
+        self.children = []
+        self.untried = game.legal_moves() if game.result() is None else []
+        self.visits = 0
+        self.value = 0.0
+
+    def select(self):
+        """Kind mit dem größten UCT-Wert."""
+        log_n = math.log(self.visits)
+        return max(self.children,
+                   key=lambda c: c.value / c.visits + EXPLORATION * math.sqrt(log_n / c.visits))
+
+    def find(self, key, depth=2):
+        """Nachfolger (höchstens depth Halbzüge tief) mit dem Hash key oder None."""
+        if self.key == key:
+            return self
+        if depth:
+            for child in self.children:
+                node = child.find(key, depth - 1)
+                if node is not None:
+                    return node
+        return None
+
+
+def playout(game, rng):
+    """Spielt von game aus (und zurück) höchstens PLAYOUT_PLIES Halbzüge: Mühle schließen,
+    wenn möglich, sonst zufällig. Liefert das erwartete Ergebnis für Weiß (0..1)."""
+    played = 0
+    result = game.result()
+    while result is None and played < PLAYOUT_PLIES:
+        moves = game.legal_moves()
+        mills = [m for m in moves if m[2] >= 0]
+        game.apply(rng.choice(mills or moves))
+        played += 1
+        result = game.result()
+    if result is None:
+        score = 1.0 / (1.0 + math.exp(-EVAL_SCALE * morris_eval.evaluate(game, 1)))
+    else:
+        score = 0.5 if result == 0 else float(result == 1)
+    for _ in range(played):
+        game.undo()
+    return score
+
+
+class Tree:
+    """UCT-Suchbaum, der zwischen den Zügen weiterverwendet wird."""
+
+    def __init__(self):
+        self.root = None
+
+    def search(self, game, playouts=None, time_limit=None, rng=random, stop=None):
+        """Führt playouts Playouts aus (mit time_limit: bis das Budget in Sekunden abläuft;
+        ohne beides PLAYOUTS) oder bis stop gesetzt wird. game wird nur vorübergehend
+        verändert. Liefert die Wurzel.
+        """
+        node = self.root.find(game.hash) if self.root is not None else None
+        if node is None:
+            node = Node(game)
+        node.parent = None
+        self.root = root = node
+        deadline = time.perf_counter() + time_limit if time_limit else None
+        if playouts is None and deadline is None:
+            playouts = PLAYOUTS
+        done = 0
+        while playouts is None or done < playouts:
+            for _ in range(BATCH if playouts is None else min(BATCH, playouts - done)):
+                self._playout(game, root, rng)
+            done += BATCH
+            if (deadline is not None and time.perf_counter() >= deadline) or (stop is not None and stop.is_set()):
+                break
+        return root
+
+    @staticmethod
+    def _playout(game, root, rng):
+        node = root
+        depth = 0
+        # selection / Auswahl
+        while not node.untried and node.children:
+            node = node.select()
+            game.apply(node.move)
+            depth += 1
+        # expansion / Erweiterung
+        if node.untried:
+            move = node.untried.pop(rng.randrange(len(node.untried)))
+            game.apply(move)
+            depth += 1
+            child = Node(game, move, node)
+            node.children.append(child)
+            node = child
+        # simulation and backpropagation / Simulation und Rückführung
+        score = playout(game, rng)
+        while node is not None:
+            node.visits += 1
+            node.value += score if node.player == 1 else 1.0 - score
+            node = node.parent
+        for _ in range(depth):
+            game.undo()
+
+
+_tree = None
+
+
+def get_tree():
+    """Suchbaum dieses Prozesses (wird beim ersten Aufruf angelegt)."""
+    global _tree
+    if _tree is None:
+        _tree = Tree()
+    return _tree
+
+
+def root_stats(root):
+    """{Zug: (Besuche, Summe der Ergebnisse)} der Kinder der Wurzel."""
+    return {child.move: (child.visits, child.value) for child in root.children}
+
+
+def _search_worker(game, playouts, time_limit, seed):
+    # runs in a pool process, which keeps its own tree between rounds and moves; the stats /
+    # add up over the rounds / läuft in einem Pool-Prozess, der seinen eigenen Baum zwischen
+    # Runden und Zügen behält; die Statistik summiert sich über die Runden
+    root = get_tree().search(game, playouts, time_limit, random.Random(seed), morris_pool.worker_stop())
+    return os.getpid(), root_stats(root)
+
+
+def parallel_stats(game, workers, playouts=None, time_limit=None, rng=random, stop=None):
+    """Wurzel-parallele Suche über den Prozess-Pool aus morris_pool in Runden (ROUND_TIME,
+    ROUND_PLAYOUTS); stop beendet auch die laufende Runde. Liefert die summierten
+    Wurzel-Statistiken (wie root_stats) des letzten Stands jedes Pool-Prozesses.
+    """
+    pool = morris_pool.get_executor(workers)
+    deadline = time.perf_counter() + time_limit if time_limit else None
+    if playouts is None and deadline is None:
+        playouts = PLAYOUTS
+    left = -(-playouts // workers) if playouts else None
+    latest = {}
+    while left is None or left > 0:
+        if stop is not None and stop.is_set():
+            break
+        budget = None if left is None else min(left, ROUND_PLAYOUTS)
+        time_left = None
+        if deadline is not None:
+            time_left = deadline - time.perf_counter()
+            if time_left <= 0:
+                break
+            time_left = min(time_left, ROUND_TIME)
+        futures = [pool.submit(_search_worker, game, budget, time_left, rng.getrandbits(32))
+                   for _ in range(workers)]
+        results = morris_pool.results(futures, stop)
+        if results is None:
+            break
+        latest.update(results)
+        if left is not None:
+            left -= budget
+    stats = {}
+    for worker_stats in latest.values():
+        for move, (visits, value) in worker_stats.items():
+            total = stats.get(move, (0, 0.0))
+            stats[move] = (total[0] + visits, total[1] + value)
+    return stats
+
+
+def choose_move(game, rng=random, playouts=None, time_limit=None, workers=None, stop=None, tree=None):
+    """Zug mit den meisten Besuchen nach der Suche (Argumente wie Tree.search; tree: eigener
+    Baum, Standard get_tree()). Mit mehr als einem Worker wurzel-parallel über den
+    Prozess-Pool aus morris_pool (parallel_stats), das Budget playouts wird aufgeteilt.
+    None ohne legale Züge.
+    """
+    moves = game.legal_moves()
+    if len(moves) < 2:
+        return moves[0] if moves else None
+    n = morris_pool.worker_count(workers)
+    if n > 1:
+        stats = parallel_stats(game, n, playouts, time_limit, rng, stop)
+    else:
+        stats = root_stats((tree or get_tree()).search(game.copy(), playouts, time_limit, rng, stop))
+    if not stats:
+        return rng.choice(moves)
+    return max(stats, key=lambda m: stats[m])
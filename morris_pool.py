@@ -0,0 +1,109 @@
+"""
+Nine Men's Morris Game - worker processes of the parallel searches
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+
+One process pool shared by the root-parallel alpha-beta search (morris_ai)
+and the root-parallel Monte Carlo search (morris_mcts). The pool keeps its
+size and stays alive between moves, so every worker keeps its transposition
+table and search tree. A search that is stopped stops its running tasks, too:
+the workers share one event (worker_stop) that results() sets until they
+have returned.
+
+Ein Prozess-Pool für die wurzel-parallele Alpha-Beta-Suche (morris_ai) und die
+Monte-Carlo-Suche (morris_mcts). Er behält seine Größe und bleibt zwischen den
+Zügen bestehen, damit jeder Worker seine Transpositionstabelle und seinen
+Suchbaum behält. Eine abgebrochene Suche bricht auch ihre laufenden Aufgaben ab.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+
+# worker processes of the root-parallel search (1 = single core, 0 = all cores) /
+# Worker-Prozesse der wurzel-parallelen Suche (1 = ein Kern, 0 = alle Kerne)
+PARALLEL_WORKERS = 1
+
+# how often results() looks at the stop event of the caller (seconds) /
+# wie oft results() das Stopp-Event des Aufrufers prüft (Sekunden)
+POLL_INTERVAL = 0.01
+
+_executor = None
+_executor_workers = 0
+# event shared with the workers of the current pool / mit den Workern des Pools geteiltes Event
+_pool_stop = None
+# in a worker: the event of its pool / in einem Worker: das Event seines Pools
+_worker_stop = None
+
+
+def _init_worker(stop):
+    global _worker_stop
+    _worker_stop = stop
+
+
+def worker_stop():
+    """Im Pool-Prozess das gemeinsame Stopp-Event (für Searcher und Tree.search), sonst None."""
+    return _worker_stop
+
+
+def worker_count(workers=None):
+    """Anzahl Worker-Prozesse (None: PARALLEL_WORKERS, 0: alle Kerne)."""
+    n = PARALLEL_WORKERS if workers is None else workers
+    return n if n > 0 else (os.cpu_count() or 1)
+
+
+def get_executor(workers):
+    """Prozess-Pool mit workers Prozessen (bleibt zwischen den Zügen bestehen,
+    damit die Transpositionstabellen der Worker erhalten bleiben)."""
+    global _executor, _executor_workers, _pool_stop
+    if _executor is None or _executor_workers != workers:
+        shutdown_executor()
+        _pool_stop = multiprocessing.Event()
+        _executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(_pool_stop,))
+        _executor_workers = workers
+    return _executor
+
+
+def start_workers(workers):
+    """Wie get_executor, startet die Prozesse aber sofort statt beim ersten Auftrag
+    (z. B. vor Zeitmessungen)."""
+    pool = get_executor(workers)
+    wait([pool.submit(time.sleep, 0.01) for _ in range(workers)])
+    return pool
+
+
+def results(futures, stop=None):
+    """Ergebnisse der futures in ihrer Reihenfolge. Wird stop (threading.Event) vorher
+    gesetzt, werden wartende Aufgaben gestrichen und laufende über worker_stop beendet;
+    dann None, sobald keine Aufgabe mehr läuft.
+    """
+    pending = futures
+    while pending:
+        pending = wait(pending, None if stop is None else POLL_INTERVAL).not_done
+        if pending and stop.is_set():
+            for future in pending:
+                future.cancel()
+            # set until every task has returned, so none starts late and runs on /
+            # gesetzt, bis jede Aufgabe zurück ist, damit keine später startet und weiterläuft
+            _pool_stop.set()
+            try:
+                wait(pending)
+            finally:
+                _pool_stop.clear()
+            return None
+    return [future.result() for future in futures]
+
+
+def shutdown_executor():
+    global _executor, _executor_workers, _pool_stop
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        _executor_workers = 0
+        _pool_stop = None
@@ -0,0 +1,207 @@
+"""
+Nine Men's Morris Game - headless self-play tournament
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+
+Plays AI configurations against each other (every pair, both colours, both
+rulesets) in parallel worker processes without a window. A configuration is
+a difficulty from morris_ai.DIFFICULTIES with optional settings:
+
+    python3 morris_tournament.py Schwer:depth=4 Schwer:depth=3 --games 200
+    python3 morris_tournament.py Schwer:time=0.2,weights=eval_weights.json Schwer:time=0.2
+    python3 morris_tournament.py Mittel Leicht --games 1000 --rulesets Turnier
+    python3 morris_tournament.py "Monte Carlo:playouts=4000" "Monte Carlo:playouts=1000"
+
+Prints W/D/L and Elo difference (95 % interval) per pair and ruleset,
+games per second and the average think time per move of each configuration.
+
+Spielt SL-Konfigurationen ohne Fenster gegeneinander (jedes Paar, beide Farben,
+beide Regelwerke) in parallelen Worker-Prozessen und gibt Sieg/Remis/Niederlage,
+Elo-Differenz mit Fehlerbereich, Partien pro Sekunde und mittlere Bedenkzeit aus.
+"""
+
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import morris_ai
+import morris_eval
+import morris_game
+import morris_mcts
+import morris_tt
+
+# games longer than this count as draw (the classic rules have no draw rule) /
+# längere Partien gelten als Remis (die klassischen Regeln kennen kein Remis)
+MAX_PLIES = 200
+
+# settings of a configuration and their types / Einstellungen einer Konfiguration und ihre Typen
+SETTINGS = {"depth": int, "time": float, "playouts": int, "weights": str}
+
+
+def parse_config(spec):
+    """"Schwer:depth=3,time=0.2,weights=datei.json" -> (Stufe, {Einstellung: Wert}).
+    Löst ValueError bei unbekannter Stufe oder Einstellung aus."""
+    difficulty, _, rest = spec.partition(":")
+    if difficulty not in morris_ai.DIFFICULTIES:
+        raise ValueError(f"{spec}: unbekannte Stufe {difficulty!r} ({', '.join(morris_ai.DIFFICULTIES)})")
+    settings = {}
+    for item in filter(None, rest.split(",")):
+        name, _, value = item.partition("=")
+        if name not in SETTINGS:
+            raise ValueError(f"{spec}: unbekannte Einstellung {name!r} ({', '.join(SETTINGS)})")
+        settings[name] = SETTINGS[name](value)
+    if "weights" in settings:
+        # read once here, so a broken file is reported before the games start /
+        # hier einmal lesen, damit eine kaputte Datei vor den Partien gemeldet wird
+        weights = morris_eval.load_weights(settings["weights"])
+        if weights is morris_eval.DEFAULT_WEIGHTS:
+            raise ValueError(f"{spec}: keine Gewichte in {settings['weights']}")
+        settings["weights"] = weights
+    return difficulty, settings
+
+
+# one transposition table and MCTS tree per colour and worker process, so the sides /
+# do not share what they found (and their weights) / eine Transpositionstabelle und ein
+# MCTS-Baum pro Farbe und Worker-Prozess, damit die Seiten ihr Wissen (und ihre Gewichte) nicht teilen
+_tables = {}
+_trees = {}
+# weights of configurations without weights=: the same as in the game (eval_weights.json, if tuned) /
+# Gewichte von Konfigurationen ohne weights=: dieselben wie im Spiel (eval_weights.json, falls getunt)
+_default_weights = morris_eval.load_weights()
+
+
+def _table(player):
+    if player not in _tables:
+        _tables[player] = morris_tt.TranspositionTable(morris_ai.TT_SIZE_MB)
+    return _tables[player]
+
+
+def play_game(white, black, ruleset, seed, random_plies=4):
+    """Eine Partie zwischen den Konfigurationen white und black (aus parse_config).
+    Die ersten random_plies Setzzüge sind zufällig (aus seed), damit sich die Partien
+    unterscheiden. Liefert (Ergebnis 1/2/0 wie MorrisGame.result, {Farbe: (Sekunden, Züge)}).
+    """
+    rng = random.Random(seed)
+    game = morris_game.MorrisGame(ruleset)
+    configs = {1: white, 2: black}
+    clock = {1: [0.0, 0], 2: [0.0, 0]}
+    for player in (1, 2):
+        _table(player).clear()
+        _trees[player] = morris_mcts.Tree()
+    for _ in range(random_plies):
+        if game.result() is not None:
+            break
+        game.apply(rng.choice(game.legal_moves()))
+    for _ in range(MAX_PLIES):
+        if game.result() is not None:
+            break
+        player = game.current_player
+        difficulty, settings = configs[player]
+        morris_eval.WEIGHTS = settings.get("weights", _default_weights)
+        start = time.perf_counter()
+        move = morris_ai.choose_move(game, difficulty, rng, settings.get("depth"), settings.get("time"),
+                                     workers=1, tt=_table(player), playouts=settings.get("playouts"),
+                                     tree=_trees[player])
+        clock[player][0] += time.perf_counter() - start
+        clock[player][1] += 1
+        game.apply(move)
+    return game.result() or 0, {p: tuple(c) for p, c in clock.items()}
+
+
+def _play(task):
+    pair, ruleset, a_white, white, black, seed, random_plies = task
+    result, clock = play_game(white, black, ruleset, seed, random_plies)
+    return pair, ruleset, a_white, result, clock
+
+
+def elo(wins, draws, losses, z=1.96):
+    """Elo-Differenz aus Sicht der ersten Seite und halbe Breite des Intervalls
+    (z Standardfehler, Standard 95 %); unendlich ohne Partien oder bei 100 % / 0 %."""
+    n = wins + draws + losses
+    if not n:
+        return 0.0, math.inf
+    score = (wins + draws / 2) / n
+    if score in (0, 1):
+        return math.copysign(math.inf, score - 0.5), math.inf
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / n
+    error = z * math.sqrt(variance / n)
+
+    def to_elo(p):
+        p = min(max(p, 1e-6), 1 - 1e-6)
+        return -400 * math.log10(1 / p - 1)
+
+    return to_elo(score) + 0.0, (to_elo(score + error) - to_elo(score - error)) / 2
+
+
+def run(specs, games, rulesets, workers=None, seed=0, random_plies=4, log=print):
+    """Jedes Paar aus specs spielt games Partien je Regelwerk (Farben abwechselnd, je zwei
+    Partien mit gleicher Eröffnung). Liefert {(Paar, Regelwerk): [S, R, N]} aus Sicht der
+    ersten Konfiguration des Paares und {Konfiguration: [Sekunden, Züge]}."""
+    configs = [parse_config(spec) for spec in specs]
+    pairs = [(i, j) for i in range(len(specs)) for j in range(i + 1, len(specs))]
+    tasks = []
+    for pair in pairs:
+        a, b = (configs[k] for k in pair)
+        for ruleset in rulesets:
+            for n in range(games):
+                a_white = n % 2 == 0
+                tasks.append((pair, ruleset, a_white, a if a_white else b, b if a_white else a,
+                              seed + n // 2, random_plies))
+    score = {(pair, ruleset): [0, 0, 0] for pair in pairs for ruleset in rulesets}
+    latency = {k: [0.0, 0] for k in range(len(specs))}
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers) as pool:
+        for done, (pair, ruleset, a_white, result, clock) in enumerate(
+                pool.map(_play, tasks, chunksize=max(1, len(tasks) // (workers * 8))), 1):
+            a_colour = 1 if a_white else 2
+            if result == 0:
+                score[pair, ruleset][1] += 1
+            else:
+                score[pair, ruleset][0 if result == a_colour else 2] += 1
+            for colour, k in ((a_colour, pair[0]), (3 - a_colour, pair[1])):
+                latency[k][0] += clock[colour][0]
+                latency[k][1] += clock[colour][1]
+            if done % 100 == 0:
+                log(f"  {done}/{len(tasks)} Partien ({done / (time.perf_counter() - start):.1f}/s)")
+    elapsed = time.perf_counter() - start
+    log(f"{len(tasks)} Partien in {elapsed:.1f} s ({len(tasks) / max(elapsed, 1e-9):.1f} Partien/s, {workers} Prozesse)")
+    return score, latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mühle-KI-Konfigurationen gegeneinander spielen lassen (Elo)")
+    parser.add_argument("configs", nargs="+",
+                        help="Stufe[:depth=N,time=S,playouts=N,weights=DATEI], z.B. Schwer:depth=3 (mindestens zwei)")
+    parser.add_argument("--games", type=int, default=100, help="Partien pro Paar und Regelwerk")
+    parser.add_argument("--rulesets", nargs="+", default=["Entschärft", "Turnier"], choices=["Entschärft", "Turnier"])
+    parser.add_argument("--workers", type=int, default=None, help="Prozesse (Standard: alle Kerne)")
+    parser.add_argument("--random-plies", type=int, default=4, help="zufällige Setzzüge zu Beginn jeder Partie")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if len(args.configs) < 2:
+        parser.error("mindestens zwei Konfigurationen")
+    try:
+        score, latency = run(args.configs, args.games, args.rulesets, args.workers, args.seed, args.random_plies)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    for (pair, ruleset), (wins, draws, losses) in score.items():
+        diff, margin = elo(wins, draws, losses)
+        a, b = (args.configs[k] for k in pair)
+        print(f"  {a} - {b} [{ruleset}]: +{wins} ={draws} -{losses}  Elo {diff:+.0f} +- {margin:.0f}")
+    for k, spec in enumerate(args.configs):
+        seconds, moves = latency[k]
+        print(f"  {spec}: {seconds / max(moves, 1) * 1000:.1f} ms/Zug ({moves} Züge)")
+
+
+if __name__ == "__main__":
+    main()
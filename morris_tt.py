@@ -0,0 +1,93 @@
+"""
+Nine Men's Morris Game - transposition table
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+"""
+
+from morris_game import NO_MOVE_CODE
+
+# bound types of a stored score /
+# Art der gespeicherten Bewertung
+EXACT = 0
+LOWER = 1  # score >= stored value (beta cutoff) / Bewertung >= Wert (Beta-Schnitt)
+UPPER = 2  # score <= stored value (fail low) / Bewertung <= Wert (kein Zug besser als Alpha)
+
+# estimated bytes per slot: two list references plus a 64 bit key and a packed int /
+# geschätzte Bytes pro Slot: zwei Listenverweise plus 64-Bit-Schlüssel und gepackte Ganzzahl
+SLOT_BYTES = 88
+
+# packed entry: score | depth (6 bit) | flag (2 bit) | move code (15 bit, morris_game.encode_move) /
+# gepackter Eintrag: Bewertung | Tiefe (6 Bit) | Art (2 Bit) | Zugcode (15 Bit, morris_game.encode_move)
+_SCORE_OFFSET = 1 << 20
+
+
+class TranspositionTable:
+    """Transpositionstabelle mit fester Speichergrenze in MB.
+
+    Jeder Bucket hat zwei Slots: der erste wird nur durch gleich tiefe oder
+    tiefere Suchen ersetzt (depth-preferred), der zweite immer (always-replace).
+    Zähler: hits, misses, overwrites (fremder Eintrag ersetzt), stores, used (belegte Slots).
+    """
+
+    def __init__(self, size_mb=16):
+        self.size_mb = size_mb
+        self.buckets = max(1, int(size_mb * 1024 * 1024) // (2 * SLOT_BYTES))
+        self.clear()
+
+    def clear(self):
+        self.keys = [None] * (2 * self.buckets)
+        self.data = [0] * (2 * self.buckets)
+        self.hits = self.misses = self.overwrites = self.stores = self.used = 0
+
+    def probe(self, key):
+        """Liefert (depth, flag, score, Zugcode) oder None; der Zugcode wird erst bei Bedarf
+        mit morris_game.decode_move ausgepackt (die meisten Treffer schneiden ohne Zug ab)."""
+        i = (key % self.buckets) << 1
+        keys = self.keys
+        if keys[i] != key:
+            i += 1
+            if keys[i] != key:
+                self.misses += 1
+                return None
+        self.hits += 1
+        d = self.data[i]
+        return ((d >> 17) & 63, (d >> 15) & 3, (d >> 23) - _SCORE_OFFSET, d & NO_MOVE_CODE)
+
+    def store(self, key, depth, flag, score, move=NO_MOVE_CODE):
+        """Speichert eine Bewertung mit dem Zugcode move (morris_game.encode_move)."""
+        i = (key % self.buckets) << 1
+        keys, data = self.keys, self.data
+        # depth-preferred slot: same position or at least as deep /
+        # Tiefen-Slot: gleiche Stellung oder mindestens so tief
+        old = keys[i]
+        if old is not None and old != key and depth < (data[i] >> 17) & 63:
+            i += 1
+            old = keys[i]
+        if old is None:
+            self.used += 1
+        elif old != key:
+            self.overwrites += 1
+        keys[i] = key
+        data[i] = ((score + _SCORE_OFFSET) << 23) | (min(depth, 63) << 17) | (flag << 15) | move
+        self.stores += 1
+
+    def stats(self):
+        """Zähler und Füllstand als dict (zum Dimensionieren der Tabelle)."""
+        probes = self.hits + self.misses
+        used = self.used
+        return {
+            "size_mb": self.size_mb,
+            "slots": len(self.keys),
+            "used": used,
+            "fill": used / len(self.keys),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / probes if probes else 0.0,
+            "overwrites": self.overwrites,
+            "stores": self.stores,
+        }
@@ -0,0 +1,200 @@
+"""
+Nine Men's Morris Game - evaluation weight tuner
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+
+Texel-style tuning of morris_eval.WEIGHTS: self-play games (in parallel worker
+processes) record every quiet position with the final result; then the
+weights are fitted so that sigmoid(K * evaluate) predicts the result with the
+least squared error. The weights are written to eval_weights.json, which
+morris_eval reads at startup. Needs NumPy.
+
+    python3 morris_tune.py --games 400 --depth 3 --data tune_positions.npz
+
+Texel-Tuning der Bewertungsgewichte: Selbstspiel-Partien (parallel in
+Worker-Prozessen) liefern ruhige Stellungen mit dem Endergebnis; die Gewichte
+werden so angepasst, dass sigmoid(K * Bewertung) das Ergebnis mit kleinstem
+quadratischen Fehler vorhersagt. Ergebnis in eval_weights.json, das morris_eval
+beim Start liest. Benötigt NumPy.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import morris_ai
+import morris_batch
+import morris_eval
+import morris_game
+
+# games longer than this count as draw (the classic rules have no draw rule) /
+# längere Partien gelten als Remis (die klassischen Regeln kennen kein Remis)
+MAX_PLIES = 200
+
+
+def play_game(seed, depth=3, ruleset="Entschärft", random_plies=(2, 8), explore=0.05):
+    """Eine Selbstspiel-Partie mit Suchtiefe depth; die ersten Setzzüge (random_plies)
+    und mit Wahrscheinlichkeit explore jeder weitere Zug sind zufällig, damit sich die
+    Partien unterscheiden. Liefert ([(Brett, Hand Weiß, Hand Schwarz, am Zug), ...],
+    Ergebnis 1/2/0 wie MorrisGame.result); nur ruhige Stellungen (keine Mühle möglich).
+    """
+    rng = random.Random(seed)
+    game = morris_game.MorrisGame(ruleset)
+    positions = []
+    opening = rng.randint(*random_plies)
+    result = None
+    for ply in range(MAX_PLIES):
+        result = game.result()
+        if result is not None:
+            break
+        moves = game.legal_moves()
+        if ply < opening or rng.random() < explore:
+            move = rng.choice(moves)
+        else:
+            # quiet: the static evaluation is only trusted without a mill to close /
+            # ruhig: der statischen Bewertung wird nur ohne schließbare Mühle vertraut
+            if all(rem < 0 for _, _, rem in moves):
+                positions.append((game.state, game.in_hand(1), game.in_hand(2), game.current_player))
+            move = morris_ai.search(game, depth, rng)[1]
+        game.apply(move)
+    return positions, result or 0
+
+
+def self_play(games, depth=3, ruleset="Entschärft", workers=None, seed=0, log=print):
+    """games Partien auf workers Prozessen (Standard: alle Kerne); liefert die Arrays
+    (Bretter N x 24, Hand am Zug, Hand Gegner, am Zug, Ergebnis 1/0.5/0 für die Seite am Zug)."""
+    boards, hand_own, hand_opp, player, target = [], [], [], [], []
+    workers = workers or os.cpu_count() or 1
+    start = time.time()
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [pool.submit(play_game, seed + n, depth, ruleset) for n in range(games)]
+        for n, future in enumerate(futures):
+            positions, result = future.result()
+            for state, hand_white, hand_black, p in positions:
+                boards.append(state)
+                hand_own.append(hand_white if p == 1 else hand_black)
+                hand_opp.append(hand_black if p == 1 else hand_white)
+                player.append(p)
+                target.append(0.5 if result == 0 else float(result == p))
+            if (n + 1) % 10 == 0 or n + 1 == games:
+                log(f"  Partie {n + 1}/{games}: {len(boards)} Stellungen ({time.time() - start:.0f} s)")
+    return (np.array(boards, dtype=np.int8).reshape(-1, 24), np.array(hand_own), np.array(hand_opp),
+            np.array(player, dtype=np.int8), np.array(target))
+
+
+def features(boards, hand_own, hand_opp, player):
+    """Terme (N x 8, morris_batch.terms_batch) aus Sicht der Seite am Zug; die des Gegners
+    negiert, damit die Bewertung einfach features @ weights ist."""
+    x = np.zeros((len(boards), 8), dtype=np.int64)
+    for p in (1, 2):
+        rows = player == p
+        if rows.any():
+            x[rows] = morris_batch.terms_batch(boards[rows], p, hand_own[rows], hand_opp[rows])
+    x[:, 4:] *= -1
+    return x
+
+
+def error(x, target, weights, k):
+    """Mittlerer quadratischer Fehler zwischen Ergebnis und sigmoid(k * Bewertung)."""
+    score = x @ np.asarray(weights, dtype=np.float64)
+    return float(np.mean((target - 1.0 / (1.0 + np.exp(-k * score))) ** 2))
+
+
+def fit_k(x, target, weights, low=1e-4, high=1.0, steps=60):
+    """Skalierung K, die den Fehler für feste Gewichte minimiert (Goldener Schnitt auf log K)."""
+    a, b = math.log(low), math.log(high)
+    ratio = (math.sqrt(5) - 1) / 2
+    for _ in range(steps):
+        c = b - ratio * (b - a)
+        d = a + ratio * (b - a)
+        if error(x, target, weights, math.exp(c)) < error(x, target, weights, math.exp(d)):
+            b = d
+        else:
+            a = c
+    return math.exp((a + b) / 2)
+
+
+def tune(x, target, weights, k, rounds=100, log=print):
+    """Texel-Suche: jedes Gewicht um +-1 verändern, solange der Fehler sinkt (K bleibt fest,
+    damit die Gewichte ihre Skala behalten). Liefert (Gewichte, Fehler)."""
+    weights = list(weights)
+    best = error(x, target, weights, k)
+    for n in range(rounds):
+        improved = False
+        for i in range(len(weights)):
+            for step in (1, -1):
+                if weights[i] + step < 0:
+                    continue
+                weights[i] += step
+                e = error(x, target, weights, k)
+                if e < best:
+                    best = e
+                    improved = True
+                    break
+                weights[i] -= step
+        log(f"  Runde {n + 1}: Fehler {best:.6f}  {tuple(weights)}")
+        if not improved:
+            break
+    return tuple(weights), best
+
+
+def load_data(path):
+    with np.load(path) as data:
+        return tuple(data[name] for name in ("boards", "hand_own", "hand_opp", "player", "target"))
+
+
+def save_data(path, data):
+    boards, hand_own, hand_opp, player, target = data
+    np.savez_compressed(path, boards=boards, hand_own=hand_own, hand_opp=hand_opp, player=player, target=target)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bewertungsgewichte der Mühle-KI aus Selbstspiel tunen (Texel)")
+    parser.add_argument("--games", type=int, default=200, help="neue Selbstspiel-Partien (0 = nur vorhandene Daten)")
+    parser.add_argument("--depth", type=int, default=3, help="Suchtiefe der Selbstspiel-Partien in Halbzügen")
+    parser.add_argument("--ruleset", default="Entschärft", choices=["Entschärft", "Turnier"])
+    parser.add_argument("--workers", type=int, default=None, help="Prozesse für das Selbstspiel (Standard: alle Kerne)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data", default=None, help="Stellungen laden und ergänzt wieder speichern (.npz)")
+    parser.add_argument("--rounds", type=int, default=100, help="höchstens so viele Tuning-Runden")
+    parser.add_argument("--out", default=morris_eval.WEIGHTS_FILE, help="Gewichtsdatei")
+    args = parser.parse_args()
+
+    data = None
+    if args.data and os.path.exists(args.data):
+        data = load_data(args.data)
+        print(f"{args.data}: {len(data[0])} Stellungen vorhanden")
+    if args.games > 0:
+        new = self_play(args.games, args.depth, args.ruleset, args.workers, args.seed)
+        data = new if data is None else tuple(np.concatenate(pair) for pair in zip(data, new))
+        if args.data:
+            save_data(args.data, data)
+    if data is None or not len(data[0]):
+        raise SystemExit("keine Stellungen")
+    boards, hand_own, hand_opp, player, target = data
+    x = features(boards, hand_own, hand_opp, player)
+
+    weights = morris_eval.WEIGHTS
+    k = fit_k(x, target, weights)
+    start_error = error(x, target, weights, k)
+    print(f"{len(target)} Stellungen, K = {k:.5f}, Fehler {start_error:.6f} mit {weights}")
+    weights, best = tune(x, target, weights, k, args.rounds)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump({"weights": list(weights), "k": k, "error": best, "positions": int(len(target))}, f, indent=1)
+        f.write("\n")
+    print(f"{args.out}: {weights}, Fehler {start_error:.6f} -> {best:.6f}")
+
+
+if __name__ == "__main__":
+    main()
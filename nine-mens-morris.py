@@ -18,6 +18,12 @@ import socket
 import select
 import math
 import os
+import re
+from collections import OrderedDict
+import morris_board
+import morris_game
+import morris_ai
+import morris_pool
 
 # constant / Konstanten
 # just in case 600x600 is too small, can be switched to 800x800.
@@ -28,7 +34,31 @@ WIDTH, HEIGHT = 600, 600
 FPS = 60
 FONT_SIZE = 40
 MENU_OPTIONS = ["Mensch vs SL", "Netzwerkspiel", "Hilfe"]
-DIFFICULTY_OPTIONS = ["Leicht", "Mittel", "Schwer"]
+DIFFICULTY_OPTIONS = list(morris_ai.DIFFICULTIES)
+# levels that search for a think time: "Schwer" (iterative deepening) and /
+# "Monte Carlo" (playouts until the time is up) /
+# Stufen, die eine Bedenkzeit lang suchen: "Schwer" (iterative Vertiefung) und
+# "Monte Carlo" (Playouts, bis die Zeit abgelaufen ist)
+TIMED_DIFFICULTIES = ("Schwer", "Monte Carlo")
+# think time per AI move of these levels / Bedenkzeit pro SL-Zug dieser Stufen
+THINK_TIME_OPTIONS = ["200 ms", "1 s", "5 s"]
+THINK_TIME_SECONDS = {"200 ms": 0.2, "1 s": 1.0, "5 s": 5.0}
+# minimum time an AI move takes, so it can be followed on screen (ms) /
+# Mindestdauer eines SL-Zuges, damit er am Bildschirm verfolgbar bleibt (ms)
+AI_MIN_MOVE_MS = 400
+# worker processes for the "Schwer" and "Monte Carlo" search (1 = single core, 0 = all cores) /
+# Worker-Prozesse für die Suche bei "Schwer" und "Monte Carlo" (1 = ein Kern, 0 = alle Kerne)
+AI_WORKERS = 1
+# "Schwer" keeps searching during the human's turn (pondering, single worker only: the /
+# workers' tables would not see it) / "Schwer" sucht während des Menschen-Zuges weiter
+# (Pondern, nur mit einem Worker: die Tabellen der Worker sähen es nicht)
+AI_PONDER = True
+# screens without animation sleep until input arrives, at most this long (ms) /
+# Bildschirme ohne Animation schlafen bis zur nächsten Eingabe, höchstens so lange (ms)
+IDLE_WAIT_MS = 500
+# while also waiting for the network, the socket is checked this often (ms) /
+# wird zusätzlich auf das Netzwerk gewartet, wird der Socket so oft geprüft (ms)
+NET_POLL_MS = 30
 RULESET_OPTIONS = ["Entschärft", "Turnier"]
 START_BG_FILENAME = "background.png"
 
@@ -47,6 +77,27 @@ LANG_ORDER = ["de", "en", "fr", "es"]
 DEBUG_OVERLAY = False
 _start_bg_cache = {"size": None, "surface": None, "load_failed": False}
 
+# fonts by (name, size) and rendered texts, least recently used are dropped first /
+# Schriften nach (Name, Größe) und gerenderte Texte, die am längsten ungenutzten fliegen zuerst
+FONT_CACHE_SIZE = 32
+TEXT_CACHE_SIZE = 512
+_font_cache = OrderedDict()
+_text_cache = OrderedDict()
+
+
+def get_font(size, name="FreeSans"):
+    """pygame-Schrift aus dem Cache (SysFont sucht sonst jedes Mal die Systemschriften ab)."""
+    key = (name, size)
+    f = _font_cache.get(key)
+    if f is None:
+        f = pygame.font.SysFont(name, size)
+        _font_cache[key] = f
+        if len(_font_cache) > FONT_CACHE_SIZE:
+            _font_cache.popitem(last=False)
+    else:
+        _font_cache.move_to_end(key)
+    return f
+
 
 def get_start_background_surface():
     if _start_bg_cache["load_failed"]:
@@ -84,6 +135,31 @@ def toggle_debug_overlay():
     global DEBUG_OVERLAY
     DEBUG_OVERLAY = not DEBUG_OVERLAY
 
+def wait_events(timeout=IDLE_WAIT_MS, sock=None):
+    """Alle anstehenden Ereignisse; ist keins da, wird bis zu timeout ms auf das nächste
+    gewartet (mit sock: oder bis der Socket lesbar ist), statt mit FPS leer zu drehen."""
+    events = pygame.event.get()
+    end = pygame.time.get_ticks() + max(0, timeout)
+    while not events:
+        left = end - pygame.time.get_ticks()
+        event = pygame.event.wait(max(1, min(left, NET_POLL_MS) if sock is not None else left))
+        if event.type != pygame.NOEVENT:
+            events = [event] + pygame.event.get()
+            break
+        if sock is not None:
+            try:
+                if select.select([sock], [], [], 0)[0]:
+                    break
+            except Exception:
+                break
+        if pygame.time.get_ticks() >= end:
+            break
+    # an uncovered window is drawn in full again /
+    # ein wieder aufgedecktes Fenster wird vollständig neu gezeichnet
+    if any(event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED) for event in events):
+        invalidate_screen()
+    return events
+
 def draw_debug_overlay(screen, lines, *, pos=(8, 8)):
     try:
         if not DEBUG_OVERLAY:
@@ -95,7 +171,7 @@ def draw_debug_overlay(screen, lines, *, pos=(8, 8)):
         screen.blit(bg, pos)
         # Small font / 
         # Kleine Schrift
-        f = pygame.font.SysFont("FreeMono", 14)
+        f = get_font(14, "FreeMono")
         y = pos[1] + 6
         x = pos[0] + 8
         for line in lines[:12]:
@@ -108,6 +184,207 @@ def draw_debug_overlay(screen, lines, *, pos=(8, 8)):
     except Exception:
         pass
 
+# bumped whenever something draws over the whole screen outside a BoardRenderer /
+# (dialogs), so the next frame is drawn in full /
+# wird erhöht, wenn etwas außerhalb eines BoardRenderer über den ganzen Bildschirm zeichnet
+# (Dialoge), damit der nächste Frame vollständig gezeichnet wird
+_screen_epoch = 0
+
+def invalidate_screen():
+    global _screen_epoch
+    _screen_epoch += 1
+
+# stones, points and rings are drawn this many times larger and scaled down (anti-aliasing) /
+# Steine, Punkte und Ringe werden so viel größer gezeichnet und verkleinert (Kantenglättung)
+SPRITE_SUPERSAMPLE = 4
+# sprites per (radius, colour, width, rim); the radii follow board_scale /
+# Sprites je (Radius, Farbe, Breite, Rand); die Radien folgen board_scale
+_sprite_cache = {}
+
+def get_circle_sprite(radius, color, width=0, rim=None):
+    """Kantengeglätteter Kreis als Sprite (Seitenlänge 2 * radius + 3, Mittelpunkt in der Mitte).
+    width 0 = gefüllt, sonst Ring dieser Breite; rim = (Farbe, Breite) zeichnet einen Rand."""
+    key = (radius, tuple(color), width, rim)
+    sprite = _sprite_cache.get(key)
+    if sprite is None:
+        ss = SPRITE_SUPERSAMPLE
+        size = 2 * radius + 3
+        big = pygame.Surface((size * ss, size * ss), pygame.SRCALPHA)
+        # transparent pixels carry the edge colour, so scaling leaves no dark fringe /
+        # transparente Pixel tragen die Randfarbe, damit das Verkleinern keinen dunklen Saum hinterlässt
+        edge = rim[0] if rim else color
+        big.fill((*edge[:3], 0))
+        center = ((radius + 1) * ss + ss // 2,) * 2
+        outer = radius * ss + ss // 2
+        pygame.draw.circle(big, color, center, outer, width * ss)
+        if rim:
+            pygame.draw.circle(big, rim[0], center, outer, rim[1] * ss)
+        sprite = pygame.transform.smoothscale(big, (size, size))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        # run-length encoded alpha: transparent and opaque runs are copied, only edges blended /
+        # lauflängenkodiertes Alpha: transparente und deckende Strecken werden kopiert, nur Kanten gemischt
+        sprite.set_alpha(255, pygame.RLEACCEL)
+        _sprite_cache[key] = sprite
+    return sprite
+
+def blit_sprite(surface, sprite, center):
+    """Blittet sprite zentriert auf center."""
+    surface.blit(sprite, (center[0] - sprite.get_width() // 2, center[1] - sprite.get_height() // 2))
+
+# static board layers (background, lines, empty points) per window size and geometry /
+# statische Brett-Ebenen (Hintergrund, Linien, leere Punkte) je Fenstergröße und Geometrie
+_board_layer_cache = {}
+
+def get_board_layer(positions, lines, node_r, line_w):
+    key = (WIDTH, HEIGHT, tuple(positions), node_r, line_w)
+    layer = _board_layer_cache.get(key)
+    if layer is None:
+        layer = pygame.Surface((WIDTH, HEIGHT))
+        layer.fill((240, 220, 180))
+        for a, b in lines:
+            pygame.draw.line(layer, (120, 100, 80), positions[a], positions[b], line_w)
+        node = get_circle_sprite(node_r, (200, 180, 120), 3)
+        for pos in positions:
+            blit_sprite(layer, node, pos)
+        _board_layer_cache[key] = layer
+    return layer
+
+class BoardRenderer:
+    """Zeichnet Spielfeld-Frames über der zwischengespeicherten Brett-Ebene.
+    Ein Frame ist eine Liste von Bereichen (Name, Schlüssel, Rechteck, Zeichenfunktion):
+    neu gezeichnet werden nur Bereiche, deren Schlüssel sich seit dem letzten Frame geändert
+    hat (samt allem, was sie überlappen), gemeldet per pygame.display.update(Rechtecke).
+    Ohne Änderung wird nichts gezeichnet.
+    """
+
+    def __init__(self, screen, positions, lines, node_r, piece_r, select_r, line_w):
+        self.screen = screen
+        self.positions = positions
+        self.piece_r = piece_r
+        self.select_r = select_r
+        self.layer = get_board_layer(positions, lines, node_r, line_w)
+        # stones (same rim as the reserve rows), selection ring and anti-pendulum marker /
+        # Steine (gleicher Rand wie die Vorratsreihen), Auswahlring und Anti-Pendeln-Markierung
+        rim = ((100,90,70), 2)
+        self.stones = {1: get_circle_sprite(piece_r, (255,255,255), rim=rim), 2: get_circle_sprite(piece_r, (0,0,0), rim=rim)}
+        self.select_ring = get_circle_sprite(select_r, (0,220,0), 3)
+        self.mark_ring = get_circle_sprite(select_r, (220,40,40), 2)
+        # name -> (key, rect) of the frame on screen / Name -> (Schlüssel, Rechteck) des gezeigten Frames
+        self.shown = {}
+        self.epoch = None
+        self.lang = None
+
+    def invalidate(self):
+        self.shown = {}
+
+    def point_regions(self, st, selected=None, mark=None):
+        """Ein Bereich pro Punkt: Stein, Auswahlring, rote Anti-Pendeln-Markierung."""
+        regions = []
+        r = self.select_r + 3
+        for idx, (x, y) in enumerate(self.positions):
+            key = (st[idx], selected == idx, mark == idx)
+            regions.append((("point", idx), key, pygame.Rect(x - r, y - r, 2 * r + 1, 2 * r + 1),
+                            lambda x=x, y=y, key=key: self._draw_point(x, y, *key)))
+        return regions
+
+    def _draw_point(self, x, y, stone, is_selected, is_marked):
+        screen = self.screen
+        if is_selected:
+            blit_sprite(screen, self.select_ring, (x, y))
+        if stone:
+            blit_sprite(screen, self.stones[stone], (x, y))
+        if is_marked:
+            blit_sprite(screen, self.mark_ring, (x, y))
+
+    def counter_region(self, name, xs, y, remain, color):
+        """Vorratsreihe: Platzhalter auf den Slots xs, die ersten remain mit Steinen der Farbe color."""
+        r = self.piece_r
+
+        slot = get_circle_sprite(r, (185,180,160), rim=((140,130,110), 1))
+        stone = get_circle_sprite(r, color, rim=((100,90,70), 2))
+
+        def draw():
+            for i, x in enumerate(xs):
+                blit_sprite(self.screen, stone if i < remain else slot, (x, y))
+
+        return (name, remain, pygame.Rect(0, y - r - 2, WIDTH, 2 * r + 5), draw)
+
+    def text_region(self, name, text, color, y, base_size, max_width, min_size=18):
+        """Zentrierte Textzeile (render_fit_text) in einem Band der Höhe ~1.5 * base_size."""
+        def draw():
+            surf = render_fit_text(text, color, max_width=max_width, base_size=base_size, min_size=min_size)
+            self.screen.blit(surf, (WIDTH//2 - surf.get_width()//2, y))
+        return (name, (text, color), pygame.Rect(0, y, WIDTH, int(base_size * 1.5)), draw)
+
+    def column_region(self, name, items, color, x, mid_y, right=False):
+        """Drei kleine Zeilen (Text, max. Breite) um mid_y, links ab x oder rechtsbündig bis x."""
+        width = max(w for _, w in items)
+        rect = pygame.Rect(x - width if right else x, mid_y - 28, width, 60)
+
+        def draw():
+            for (text, max_width), dy in zip(items, (-28, -8, 10)):
+                surf = render_fit_text(text, color, max_width=max_width, base_size=16, min_size=12)
+                self.screen.blit(surf, (x - surf.get_width() if right else x, mid_y + dy))
+
+        return (name, (items, color), rect, draw)
+
+    def debug_regions(self, lines):
+        """Debug-Overlay als Bereich (leer, wenn es ausgeschaltet ist)."""
+        if not DEBUG_OVERLAY:
+            return []
+        pos = (8, 8)
+        rect = pygame.Rect(pos, (min(420, WIDTH-16), min(220, HEIGHT-16)))
+        return [("debug", tuple(lines), rect, lambda: draw_debug_overlay(self.screen, lines, pos=pos))]
+
+    def draw(self, regions):
+        """Zeichnet den Frame regions (später in der Liste = weiter oben)."""
+        screen, layer = self.screen, self.layer
+        if self.epoch != _screen_epoch or self.lang != CURRENT_LANG or not self.shown:
+            # full frame: new view, dialog or language change /
+            # voller Frame: neue Ansicht, Dialog oder Sprachwechsel
+            screen.blit(layer, (0, 0))
+            for _, _, _, draw in regions:
+                draw()
+            self.shown = {name: (key, rect) for name, key, rect, _ in regions}
+            self.epoch = _screen_epoch
+            self.lang = CURRENT_LANG
+            pygame.display.flip()
+            return
+        names = set()
+        rects = []
+        for name, key, rect, _ in regions:
+            names.add(name)
+            old = self.shown.get(name)
+            if old is None or old[0] != key:
+                rects.append(rect)
+                if old is not None and old[1] != rect:
+                    rects.append(old[1])
+        # regions that are gone are cleared / weggefallene Bereiche werden geleert
+        for name, (_, rect) in self.shown.items():
+            if name not in names:
+                rects.append(rect)
+        if not rects:
+            return
+        # whatever overlaps a redrawn area is redrawn too /
+        # was einen neu gezeichneten Bereich überlappt, wird mitgezeichnet
+        dirty = set()
+        changed = True
+        while changed:
+            changed = False
+            for i, (_, _, rect, _) in enumerate(regions):
+                if i not in dirty and rect.collidelist(rects) >= 0:
+                    dirty.add(i)
+                    rects.append(rect)
+                    changed = True
+        for rect in rects:
+            screen.blit(layer, rect, rect)
+        for i, (_, _, _, draw) in enumerate(regions):
+            if i in dirty:
+                draw()
+        self.shown = {name: (key, rect) for name, key, rect, _ in regions}
+        pygame.display.update(rects)
+
 def toggle_language():
     """Wechselt die Sprache zyklisch durch LANG_ORDER."""
     global CURRENT_LANG
@@ -116,6 +393,9 @@ def toggle_language():
     except ValueError:
         i = 0
     CURRENT_LANG = LANG_ORDER[(i + 1) % len(LANG_ORDER)]
+    # translations remembered by tr() belong to the previous language /
+    # die von tr() gemerkten Übersetzungen gehören zur vorigen Sprache
+    _tr_memo.clear()
 
 def get_menu_options():
     # Base (german) as key;
@@ -201,9 +481,11 @@ SUBS_EN = [
     # selection dialogue / Auswahl-Dialoge
     ("Spielstärke wählen", "Choose difficulty"),
     ("Regelset wählen", "Choose ruleset"),
+    ("Bedenkzeit wählen", "Choose think time"),
     ("Leicht", "Easy"),
     ("Mittel", "Medium"),
     ("Schwer", "Hard"),
+    ("Monte Carlo", "Monte Carlo"),
     ("Entschärft", "Relaxed"),
     ("Turnier", "Tournament"),
     ("↑/↓ wählen, Enter bestätigen, ESC abbrechen", "↑/↓ to choose, Enter to confirm, ESC to cancel"),
@@ -279,9 +561,11 @@ SUBS_FR = [
     ("Mensch", "Humain"),
     ("Spielstärke wählen", "Choisir la difficulté"),
     ("Regelset wählen", "Choisir le jeu de règles"),
+    ("Bedenkzeit wählen", "Choisir le temps de réflexion"),
     ("Leicht", "Facile"),
     ("Mittel", "Moyen"),
     ("Schwer", "Difficile"),
+    ("Monte Carlo", "Monte-Carlo"),
     ("Entschärft", "Allégé"),
     ("Turnier", "Tournoi"),
     ("↑/↓ wählen, Enter bestätigen, ESC abbrechen", "↑/↓ choisir, Entrée valider, ESC annuler"),
@@ -317,9 +601,11 @@ SUBS_ES = [
     ("Mensch", "Humano"),
     ("Spielstärke wählen", "Elegir dificultad"),
     ("Regelset wählen", "Elegir reglas"),
+    ("Bedenkzeit wählen", "Elegir tiempo de reflexión"),
     ("Leicht", "Fácil"),
     ("Mittel", "Medio"),
     ("Schwer", "Difícil"),
+    ("Monte Carlo", "Montecarlo"),
     ("Entschärft", "Suavizado"),
     ("Turnier", "Torneo"),
     ("↑/↓ wählen, Enter bestätigen, ESC abbrechen", "↑/↓ elegir, Enter confirmar, ESC cancelar"),
@@ -528,12 +814,36 @@ SUBS_MAP = {"en": SUBS_EN, "fr": SUBS_FR, "es": SUBS_ES}
 # Beibehaltener Name für rückwärtskompatible Nutzung im Code (falls irgendwo referenziert)
 TRANSLATION_SUBS = SUBS_EN
 
+# per language: (regex of all German phrases, phrase -> translation) and translated texts /
+# pro Sprache: (Regex aller deutschen Phrasen, Phrase -> Übersetzung) und übersetzte Texte
+_tr_tables = {}
+_tr_memo = {}
+
+def compile_translation(lang):
+    """Übersetzungstabelle einer Sprache: SUBS_MAP[lang], ergänzt um fehlende englische
+    Paare, als ein Regex (längste Phrase zuerst) und ein dict. None für Deutsch."""
+    subs = SUBS_MAP.get(lang) or []
+    # just in case: add english substitutions as fallback /
+    # incomplete SUBS_FR/SUBS_ES are thus sensibly supplemented; /
+    # the first pair of a phrase wins /
+    # Fehlende Ersetzungen durch die englische Liste ergänzen. So werden
+    # unvollständige SUBS_FR/SUBS_ES sinnvoll ergänzt; das erste Paar einer Phrase gilt
+    table = {}
+    for de_src, tgt in list(subs) + (SUBS_EN if lang != "en" else []):
+        table.setdefault(de_src, tgt)
+    if not table:
+        return None
+    pattern = re.compile("|".join(re.escape(de_src) for de_src in sorted(table, key=len, reverse=True)))
+    return pattern, table
+
 def tr(text: str) -> str:
     """Einfache Laufzeit-Übersetzung.
     Strategie:
       - Deutsch ist Quellsprache
       - Für en/fr/es gibt es separate Ersetzungslisten (Teilstrings)
       - Längste Phrasen zuerst, um Kollisionen zu minimieren
+      - Tabellen werden pro Sprache einmal kompiliert, Ergebnisse gemerkt
+        (toggle_language leert den Speicher)
       - Fallback: Wenn keine passende Liste vorhanden, Original zurück
     
     """
@@ -541,51 +851,42 @@ def tr(text: str) -> str:
         return text
     if CURRENT_LANG == "de":
         return text
-    # try to get substitution list for current language /
-    # Versuche die substitutionsliste für die aktuelle Sprache
-    subs = SUBS_MAP.get(CURRENT_LANG) or []
-
-    # just in case: add english substitutions as fallback /
-    # replace missing translations with english ones as fallback /
-    # incomplete SUBS_FR/SUBS_ES are thus sensibly supplemented. /
-    # Falls die aktuelle Sprache nicht Englisch ist, ergänze fehlende
-    # Ersetzungen durch die englische Liste als Fallback. So werden
-    # unvollständige SUBS_FR/SUBS_ES sinnvoll ergänzt.
-    combined = list(subs)
-    if CURRENT_LANG != "en":
-        # add missing english pairs not available in subs /
-        # existing pairs compared as pair; order later by length /
-        # Füge nur solche englischen Paare hinzu, die nicht bereits in subs
-        # vorhanden sind (Vergleich als Paar). Reihenfolge später nach Länge.
-        for pair in SUBS_EN:
-            if pair not in combined:
-                combined.append(pair)
-
-    if not combined:
+    s = _tr_memo.get(text)
+    if s is not None:
+        return s
+    if CURRENT_LANG not in _tr_tables:
+        _tr_tables[CURRENT_LANG] = compile_translation(CURRENT_LANG)
+    compiled = _tr_tables[CURRENT_LANG]
+    if compiled is None:
         return text
-
-    s = text
-    for de_src, tgt in sorted(combined, key=lambda p: len(p[0]), reverse=True):
-        s = s.replace(de_src, tgt)
+    pattern, table = compiled
+    s = pattern.sub(lambda m: table[m.group()], text)
+    _tr_memo[text] = s
     return s
 
 # helper: text rendering that fits within a target width (font is scaled down) /
 # Helfer: Text so rendern, dass er maximal eine Zielbreite nutzt (Schrift wird verkleinert)
 def render_fit_text(text, color, max_width, base_size=FONT_SIZE, min_size=18, font_name="FreeSans"):
+    # the same text in the same language is rendered only once /
+    # derselbe Text in derselben Sprache wird nur einmal gerendert
+    key = (text, tuple(color), max_width, base_size, min_size, font_name, CURRENT_LANG)
+    surf = _text_cache.get(key)
+    if surf is not None:
+        _text_cache.move_to_end(key)
+        return surf
     # runtime translation applied /
     # Laufzeit-Übersetzung anwenden
     text = tr(text)
+    # measure (without rendering) until it fits; fallback: minimum size /
+    # messen (ohne zu rendern), bis es passt; Fallback: minimale Größe
     size = base_size
-    while size >= min_size:
-        f = pygame.font.SysFont(font_name, size)
-        surf = f.render(text, True, color)
-        if surf.get_width() <= max_width:
-            return surf
+    while size > min_size and get_font(size, font_name).size(text)[0] > max_width:
         size -= 2
-    # fallback: minimum size
-    # Fallback: minimale Größe
-    f = pygame.font.SysFont(font_name, min_size)
-    return f.render(text, True, color)
+    surf = get_font(max(size, min_size), font_name).render(text, True, color)
+    _text_cache[key] = surf
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surf
 
 def confirm_abort(prompt="Spiel wirklich beenden?"):
     """Zeigt einen modalen Bestätigungsdialog (Ja/Nein) über dem aktuellen Screen.
@@ -596,6 +897,9 @@ def confirm_abort(prompt="Spiel wirklich beenden?"):
         # if no active screen, abort safely
         # Falls kein aktiver Screen vorhanden ist, breche sicherheitshalber ab
         return False
+    # the dialog covers the board: the next frame is drawn in full /
+    # der Dialog verdeckt das Brett: der nächste Frame wird vollständig gezeichnet
+    invalidate_screen()
     # half-transparent overlay with question /
     # Halbtransparenter Overlay mit Frage
     overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
@@ -608,7 +912,7 @@ def confirm_abort(prompt="Spiel wirklich beenden?"):
     pygame.display.flip()
     clock = pygame.time.Clock()
     while True:
-        for ev in pygame.event.get():
+        for ev in wait_events():
             if ev.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             if ev.type == pygame.KEYDOWN:
@@ -620,7 +924,6 @@ def confirm_abort(prompt="Spiel wirklich beenden?"):
 
 def draw_menu(screen, font, selected_idx):
     draw_pre_game_background(screen, overlay_alpha=120)
-    title_font = pygame.font.SysFont("FreeSans", 64)
     title_surf = render_fit_text("Mühle", (255,255,255), max_width=WIDTH-60, base_size=64, min_size=28)
     screen.blit(title_surf, (WIDTH//2 - title_surf.get_width()//2, 60))
     options = get_menu_options()
@@ -644,8 +947,6 @@ def get_menu_item_at_pos(pos, font):
     return None
 
 def würfeln_view(screen, font, clock):
-    info_font = pygame.font.SysFont("FreeSans", 36)
-    result_font = pygame.font.SysFont("FreeSans", 54)
     mensch_wurf = None
     # keeps internal variable / 
     # bleibt interne Variable
@@ -699,7 +1000,7 @@ def würfeln_view(screen, font, clock):
                 screen.blit(cont_txt, (WIDTH//2 - cont_txt.get_width()//2, 500))
                 nachwurf = True
         pygame.display.flip()
-        for event in pygame.event.get():
+        for event in wait_events():
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             elif event.type == pygame.KEYDOWN:
@@ -730,10 +1031,8 @@ def spielfeld_view(screen, font, clock, starter, state=None, stones_set=None):
     # note: SL difficulty is set from global state if present /
     # Hinweis: SL-Schwierigkeit wird aus globalem Zustand gesetzt, wenn vorhanden
     difficulty = globals().get("CURRENT_DIFFICULTY", "Leicht")
+    think_time = THINK_TIME_SECONDS.get(globals().get("CURRENT_THINK_TIME"), THINK_TIME_SECONDS[THINK_TIME_OPTIONS[0]])
     ruleset = globals().get("CURRENT_RULESET", "Entschärft")
-    # cancel flag for ESC confirmation /
-    # Abbruch-Flag für ESC-Bestätigung
-    aborted = False
     # scaling relative to base 800x800 /
     # Skalierung relativ zur Basis 800x800
     ui_scale = max(0.6, min(WIDTH, HEIGHT) / 800.0)
@@ -742,7 +1041,6 @@ def spielfeld_view(screen, font, clock, starter, state=None, stones_set=None):
     # Grundabstände (anpassbar wie gewünscht)
     # Infozeile 15px weiter nach oben, ohne das obere Lager zu verschieben
     INFO_Y = max(10, int(30 * ui_scale) - 35)
-    COUNTER_MARGIN = int(40 * ui_scale)
     # basepositions as before, then apply desired offsets /
     # Basispositionen wie zuvor, dann gewünschte Offsets anwenden
     base_top = max(INFO_Y + 40, int(90 * ui_scale) - 20)
@@ -770,48 +1068,26 @@ def spielfeld_view(screen, font, clock, starter, state=None, stones_set=None):
     # - Schwarze/weiße Steine ~1.5x größer (~24)
     NODE_R = max(8, int(16 * board_scale))
     PIECE_R = max(12, int(24 * board_scale))
-    # backward compatibility for existing uses / 
-    # Backward-Kompatibilität für existierende Verwendungen
-    STONE_R = PIECE_R
     HIT_R = max(14, int(27 * board_scale))
     SELECT_R = max(PIECE_R + 6, int(28 * board_scale))
     LINE_W = max(2, int(5 * board_scale))
-    # definitions of all mills (each 3 positions) /
-    # Definition aller Mühlen (jeweils 3 Felder)
-    muhlen = [
-        # rings: outer
-        # Ringe: außen
-        [0,1,2], [2,3,4], [4,5,6], [6,7,0],
-        # middle
-        # mitte
-        [8,9,10], [10,11,12], [12,13,14], [14,15,8],
-        # inner
-        # innen
-        [16,17,18], [18,19,20], [20,21,22], [22,23,16],
-        # valid vertical and horizontal middle lines:
-        # gültige Vertikale und Horizontale Mittellinien:
-        [1,9,17], [3,11,19], [5,13,21], [7,15,23]
-        # corners are invalid mill connections:
-        # Eckpunkte sind ungültige mühle verbindungen:
-        # [0,8,16], [2,10,18], [4,12,20], [6,14,22]
-    ]
-
-    # 0: empty, 1: white, 2: black /
-    # 0: leer, 1: weiß, 2: schwarz
+    # game state: rules live in morris_game (no pygame) /
+    # Spielzustand: Regeln liegen in morris_game (ohne pygame)
     if state is None:
-        state = [0]*24
-    if stones_set is None:
-        stones_set = [0, 0]  # [white, black] / [weiß, schwarz]
+        game = morris_game.MorrisGame(ruleset)
+    else:
+        game = morris_game.MorrisGame.from_state(state, stones_set, ruleset=ruleset)
+    # 0: empty, 1: white, 2: black (display copy) /
+    # 0: leer, 1: weiß, 2: schwarz (Anzeigekopie)
+    state = game.state
+    stones_set = game.stones_set  # [white, black] / [weiß, schwarz]
     # here must be SL not ki or ai /
     # hier muss SL stehen nicht ki oder ai
     if starter == "SL":
-        current_player = 1
         player_types = {1: "SL", 2: "Mensch"}
     elif starter == "Spieler":
-        current_player = 1
         player_types = {1: "Mensch", 2: "SL"}
     else:
-        current_player = 1
         player_types = {1: "Mensch", 2: "SL"}
 
     # label for player with color (e.g., "Mensch (Weiß)", "SL (Schwarz)") /
@@ -819,112 +1095,24 @@ def spielfeld_view(screen, font, clock, starter, state=None, stones_set=None):
     def label_for(p):
         return f"{player_types[p]} ({'Weiß' if p==1 else 'Schwarz'})"
 
-    # helper to draw the supply stones (top/bottom) /
-    # Helfer zum Zeichnen der Vorratssteine (oben/unten)
-    def draw_counters():
-        # fixed borders: 50px left/right, 9 slots evenly spaced /
-        # Feste Ränder: 50px links/rechts, 9 Slots gleichmäßig verteilt
-            left_margin = 50
-            right_margin = 50
-            steps = 8  # 9 stones -> 8 gaps / 9 Steine -> 8 Abstände
-            width_avail = max(1, WIDTH - left_margin - right_margin)
-            spacing = max(PIECE_R*2 + 6, width_avail // steps)
-            start_x = left_margin
-            r = PIECE_R
-            total = 9
-            # upper: placeholder, then white stones /
-            # oben: Platzhalter, dann weiße Steine
-            remain_w = max(0, total - stones_set[0])
-            y_top = COUNTER_Y_TOP
-            for i in range(9):
-                x = start_x + i*spacing
-                pygame.draw.circle(screen, (185,180,160), (x, y_top), r, 0)
-                pygame.draw.circle(screen, (140,130,110), (x, y_top), r, 1)
-            for i in range(remain_w):
-                x = start_x + i*spacing
-                pygame.draw.circle(screen, (255,255,255), (x, y_top), r, 0)
-                pygame.draw.circle(screen, (100,90,70), (x, y_top), r, 2)
-            # bottom: placeholder, then black stones /
-            # unten: Platzhalter, dann schwarze Steine
-            remain_b = max(0, total - stones_set[1])
-            y_bot = COUNTER_Y_BOT
-            for i in range(9):
-                x = start_x + i*spacing
-                pygame.draw.circle(screen, (185,180,160), (x, y_bot), r, 0)
-                pygame.draw.circle(screen, (140,130,110), (x, y_bot), r, 1)
-            for i in range(remain_b):
-                x = start_x + i*spacing
-                pygame.draw.circle(screen, (0,0,0), (x, y_bot), r, 0)
-                pygame.draw.circle(screen, (100,90,70), (x, y_bot), r, 2)
-
-    # mill status tracking per player /
-    # Mühlen-Status pro Spieler speichern
-    last_mills = {1: set(), 2: set()}
-    def check_muehle(pos, player):
-        # check all actual mills for this player /
-        # Ermittele alle aktuell bestehenden Mühlen dieses Spielers
-        current = {i for i, m in enumerate(muhlen) if all(state[j] == player for j in m)}
-        # new mills are those that were not there before and contain the last placed/moved position /
-        # Neue Mühlen sind die, die vorher nicht da waren und die die zuletzt gesetzte/gezogene Position enthalten
-        created = {i for i in current if pos in muhlen[i]} - last_mills[player]
-        # update the stored mill state /
-        # Update des gespeicherten Mühlenzustands
-        last_mills[player] = current
-        return len(created) > 0
-
-    def remove_opponent_stone(player):
-        nonlocal aborted
-        opponent = 2 if player == 1 else 1
-        candidates = [i for i in range(24) if state[i] == opponent and not any(all(state[j]==opponent for j in m) for m in muhlen if i in m)]
-        if not candidates:
-            candidates = [i for i in range(24) if state[i] == opponent]
-        if player_types[player] == "Mensch":
-            removing = True
-            while removing:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit(); sys.exit()
-                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                        if confirm_abort():
-                            aborted = True
-                            return False
-                    elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                        mx, my = event.pos
-                        for idx in candidates:
-                            x, y = positions[idx]
-                            if (mx-x)**2 + (my-y)**2 < HIT_R**2:
-                                state[idx] = 0
-                                removing = False
-                                return True
-                screen.fill((240, 220, 180))
-                for a, b in lines:
-                    pygame.draw.line(screen, (120, 100, 80), positions[a], positions[b], 5)
-                for idx2, (x2, y2) in enumerate(positions):
-                    color = (200, 180, 120)
-                    if state[idx2] == 1:
-                        color = (255, 255, 255)
-                    elif state[idx2] == 2:
-                        color = (0, 0, 0)
-                    rad = PIECE_R if state[idx2] else NODE_R
-                    pygame.draw.circle(screen, color, (x2, y2), rad, 0 if state[idx2] else 3)
-                info = "Mühle! Wähle einen gegnerischen Stein zum Entfernen."
-                info_surf = render_fit_text(info, (200,40,40), max_width=WIDTH-100, base_size=28, min_size=18)
-                screen.blit(info_surf, (WIDTH//2 - info_surf.get_width()//2, INFO_Y))
-                draw_counters()
-                pygame.display.flip()
-                clock.tick(FPS)
-        else:
-            non_mill = [i for i in range(24) if state[i] == opponent and not any(all(state[j]==opponent for j in m) for m in muhlen if i in m)]
-            if non_mill:
-                idx = random.choice(non_mill)
-                state[idx] = 0
-                return True
-            all_opponent = [i for i in range(24) if state[i] == opponent]
-            if all_opponent:
-                idx = random.choice(all_opponent)
-                state[idx] = 0
-                return True
-            return False
+    # supply stones (top/bottom) as renderer regions /
+    # pending: player whose placed stone is not yet counted (mill, removal open) /
+    # Vorratssteine (oben/unten) als Bereiche des Renderers
+    # pending: Spieler, dessen gesetzter Stein noch nicht gezählt ist (Mühle, Entfernen offen)
+    # fixed borders: 50px left/right, 9 slots evenly spaced /
+    # Feste Ränder: 50px links/rechts, 9 Slots gleichmäßig verteilt
+    counter_spacing = max(PIECE_R*2 + 6, max(1, WIDTH - 50 - 50) // 8)
+    counter_xs = [50 + i*counter_spacing for i in range(9)]
+
+    def counter_regions(pending=None):
+        # upper: white stones, bottom: black stones /
+        # oben: weiße Steine, unten: schwarze Steine
+        remain_w = max(0, 9 - stones_set[0] - (pending == 1))
+        remain_b = max(0, 9 - stones_set[1] - (pending == 2))
+        return [
+            renderer.counter_region("counter_w", counter_xs, COUNTER_Y_TOP, remain_w, (255,255,255)),
+            renderer.counter_region("counter_b", counter_xs, COUNTER_Y_BOT, remain_b, (0,0,0)),
+        ]
 
     cx = WIDTH // 2
     cy = int((top_free + bottom_free) // 2)
@@ -942,101 +1130,189 @@ def spielfeld_view(screen, font, clock, starter, state=None, stones_set=None):
         (cx-inner, cy-inner), (cx, cy-inner), (cx+inner, cy-inner),
         (cx+inner, cy), (cx+inner, cy+inner), (cx, cy+inner), (cx-inner, cy+inner), (cx-inner, cy)
     ]
-    lines = [
-        (0,1),(1,2),(2,3),(3,4),(4,5),(5,6),(6,7),(7,0),
-        (8,9),(9,10),(10,11),(11,12),(12,13),(13,14),(14,15),(15,8),
-        (16,17),(17,18),(18,19),(19,20),(20,21),(21,22),(22,23),(23,16),
-        (1,9),(3,11),(5,13),(7,15),
-        (9,17),(11,19),(13,21),(15,23)
-    ]
+    lines = morris_board.LINES
+    # background, lines and empty points are drawn once (cached per window size); /
+    # frames only redraw what changed /
+    # Hintergrund, Linien und leere Punkte werden einmal gezeichnet (je Fenstergröße
+    # zwischengespeichert); Frames zeichnen nur Geändertes neu
+    renderer = BoardRenderer(screen, positions, lines, NODE_R, PIECE_R, SELECT_R, LINE_W)
+
+    # board regions (stones, selection) /
+    # Brett-Bereiche (Steine, Auswahl)
+    def board_regions(st, selected=None):
+        # anti-pendulum: mark forbidden retreat target red /
+        # only if last moved stone is currently selected
+        # Anti-Pendeln: markiere nur das verbotene Rückzugs-Zielfeld rot,
+        # und nur wenn der zuletzt gezogene Stein aktuell ausgewählt ist
+        mark = None
+        if ruleset == "Turnier" and selected is not None:
+            # mv = (from, to) of current player /
+            # mv = (from, to) des aktuellen Spielers
+            mv = game.last_move_by.get(game.current_player, (-1, -1))
+            if selected == mv[1] and mv[0] >= 0:
+                mark = mv[0]
+        return renderer.point_regions(st, selected, mark)
+
+
+    # board after a move whose removal is still open /
+    # Brett nach einem Zug, dessen Entfernen noch offen ist
+    def preview_state(frm, to, player):
+        st = game.state
+        if frm >= 0:
+            st[frm] = 0
+        st[to] = player
+        return st
+
+    def show_removal_info(st, player, pending):
+        info2 = f"{label_for(player)} entfernt einen Stein"
+        renderer.draw(board_regions(st)
+                      + [renderer.text_region("info", info2, (200,40,40), INFO_Y, 28, WIDTH-100)]
+                      + counter_regions(pending))
+
+    # human picks opponent stone to remove; None if aborted /
+    # Mensch wählt gegnerischen Stein zum Entfernen; None bei Abbruch
+    def choose_removal(st, player, pending):
+        candidates = game.removal_candidates(player)
+        if not candidates:
+            return -1
+        while True:
+            for event in wait_events():
+                if event.type == pygame.QUIT:
+                    pygame.quit(); sys.exit()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    if confirm_abort():
+                        return None
+                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    mx, my = event.pos
+                    for idx in candidates:
+                        x, y = positions[idx]
+                        if (mx-x)**2 + (my-y)**2 < HIT_R**2:
+                            return idx
+            info = "Mühle! Wähle einen gegnerischen Stein zum Entfernen."
+            renderer.draw(board_regions(st)
+                          + [renderer.text_region("info", info, (200,40,40), INFO_Y, 28, WIDTH-100)]
+                          + counter_regions(pending))
+            clock.tick(FPS)
+
+    # place (frm = -1) or move a stone for the human, removal included; False if aborted /
+    # Stein für den Menschen setzen (frm = -1) oder ziehen, inkl. Entfernen; False bei Abbruch
+    def human_move(frm, to):
+        player = game.current_player
+        pending = player if frm < 0 else None
+        rem = -1
+        if game.forms_mill(frm, to):
+            st = preview_state(frm, to, player)
+            show_removal_info(st, player, pending)
+            rem = choose_removal(st, player, pending)
+            if rem is None:
+                return False
+        game.apply((frm, to, rem))
+        return True
+
+    # wait ms while handling events, redraw after a declined abort; False if aborted /
+    # ms warten und dabei Ereignisse bearbeiten, nach abgelehntem Abbruch neu zeichnen; False bei Abbruch
+    def wait_responsive(ms, redraw):
+        end = pygame.time.get_ticks() + ms
+        while pygame.time.get_ticks() < end:
+            for event in wait_events(end - pygame.time.get_ticks()):
+                if event.type == pygame.QUIT:
+                    pygame.quit(); sys.exit()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    if confirm_abort():
+                        return False
+                    redraw()
+            clock.tick(FPS)
+        return True
+
+    # AI search runs in a background thread, the frame loop polls it every frame /
+    # SL-Suche läuft in einem Hintergrund-Thread, die Bildschleife fragt sie jeden Frame ab
+    think = None
+    # pondering during the human's turn ("Schwer" with one worker only) /
+    # Pondern während des Menschen-Zuges (nur "Schwer" mit einem Worker)
+    ponder = None
+    can_ponder = AI_PONDER and difficulty == "Schwer" and morris_pool.worker_count(AI_WORKERS) == 1
+
+    def ponder_poll():
+        nonlocal ponder
+        if ponder is None and can_ponder and game.result() is None:
+            ponder = morris_ai.Ponder(game)
+
+    def ponder_stop():
+        nonlocal ponder
+        if ponder is not None:
+            ponder.stop()
+            ponder = None
+
+    # one frame of the AI move (morris_ai), removal included; False if aborted /
+    # ein Frame des SL-Zuges (morris_ai), inkl. Entfernen; False bei Abbruch
+    def ai_poll(mill_wait):
+        nonlocal think, ponder
+        if think is None:
+            # predicted human move: the pondered time counts /
+            # vorausgesagter Menschen-Zug: die geponderte Zeit zählt mit
+            limit = think_time
+            if ponder is not None:
+                ponder.stop()
+                limit = ponder.time_left(game, think_time, AI_WORKERS)
+                ponder = None
+            think = morris_ai.ThinkHandle(game, difficulty, time_limit=limit, workers=AI_WORKERS)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                think.cancel()
+                pygame.quit(); sys.exit()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                if confirm_abort():
+                    think.cancel()
+                    think = None
+                    return False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_d:
+                toggle_debug_overlay()
+        # searching levels think for the whole budget; faster levels wait for the minimum /
+        # suchende Stufen denken das ganze Budget; schnellere Stufen warten die Mindestdauer ab
+        if not think.done() or think.elapsed() * 1000 < AI_MIN_MOVE_MS:
+            return True
+        move = think.result()
+        think = None
+        if move is None:
+            return True
+        player = game.current_player
+        frm, to, rem = move
+        if rem >= 0:
+            pending = player if frm < 0 else None
+            st = preview_state(frm, to, player)
+            show_removal_info(st, player, pending)
+            if not wait_responsive(mill_wait, lambda: show_removal_info(st, player, pending)):
+                return False
+        game.apply(move)
+        return True
 
-    # helper functions for AI decisions /
-    # Hilfsfunktionen für SL-Entscheidungen
-    def line_forms_mill_if_place(idx, player):
-        for m in muhlen:
-            if idx in m and all((state[k] == player) for k in m if k != idx) and state[idx] == 0:
-                return True
-        return False
-    def find_block_positions(player):
-        opponent = 2 if player == 1 else 1
-        blocks = []
-        for m in muhlen:
-            vals = [state[k] for k in m]
-            if vals.count(opponent) == 2 and vals.count(0) == 1:
-                empty_idx = m[vals.index(0)]
-                blocks.append(empty_idx)
-        return blocks
-    def count_mills_for(player):
-        return sum(1 for m in muhlen if all(state[k] == player for k in m))
-    def count_open_twos(player):
-        c = 0
-        for m in muhlen:
-            vals = [state[k] for k in m]
-            if vals.count(player) == 2 and vals.count(0) == 1:
-                c += 1
-        return c
-    def mobility(player):
-        stones = [i for i, v in enumerate(state) if v == player]
-        if len(stones) == 3:
-            return sum(1 for v in state if v == 0)
-        moves = 0
-        for i in stones:
-            for a, b in lines:
-                if a == i and state[b] == 0:
-                    moves += 1
-                elif b == i and state[a] == 0:
-                    moves += 1
-        return moves
-    def evaluate(player):
-        opponent = 2 if player == 1 else 1
-        return (
-            50 * count_mills_for(player)
-            + 12 * count_open_twos(player)
-            + 2 * mobility(player)
-            + 3 * sum(1 for v in state if v == player)
-            - 45 * count_mills_for(opponent)
-            - 12 * count_open_twos(opponent)
-            - 2 * mobility(opponent)
-            - 3 * sum(1 for v in state if v == opponent)
-        )
     # setphase loop /
     # Setzphase
-    setzphase = True
-    while setzphase:
-        # board drawing /
-        # Brett zeichnen
-        screen.fill((240, 220, 180))
-        for a, b in lines:
-            pygame.draw.line(screen, (120, 100, 80), positions[a], positions[b], LINE_W)
-        for idx, (x, y) in enumerate(positions):
-            color = (200, 180, 120)
-            if state[idx] == 1:
-                color = (255, 255, 255)
-            elif state[idx] == 2:
-                color = (0, 0, 0)
-            rad = PIECE_R if state[idx] else NODE_R
-            pygame.draw.circle(screen, color, (x, y), rad, 0 if state[idx] else 3)
-        # Info
+    while game.in_placement():
+        current_player = game.current_player
+        state = game.state
+        # board, info, counters, debug overlay (only changes are drawn) /
+        # Brett, Info, Vorrat, Debug-Overlay (nur Änderungen werden gezeichnet)
         info = f"Setzphase: {label_for(current_player)} setzt Stein ({stones_set[current_player-1]+1}/9)"
-        info_surf = render_fit_text(info, (60,40,20), max_width=WIDTH-60, base_size=FONT_SIZE)
-        screen.blit(info_surf, (WIDTH//2 - info_surf.get_width()//2, INFO_Y))
-        draw_counters()
-        # Debug-Overlay
-        draw_debug_overlay(screen, [
-            "Mode: Singleplayer",
-            "Phase: Setzphase",
-            f"Player: {current_player}",
-            f"stones_set: W={stones_set[0]} S={stones_set[1]}",
-        ])
-        pygame.display.flip()
+        renderer.draw(board_regions(state)
+                      + [renderer.text_region("info", info, (60,40,20), INFO_Y, FONT_SIZE, WIDTH-60)]
+                      + counter_regions()
+                      + renderer.debug_regions([
+                          "Mode: Singleplayer",
+                          "Phase: Setzphase",
+                          f"Player: {current_player}",
+                          f"stones_set: W={stones_set[0]} S={stones_set[1]}",
+                      ]))
         # Input handling /
         # Eingabe
         if player_types[current_player] == "Mensch":
-            for event in pygame.event.get():
+            ponder_poll()
+            for event in wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit(); sys.exit()
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     if confirm_abort():
+                        ponder_stop()
                         return None
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_d:
                     toggle_debug_overlay()
@@ -1044,236 +1320,50 @@ def spielfeld_view(screen, font, clock, starter, state=None, stones_set=None):
                     mx, my = event.pos
                     for idx, (x, y) in enumerate(positions):
                         if (mx-x)**2 + (my-y)**2 < HIT_R**2 and state[idx] == 0:
-                            state[idx] = current_player
-                            stones_set[current_player-1] += 1
-                            muehle_gebildet = check_muehle(idx, current_player)
-                            if muehle_gebildet:
-                                screen.fill((240, 220, 180))
-                                for a, b in lines:
-                                    pygame.draw.line(screen, (120, 100, 80), positions[a], positions[b], LINE_W)
-                                for idx2, (x2, y2) in enumerate(positions):
-                                    color = (200, 180, 120)
-                                    if state[idx2] == 1:
-                                        color = (255, 255, 255)
-                                    elif state[idx2] == 2:
-                                        color = (0, 0, 0)
-                                    rad = PIECE_R if state[idx2] else NODE_R
-                                    pygame.draw.circle(screen, color, (x2, y2), rad, 0 if state[idx2] else 3)
-                                info2 = f"{label_for(current_player)} entfernt einen Stein"
-                                info2_surf = render_fit_text(info2, (200,40,40), max_width=WIDTH-100, base_size=28, min_size=18)
-                                screen.blit(info2_surf, (WIDTH//2 - info2_surf.get_width()//2, INFO_Y))
-                                draw_counters()
-                                pygame.display.flip()
-                                remove_opponent_stone(current_player)
-                                if aborted:
-                                    return None
-                                # note: at setting phase there is no win by <3 stones /
-                                # after placing: always switch player; if both have 9, end setting phase and
-                                # opponent starts moving phase.
-                                # Hinweis: In der Setzphase gibt es keinen Sieg durch <3 Steine.
-                            # Nach dem Setzen: immer Spieler wechseln; falls beide 9 haben, endet Setzphase und
-                            # der Gegner beginnt die Zugphase.
-                            if stones_set[0] == 9 and stones_set[1] == 9:
-                                setzphase = False
-                            current_player = 2 if current_player == 1 else 1
+                            # note: at setting phase there is no win by <3 stones; /
+                            # after the last stone of both the moving phase starts /
+                            # Hinweis: In der Setzphase gibt es keinen Sieg durch <3 Steine;
+                            # nach dem letzten Stein beider Seiten beginnt die Zugphase
+                            if not human_move(-1, idx):
+                                ponder_stop()
+                                return None
                             break
+                    break
             clock.tick(FPS)
         else:
-            if stones_set[current_player-1] < 9:
-                freie = [i for i, v in enumerate(state) if v == 0]
-                if freie:
-                    # AI move at setting phase is dependent on difficulty
-                    # SL-Zug in Setzphase abhängig von Schwierigkeit wählen
-                    idx = None
-                    if difficulty == "Leicht":
-                        idx = random.choice(freie)
-                    elif difficulty == "Mittel":
-                        # 1) instantly form mill
-                        # 1) Sofort Mühle bilden
-                        mills_now = [p for p in freie if line_forms_mill_if_place(p, current_player)]
-                        if mills_now:
-                            idx = random.choice(mills_now)
-                        else:
-                            # 2) block opponent
-                            # 2) Blocken
-                            blocks = [p for p in find_block_positions(current_player) if p in freie]
-                            if blocks:
-                                idx = random.choice(blocks)
-                            else:
-                                idx = random.choice(freie)
-                    else:  # "difficult" / "Schwer"
-                        best_score = None
-                        best_choices = []
-                        for p in freie:
-                            # simulate place
-                            state[p] = current_player
-                            s = evaluate(current_player)
-                            state[p] = 0
-                            if best_score is None or s > best_score:
-                                best_score = s
-                                best_choices = [p]
-                            elif s == best_score:
-                                best_choices.append(p)
-                        idx = random.choice(best_choices) if best_choices else random.choice(freie)
-                    state[idx] = current_player
-                    stones_set[current_player-1] += 1
-                    muehle_gebildet = check_muehle(idx, current_player)
-                    if muehle_gebildet:
-                        screen.fill((240, 220, 180))
-                        for a, b in lines:
-                            pygame.draw.line(screen, (120, 100, 80), positions[a], positions[b], LINE_W)
-                        for idx2, (x2, y2) in enumerate(positions):
-                            color = (200, 180, 120)
-                            if state[idx2] == 1:
-                                color = (255, 255, 255)
-                            elif state[idx2] == 2:
-                                color = (0, 0, 0)
-                            rad = PIECE_R if state[idx2] else NODE_R
-                            pygame.draw.circle(screen, color, (x2, y2), rad, 0 if state[idx2] else 3)
-                        info2 = f"{label_for(current_player)} entfernt einen Stein"
-                        info2_surf = render_fit_text(info2, (200,40,40), max_width=WIDTH-100, base_size=28, min_size=18)
-                        screen.blit(info2_surf, (WIDTH//2 - info2_surf.get_width()//2, INFO_Y))
-                        draw_counters()
-                        pygame.display.flip()
-                        pygame.time.wait(900)
-                        remove_opponent_stone(current_player)
-                        if aborted:
-                            return None
-                        # note: at setting phase there is no win by <3 stones /
-                        # after placing: always switch player; if both have 9, end setting phase and
-                        # opponent starts moving phase.
-                        # Hinweis: In der Setzphase gibt es keinen Sieg durch <3 Steine.
-                    # Nach dem Setzen: immer Spieler wechseln; falls beide 9 haben, endet Setzphase und
-                    # der Gegner beginnt die Zugphase.
-                    if stones_set[0] == 9 and stones_set[1] == 9:
-                        setzphase = False
-                    current_player = 2 if current_player == 1 else 1
-                pygame.time.wait(400)
-            else:
-                current_player = 2 if current_player == 1 else 1
+            if not ai_poll(900):
+                return None
+            clock.tick(FPS)
     # no win checking in setting phase - conditions for winning only apply in moving phase
     # moving phase /
     # Kein Sieg-Ende in der Setzphase – Siegbedingungen gelten erst in der Zugphase.
     # Zugphase
-    zugphase = True
     selected = None
     winner = None
     is_draw = False
-    # tournament add-ons: repetition, halfmove rule, anti-pendulum /
-    # Turnier-Zusatz: Wiederholung, Halbzugregel, Anti-Pendeln
-    position_counts = {}
-    halfmove_clock = 0
-    last_move_by = {1: (-1, -1), 2: (-1, -1)}  # per player (from, to) / pro Spieler (from, to)
-    def update_draw_state(captured):
-        nonlocal halfmove_clock, is_draw
-        if ruleset != "Turnier":
-            return
-        if captured:
-            halfmove_clock = 0
-        else:
-            halfmove_clock += 1
-        key = (tuple(state), current_player)
-        position_counts[key] = position_counts.get(key, 0) + 1
-        if position_counts[key] >= 3 or halfmove_clock >= 100:
-            is_draw = True
-    def get_adjacent(pos):
-        adj = []
-        for a, b in lines:
-            if a == pos:
-                adj.append(b)
-            elif b == pos:
-                adj.append(a)
-        return adj
-    def has_moves(player):
-        stones = [i for i, v in enumerate(state) if v == player]
-        lm_from, lm_to = last_move_by.get(player, (-1, -1))
-        if len(stones) == 3:
-            # flying phase: any free field as target, except immediate pendulum back of same stone
-            # Fliegen: jedes freie Feld als Ziel, außer sofortiges Zurückpendeln desselben Steins
-            freie = [i for i, v in enumerate(state) if v == 0]
-            for s in stones:
-                for t in freie:
-                    if ruleset == "Turnier" and s == lm_to and t == lm_from:
-                        continue
-                    return True
-            return False
-        for s in stones:
-            for j in get_adjacent(s):
-                if state[j] != 0:
-                    continue
-                if ruleset == "Turnier" and s == lm_to and j == lm_from:
-                    # anti pendulum: immediate back of same stone forbidden
-                    # Anti-Pendeln: gleicher Stein sofort zurück verboten
-                    continue
-                return True
-        return False
-    def check_win():
-        if sum(1 for v in state if v == 1) < 3:
-            return 2
-        if sum(1 for v in state if v == 2) < 3:
-            return 1
-        if not has_moves(1):
-            return 2
-        if not has_moves(2):
-            return 1
-        return None
-    while zugphase:
-        screen.fill((240, 220, 180))
-        for a, b in lines:
-            pygame.draw.line(screen, (120, 100, 80), positions[a], positions[b], LINE_W)
-        for idx, (x, y) in enumerate(positions):
-            color = (200, 180, 120)
-            if state[idx] == 1:
-                color = (255, 255, 255)
-            elif state[idx] == 2:
-                color = (0, 0, 0)
-            if selected == idx:
-                pygame.draw.circle(screen, (0,220,0), (x, y), SELECT_R, 3)
-            rad = PIECE_R if state[idx] else NODE_R
-            pygame.draw.circle(screen, color, (x, y), rad, 0 if state[idx] else 3)
-            # anti-pendulum: mark forbidden retreat target red /
-            # only if last moved stone is currently selected
-            # Anti-Pendeln: markiere nur das verbotene Rückzugs-Zielfeld rot,
-            # und nur wenn der zuletzt gezogene Stein aktuell ausgewählt ist
-            if ruleset == "Turnier" and selected is not None:
-                mv = last_move_by.get(current_player, (-1, -1))
-                # mv = (from, to) of current player /
-                # mv = (from, to) des aktuellen Spielers
-                if selected == mv[1] and idx == mv[0]:
-                    pygame.draw.circle(screen, (220,40,40), (x, y), SELECT_R, 2)
-        draw_counters()
+    while True:
+        current_player = game.current_player
+        state = game.state
+        # win: <3 stones or no legal move; draw: tournament rules /
+        # Sieg: <3 Steine oder kein legaler Zug; Remis: Turnierregeln
+        result = game.result()
+        winner = result if result in (1, 2) else None
+        is_draw = result == 0
+        regions = board_regions(state, selected) + counter_regions()
         # tournament overlay: per side (white/black) with labels and highlight of active player /
         # Turnier-Overlay: pro Seite (Weiß/Schwarz) mit Labels und Hervorhebung des aktiven Spielers
         if ruleset == "Turnier":
-            rep_w = position_counts.get((tuple(state), 1), 0)
-            rep_s = position_counts.get((tuple(state), 2), 0)
-            col_inactive = (80,60,40)
-            col_active = (200,140,60)
+            halfmove_clock = game.halfmove_clock
             mid_y = HEIGHT//2
-            # left: white
-            # Links: Weiß
-            color_w = col_active if current_player==1 else col_inactive
-            left_x = 12
-            label_w = render_fit_text("Weiß", color_w, max_width=120, base_size=16, min_size=12)
-            rep_w_surf = render_fit_text(f"Rep: {rep_w}/3", color_w, max_width=140, base_size=16, min_size=12)
-            hz_w_surf = render_fit_text(f"HZ: {halfmove_clock}", color_w, max_width=140, base_size=16, min_size=12)
-            screen.blit(label_w, (left_x, mid_y - 28))
-            screen.blit(rep_w_surf, (left_x, mid_y - 8))
-            screen.blit(hz_w_surf, (left_x, mid_y + 10))
-            # right: black
-            # Rechts: Schwarz
-            color_s = col_active if current_player==2 else col_inactive
-            right_x = WIDTH - 12
-            label_s = render_fit_text("Schwarz", color_s, max_width=120, base_size=16, min_size=12)
-            rep_s_surf = render_fit_text(f"Rep: {rep_s}/3", color_s, max_width=140, base_size=16, min_size=12)
-            hz_s_surf = render_fit_text(f"HZ: {halfmove_clock}", color_s, max_width=140, base_size=16, min_size=12)
-            screen.blit(label_s, (right_x - label_s.get_width(), mid_y - 28))
-            screen.blit(rep_s_surf, (right_x - rep_s_surf.get_width(), mid_y - 8))
-            screen.blit(hz_s_surf, (right_x - hz_s_surf.get_width(), mid_y + 10))
-        if winner or (ruleset=="Turnier" and is_draw):
+            for p, label, x, right in ((1, "Weiß", 12, False), (2, "Schwarz", WIDTH - 12, True)):
+                color = (200,140,60) if p == current_player else (80,60,40)
+                items = ((label, 120), (f"Rep: {game.repetition_count(p)}/3", 140), (f"HZ: {halfmove_clock}", 140))
+                regions.append(renderer.column_region(("tournament", p), items, color, x, mid_y, right))
+        if winner or is_draw:
+            ponder_stop()
             # first show final board frame /
             # Zuerst einen Frame nur mit dem finalen Brett zeigen
-            pygame.display.flip()
+            renderer.draw(regions)
             # Baselines
             base_hint_y = 10
             base_info_y = 30
@@ -1286,9 +1376,9 @@ def spielfeld_view(screen, font, clock, starter, state=None, stones_set=None):
             # Hinweis (Turnier) optional
             if ruleset == "Turnier" and winner:
                 loser = 2 if winner == 1 else 1
-                stones_loser = sum(1 for v in state if v == loser)
+                stones_loser = game.stones_on_board(loser)
                 try:
-                    if stones_loser >= 3 and not has_moves(loser):
+                    if stones_loser >= 3 and not game.has_moves(loser):
                         hint_surf = render_fit_text(tr("Keine legalen Züge"), (200,60,40), max_width=WIDTH-160, base_size=28, min_size=16)
                         screen.blit(hint_surf, (WIDTH//2 - hint_surf.get_width()//2, y_hint))
                         hint_height = hint_surf.get_height()
@@ -1313,7 +1403,7 @@ def spielfeld_view(screen, font, clock, starter, state=None, stones_set=None):
             pygame.display.flip()
             waiting = True
             while waiting:
-                for event in pygame.event.get():
+                for event in wait_events():
                     if event.type == pygame.QUIT:
                         pygame.quit(); sys.exit()
                     elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -1322,287 +1412,91 @@ def spielfeld_view(screen, font, clock, starter, state=None, stones_set=None):
                         toggle_debug_overlay()
                 clock.tick(FPS)
             break
-        else:
-            info = f"Zugphase: {label_for(current_player)} bewegt einen Stein"
-            info_surf = render_fit_text(info, (60,40,20), max_width=WIDTH-60, base_size=FONT_SIZE)
-            screen.blit(info_surf, (WIDTH//2 - info_surf.get_width()//2, INFO_Y))
-        # Debug-Overlay
-        draw_debug_overlay(screen, [
-            "Mode: Singleplayer",
-            "Phase: Zugphase",
-            f"Player: {current_player}",
-            f"LastMove P1: {last_move_by.get(1)}",
-            f"LastMove P2: {last_move_by.get(2)}",
-            f"HalfMove: {halfmove_clock}",
-            f"DrawRep: {position_counts.get((tuple(state), current_player), 0)}",
-        ])
-        pygame.display.flip()
+        info = f"Zugphase: {label_for(current_player)} bewegt einen Stein"
+        regions.append(renderer.text_region("info", info, (60,40,20), INFO_Y, FONT_SIZE, WIDTH-60))
+        # Debug-Overlay (lines only built while it is shown); board, info and overlays are /
+        # drawn only where they changed /
+        # Debug-Overlay (Zeilen nur, solange es sichtbar ist); Brett, Info und Overlays werden
+        # nur gezeichnet, wo sie sich geändert haben
+        if DEBUG_OVERLAY:
+            search = morris_ai.search_stats()
+            regions += renderer.debug_regions([
+                "Mode: Singleplayer",
+                "Phase: Zugphase",
+                f"Player: {current_player}",
+                f"LastMove P1: {game.last_move_by.get(1)}",
+                f"LastMove P2: {game.last_move_by.get(2)}",
+                f"HalfMove: {game.halfmove_clock}",
+                f"DrawRep: {game.repetition_count(current_player)}",
+                "TT: {hits} hit / {misses} miss / {overwrites} ovr".format(**morris_ai.get_table().stats()),
+                "Search: {nodes} nodes / {first_cutoff_rate:.0%} 1st cutoff".format(**search)
+                if search else "Search: -",
+            ])
+        renderer.draw(regions)
         # play execute: SL or human / 
         # Zug ausführen: SL oder Mensch
         if player_types[current_player] == "SL":
-            ai_player = current_player
-            ai_opponent = 2 if ai_player == 1 else 1
-            stones = [i for i, v in enumerate(state) if v == ai_player]
-            moved = False
-            cap = False
-            if len(stones) == 3:
-                freie = [i for i, v in enumerate(state) if v == 0]
-                # sort by difficulty /
-                # Sortierung je nach Schwierigkeit
-                def pick_targets(i):
-                    if difficulty == "Leicht":
-                        return random.sample(freie, k=len(freie))
-                    elif difficulty == "Mittel":
-                        pri_now = [j for j in freie if line_forms_mill_if_place(j, ai_player)]
-                        if pri_now:
-                            return pri_now + [j for j in freie if j not in pri_now]
-                        # block by flying possible
-                        # Blocken durch Springen möglich
-                        blocks = [j for j in find_block_positions(ai_player) if j in freie]
-                        return blocks + [j for j in freie if j not in blocks]
-                    else:
-                        # difficult: sort by evaluation
-                        # Schwer: nach Bewertung sortieren
-                        scored = []
-                        for j in freie:
-                            state[i] = 0; state[j] = ai_player
-                            s = evaluate(ai_player)
-                            state[j] = 0; state[i] = ai_player
-                            scored.append((s, j))
-                        scored.sort(reverse=True)
-                        return [j for _, j in scored]
-                random.shuffle(stones)
-                for i in stones:
-                    for j in pick_targets(i):
-                        if ruleset == "Turnier" and last_move_by.get(ai_player) == (j, i):
-                            continue
-                        if state[i] == ai_player and state[j] == 0:
-                            state[i] = 0
-                            state[j] = ai_player
-                            muehle_gebildet = check_muehle(j, ai_player)
-                            if muehle_gebildet:
-                                screen.fill((240, 220, 180))
-                                for a, b in lines:
-                                    pygame.draw.line(screen, (120, 100, 80), positions[a], positions[b], 5)
-                                for idx2, (x2, y2) in enumerate(positions):
-                                    color = (200, 180, 120)
-                                    if state[idx2] == 1:
-                                        color = (255, 255, 255)
-                                    elif state[idx2] == 2:
-                                        color = (0, 0, 0)
-                                    rad = PIECE_R if state[idx2] else NODE_R
-                                    pygame.draw.circle(screen, color, (x2, y2), rad, 0 if state[idx2] else 3)
-                                info2 = f"{label_for(ai_player)} entfernt einen Stein"
-                                info2_surf = render_fit_text(info2, (200,40,40), max_width=WIDTH-100, base_size=28, min_size=18)
-                                screen.blit(info2_surf, (WIDTH//2 - info2_surf.get_width()//2, INFO_Y))
-                                draw_counters()
-                                pygame.display.flip()
-                                pygame.time.wait(600)
-                                cap = remove_opponent_stone(ai_player)
-                            else:
-                                cap = False
-                            moved = True
-                            last_move_by[ai_player] = (i, j)
-                            break
-                    if moved:
-                        break
-            else:
-                def pick_adjs(i):
-                    adj = get_adjacent(i)
-                    if difficulty == "Leicht":
-                        random.shuffle(adj)
-                        return adj
-                    elif difficulty == "Mittel":
-                        pri_now = [j for j in adj if state[j]==0 and line_forms_mill_if_place(j, ai_player)]
-                        rest = [j for j in adj if j not in pri_now and state[j]==0]
-                        # try to block: move to threatened empty point /
-                        # Versuch zu blocken: ziehe an bedrohten leeren Punkt
-                        blocks = [j for j in find_block_positions(ai_player) if j in rest]
-                        ordered = pri_now + blocks + [j for j in rest if j not in blocks]
-                        return ordered
-                    else:
-                        scored = []
-                        for j in adj:
-                            if state[j] != 0:
-                                continue
-                            state[i] = 0; state[j] = ai_player
-                            s = evaluate(ai_player)
-                            state[j] = 0; state[i] = ai_player
-                            scored.append((s, j))
-                        scored.sort(reverse=True)
-                        return [j for _, j in scored]
-                random.shuffle(stones)
-                for i in stones:
-                    for j in pick_adjs(i):
-                        if ruleset == "Turnier" and last_move_by.get(ai_player) == (j, i):
-                            continue
-                        if state[i] == ai_player and state[j] == 0:
-                            state[i] = 0
-                            state[j] = ai_player
-                            muehle_gebildet = check_muehle(j, ai_player)
-                            if muehle_gebildet:
-                                screen.fill((240, 220, 180))
-                                for a, b in lines:
-                                    pygame.draw.line(screen, (120, 100, 80), positions[a], positions[b], 5)
-                                for idx2, (x2, y2) in enumerate(positions):
-                                    color = (200, 180, 120)
-                                    if state[idx2] == 1:
-                                        color = (255, 255, 255)
-                                    elif state[idx2] == 2:
-                                        color = (0, 0, 0)
-                                    rad = PIECE_R if state[idx2] else NODE_R
-                                    pygame.draw.circle(screen, color, (x2, y2), rad, 0 if state[idx2] else 3)
-                                info2 = f"{label_for(ai_player)} entfernt einen Stein"
-                                info2_surf = render_fit_text(info2, (200,40,40), max_width=WIDTH-100, base_size=28, min_size=18)
-                                screen.blit(info2_surf, (WIDTH//2 - info2_surf.get_width()//2, INFO_Y))
-                                draw_counters()
-                                pygame.display.flip()
-                                pygame.time.wait(600)
-                                cap = remove_opponent_stone(ai_player)
-                            else:
-                                cap = False
-                            moved = True
-                            last_move_by[ai_player] = (i, j)
-                            break
-                    if moved:
-                        break
-            winner = check_win()
-            current_player = 2 if current_player == 1 else 1
-            update_draw_state(captured=cap)
-            pygame.time.wait(500)
+            if not ai_poll(600):
+                return None
         else:
             # Mensch-Zug
-            for event in pygame.event.get():
+            ponder_poll()
+            for event in wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit(); sys.exit()
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     if confirm_abort():
+                        ponder_stop()
                         return None
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_d:
                     toggle_debug_overlay()
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_l:
                     toggle_language()
                     break
-                elif event.type == pygame.KEYDOWN and event.key == pygame.K_d:
-                    toggle_debug_overlay()
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     mx, my = event.pos
                     if selected is None:
                         for idx, (x, y) in enumerate(positions):
-                            if (mx-x)**2 + (my-y)**2 < HIT_R**2 and state[idx] in (1,2):
-                                if (current_player == 1 and state[idx] == 1) or (current_player == 2 and state[idx] == 2):
-                                    selected = idx
-                                    break
+                            if (mx-x)**2 + (my-y)**2 < HIT_R**2 and state[idx] == current_player:
+                                selected = idx
+                                break
                     else:
-                        stones = [i for i, v in enumerate(state) if v == current_player]
-                        if len(stones) == 3:
-                            moved_now = False
+                        # legal targets: adjacent, or every free point when flying; /
+                        # anti-pendulum already filtered by the rules engine /
+                        # Erlaubte Ziele: benachbart, beim Springen jedes freie Feld;
+                        # Anti-Pendeln filtert bereits die Regel-Engine
+                        moved_now = False
+                        for idx in game.targets(selected):
+                            x, y = positions[idx]
+                            if (mx-x)**2 + (my-y)**2 < HIT_R**2:
+                                if not human_move(selected, idx):
+                                    ponder_stop()
+                                    return None
+                                selected = None
+                                moved_now = True
+                                break
+                        if not moved_now:
                             for idx, (x, y) in enumerate(positions):
-                                if (mx-x)**2 + (my-y)**2 < HIT_R**2 and state[idx] == 0:
-                                    if ruleset == "Turnier" and last_move_by.get(current_player) == (idx, selected):
-                                        continue
-                                    from_pos = selected
-                                    state[selected] = 0
-                                    state[idx] = current_player
-                                    muehle_gebildet = check_muehle(idx, current_player)
-                                    if muehle_gebildet:
-                                        screen.fill((240, 220, 180))
-                                        for a, b in lines:
-                                            pygame.draw.line(screen, (120, 100, 80), positions[a], positions[b], 5)
-                                        for idx2, (x2, y2) in enumerate(positions):
-                                            color = (200, 180, 120)
-                                            if state[idx2] == 1:
-                                                color = (255, 255, 255)
-                                            elif state[idx2] == 2:
-                                                color = (0, 0, 0)
-                                            rad = PIECE_R if state[idx2] else NODE_R
-                                            pygame.draw.circle(screen, color, (x2, y2), rad, 0 if state[idx2] else 3)
-                                        info2 = f"{label_for(current_player)} entfernt einen Stein"
-                                        info2_surf = render_fit_text(info2, (200,40,40), max_width=WIDTH-100, base_size=28, min_size=18)
-                                        screen.blit(info2_surf, (WIDTH//2 - info2_surf.get_width()//2, INFO_Y))
-                                        draw_counters()
-                                        pygame.display.flip()
-                                        cap = remove_opponent_stone(current_player)
-                                        if aborted:
-                                            return None
-                                    else:
-                                        cap = False
-                                    last_move_by[current_player] = (from_pos, idx)
-                                    selected = None
-                                    winner = check_win()
-                                    current_player = 2 if current_player == 1 else 1
-                                    update_draw_state(captured=cap)
-                                    moved_now = True
+                                if (mx-x)**2 + (my-y)**2 < HIT_R**2 and state[idx] == current_player:
+                                    selected = None if idx == selected else idx
                                     break
-                            if not moved_now:
-                                for idx, (x, y) in enumerate(positions):
-                                    if (mx-x)**2 + (my-y)**2 < HIT_R**2 and state[idx] == current_player:
-                                        selected = None if idx == selected else idx
-                                        break
-                        else:
-                            adj = get_adjacent(selected)
-                            moved_now = False
-                            for idx in adj:
-                                x, y = positions[idx]
-                                if (mx-x)**2 + (my-y)**2 < HIT_R**2 and state[idx] == 0:
-                                    if ruleset == "Turnier" and last_move_by.get(current_player) == (idx, selected):
-                                        continue
-                                    from_pos = selected
-                                    state[selected] = 0
-                                    state[idx] = current_player
-                                    muehle_gebildet = check_muehle(idx, current_player)
-                                    if muehle_gebildet:
-                                        screen.fill((240, 220, 180))
-                                        for a, b in lines:
-                                            pygame.draw.line(screen, (120, 100, 80), positions[a], positions[b], 5)
-                                        for idx2, (x2, y2) in enumerate(positions):
-                                            color = (200, 180, 120)
-                                            if state[idx2] == 1:
-                                                color = (255, 255, 255)
-                                            elif state[idx2] == 2:
-                                                color = (0, 0, 0)
-                                            rad = PIECE_R if state[idx2] else NODE_R
-                                            pygame.draw.circle(screen, color, (x2, y2), rad, 0 if state[idx2] else 3)
-                                        info2 = f"{label_for(current_player)} entfernt einen Stein"
-                                        info2_surf = render_fit_text(info2, (200,40,40), max_width=WIDTH-100, base_size=28, min_size=18)
-                                        screen.blit(info2_surf, (WIDTH//2 - info2_surf.get_width()//2, INFO_Y))
-                                        draw_counters()
-                                        pygame.display.flip()
-                                        cap = remove_opponent_stone(current_player)
-                                        if aborted:
-                                            return None
-                                    else:
-                                        cap = False
-                                    last_move_by[current_player] = (from_pos, idx)
-                                    selected = None
-                                    winner = check_win()
-                                    current_player = 2 if current_player == 1 else 1
-                                    update_draw_state(captured=cap)
-                                    moved_now = True
-                                    break
-                            if not moved_now:
-                                for idx, (x, y) in enumerate(positions):
-                                    if (mx-x)**2 + (my-y)**2 < HIT_R**2 and state[idx] == current_player:
-                                        selected = None if idx == selected else idx
-                                        break
+                    break
         # note: event loop ended – next frame / 
         # Hinweis: Event-Loop beendet – nächster Frame
         clock.tick(FPS)
-    if 'winner' in locals():
-        return winner
-    return None
+    return winner
 
 def main():
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Nine Men's Morris / Mühle")
     clock = pygame.time.Clock()
-    font = pygame.font.SysFont("FreeSans", FONT_SIZE)
+    font = get_font(FONT_SIZE)
     selected_idx = 0
     running = True
     while running:
         draw_menu(screen, font, selected_idx)
-        for event in pygame.event.get():
+        for event in wait_events():
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             elif event.type == pygame.MOUSEMOTION:
@@ -1623,9 +1517,13 @@ def main():
                     option = get_menu_options()[selected_idx]
                     if option.startswith("Mensch") or option.startswith("Human"):
                         diff = select_difficulty(screen, font, clock)
-                        rules = select_ruleset(screen, font, clock) if diff else None
+                        # think time only matters for the searching levels /
+                        # Bedenkzeit zählt nur für die suchenden Stufen
+                        think = select_think_time(screen, font, clock) if diff in TIMED_DIFFICULTIES else THINK_TIME_OPTIONS[0]
+                        rules = select_ruleset(screen, font, clock) if diff and think else None
                         if diff and rules:
                             globals()["CURRENT_DIFFICULTY"] = diff
+                            globals()["CURRENT_THINK_TIME"] = think
                             globals()["CURRENT_RULESET"] = rules
                             play_match_best_of_3(screen, font, clock)
                     elif option.startswith("Netzwerk") or option.startswith("Network"):
@@ -1674,25 +1572,25 @@ def show_help_menu(screen, font):
     if CURRENT_LANG == "de":
         sl_explain = [
             "SL = Skript Logic ersetzt die Ausdrücke KI",
-            " - SL nutzt eine einfache Spiellogik in 3 Schwierigkeitsstufen.",
+            " - SL nutzt eine einfache Spiellogik in 4 Schwierigkeitsstufen.",
             ""
         ]
     elif CURRENT_LANG == "en":
         sl_explain = [
             "SL = Script Logic replaces the terms AI",
-            " - SL uses a simple game logic with 3 difficulty levels.",         
+            " - SL uses a simple game logic with 4 difficulty levels.",         
             ""
         ]
     elif CURRENT_LANG == "fr":
         sl_explain = [
             "SL = Script Logic remplace les termes IA",
-            " - SL utilise une logique de jeu simple en 3 niveaux de difficulté.",
+            " - SL utilise une logique de jeu simple en 4 niveaux de difficulté.",
             ""
         ]
     else:  # es
         sl_explain = [
             "SL = Script Logic reemplaza los términos IA",
-            " - SL usa una lógica de juego sencilla con 3 niveles de dificultad.",
+            " - SL usa una lógica de juego sencilla con 4 niveles de dificultad.",
             ""
         ]
 
@@ -1844,7 +1742,7 @@ def show_help_menu(screen, font):
         pygame.display.flip()
         # input handling /
         # Eingaben
-        for event in pygame.event.get():
+        for event in wait_events():
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             elif event.type == pygame.KEYDOWN:
@@ -1910,7 +1808,7 @@ def run_network_menu(screen, font, clock):
     while True:
         draw_network_menu(screen, font, mode, ip, port, sel, bind_mode)
         pygame.display.flip()
-        for e in pygame.event.get():
+        for e in wait_events():
             if e.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             elif e.type == pygame.KEYDOWN:
@@ -1963,7 +1861,7 @@ def run_network_menu(screen, font, clock):
                                     if accept_network_client(conn, screen, font):
                                         waiting = False
                                         break
-                                    for ev in pygame.event.get():
+                                    for ev in wait_events(sock=conn.get("server")):
                                         if ev.type == pygame.QUIT:
                                             pygame.quit(); sys.exit()
                                         elif ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
@@ -2034,7 +1932,7 @@ def run_network_menu(screen, font, clock):
                                                 du_beginnt = True
                                             waiting = False
                                             break
-                                    for ev in pygame.event.get():
+                                    for ev in wait_events(sock=sock):
                                         if ev.type == pygame.QUIT:
                                             pygame.quit(); sys.exit()
                                         elif ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
@@ -2091,7 +1989,6 @@ def network_game_simple(screen, font, clock, conn_state):
     # infoline 15px higher (not moving the top storage) /
     # Infozeile 15px weiter nach oben (nicht das obere Lager verschieben)
     INFO_Y = max(20, int(36 * ui_scale) - 25)
-    COUNTER_MARGIN = int(40 * ui_scale)
     COUNTER_R = max(6, int(16 * ui_scale))
     COUNTER_Y_TOP = min(max(INFO_Y + 40, int(90 * ui_scale) - 20) + 20, HEIGHT - 100)
     COUNTER_Y_BOT = max(min(HEIGHT - 20, HEIGHT - int(90 * ui_scale) + 50) - 20, COUNTER_Y_TOP + 100)
@@ -2117,106 +2014,65 @@ def network_game_simple(screen, font, clock, conn_state):
         (cx-inner, cy-inner), (cx, cy-inner), (cx+inner, cy-inner),
         (cx+inner, cy), (cx+inner, cy+inner), (cx, cy+inner), (cx-inner, cy+inner), (cx-inner, cy)
     ]
-    lines = [
-        (0,1),(1,2),(2,3),(3,4),(4,5),(5,6),(6,7),(7,0),
-        (8,9),(9,10),(10,11),(11,12),(12,13),(13,14),(14,15),(15,8),
-        (16,17),(17,18),(18,19),(19,20),(20,21),(21,22),(22,23),(23,16),
-        (1,9),(3,11),(5,13),(7,15),
-        (9,17),(11,19),(13,21),(15,23)
-    ]
-    muhlen = [
-        [0,1,2], [2,3,4], [4,5,6], [6,7,0],
-        [8,9,10], [10,11,12], [12,13,14], [14,15,8],
-        [16,17,18], [18,19,20], [20,21,22], [22,23,16],
-        [1,9,17], [3,11,19], [5,13,21], [7,15,23]
-    ]
-    state = [0]*24
-    stones_set = [0,0]
-    last_mills = {1:set(), 2:set()}
-    current_player = 1
+    lines = morris_board.LINES
+    # rules engine shared with singleplayer and AI /
+    # Regel-Engine wie im Singleplayer und für die SL
+    game = morris_game.MorrisGame("Turnier" if is_tournament else "Entschärft")
+    stones_set = game.stones_set
+    state = game.state
+    current_player = game.current_player
     selected = None
-    # anti pendulum: last moves per player (from,to) /
-    # Anti-Pendeln: letzte Züge je Spieler (from,to)
-    last_move_by_player = {1: (-1, -1), 2: (-1, -1)}
-    # tounament remis: track repetitions and halfmove counter (only in moving phase) /
-    # Turnier-Remis: Wiederholungen + Halbzugzähler (nur in Zugphase)
-    rep_counts = {}
-    halfmove_count = 0
+    # remote move that closed a mill, waiting for its REM line: (from, to) /
+    # Gegnerzug mit Mühle, der auf seine REM-Zeile wartet: (from, to)
+    pending = None
+    # board as displayed (pending remote move already visible) /
+    # Brett wie angezeigt (offener Gegnerzug bereits sichtbar)
+    def refresh():
+        nonlocal state, current_player
+        state = game.state
+        current_player = game.current_player
+        if pending is not None:
+            frm, to = pending
+            if frm >= 0:
+                state[frm] = 0
+            state[to] = current_player
+    SELECT_R = max(PIECE_R+6, int(28*board_scale))
+    renderer = BoardRenderer(screen, positions, lines, NODE_R, PIECE_R, SELECT_R, LINE_W)
+    # reserve stones as storage rows - fixed 50px margins, 9 slots, nothing moves /
+    # Reserve-Steine als Speicherreihen – feste 50px Ränder, 9 Slots, nichts verschiebt sich
+    left_margin, right_margin = 50, 50
+    steps = 8  # 9 slots -> 8 gaps / 9 Slots -> 8 Abstände
+    width_avail = max(2, WIDTH - left_margin - right_margin)
+    spacing = width_avail / steps  # float für exakte Randtreue
+    counter_xs = [int(round(left_margin + i*spacing)) for i in range(9)]
     def draw_board(info_text=None):
-        screen.fill((240, 220, 180))
-        for a,b in lines:
-            pygame.draw.line(screen, (120,100,80), positions[a], positions[b], LINE_W)
-        for idx,(x,y) in enumerate(positions):
-            color = (200,180,120)
-            if state[idx]==1: color=(255,255,255)
-            elif state[idx]==2: color=(0,0,0)
-            if selected == idx:
-                pygame.draw.circle(screen, (0,220,0), (x,y), max(PIECE_R+6, int(28*board_scale)), 3)
-            pygame.draw.circle(screen, color, (x,y), PIECE_R if state[idx] else NODE_R, 0 if state[idx] else 3)
-            # anti pendulum: mark only the forbidden retreat target red /
-            # if the last moved own piece is currently selected /
-            # Anti-Pendeln: markiere nur das verbotene Rückzugs-Zielfeld rot,
-            # wenn der zuletzt gezogene eigene Stein aktuell ausgewählt ist
-            if is_tournament and selected is not None:
-                mv = last_move_by_player.get(current_player, (-1, -1))  # (from, to)
-                if selected == mv[1] and idx == mv[0]:
-                    pygame.draw.circle(screen, (220,40,40), (x, y), max(PIECE_R+6, int(28*board_scale)), 2)
-        # reserve stones as storage rows - fixed 50px margins, 9 slots, nothing moves /
-        # Reserve-Steine als Speicherreihen – feste 50px Ränder, 9 Slots, nichts verschiebt sich
-        white_left = max(0, 9 - stones_set[0])
-        black_left = max(0, 9 - stones_set[1])
-        rr = PIECE_R
-        left_margin, right_margin = 50, 50
-        steps = 8  # 9 slots -> 8 gaps / 9 Slots -> 8 Abstände
-        width_avail = max(2, WIDTH - left_margin - right_margin)
-        spacing = width_avail / steps  # float für exakte Randtreue
-        start_x = left_margin
-        # top: first placeholders, then white stones on fixed slots /
-        # oben: erst Platzhalter, dann weiße Steine auf festen Slots
-        y_top = COUNTER_Y_TOP
-        for i in range(9):
-            x = int(round(start_x + i*spacing))
-            pygame.draw.circle(screen, (185,180,160), (x, y_top), rr, 0)
-            pygame.draw.circle(screen, (140,130,110), (x, y_top), rr, 1)
-        for i in range(white_left):
-            x = int(round(start_x + i*spacing))
-            pygame.draw.circle(screen, (255,255,255), (x, y_top), rr, 0)
-            pygame.draw.circle(screen, (100, 90, 70), (x, y_top), rr, 2)
-        # bottom: first placeholders, then black stones on fixed slots /
-        # unten: erst Platzhalter, dann schwarze Steine auf festen Slots
-        y_bot = COUNTER_Y_BOT
-        for i in range(9):
-            x = int(round(start_x + i*spacing))
-            pygame.draw.circle(screen, (185,180,160), (x, y_bot), rr, 0)
-            pygame.draw.circle(screen, (140,130,110), (x, y_bot), rr, 1)
-        for i in range(black_left):
-            x = int(round(start_x + i*spacing))
-            pygame.draw.circle(screen, (0,0,0), (x, y_bot), rr, 0)
-            pygame.draw.circle(screen, (100, 90, 70), (x, y_bot), rr, 2)
+        # anti pendulum: mark only the forbidden retreat target red /
+        # if the last moved own piece is currently selected /
+        # Anti-Pendeln: markiere nur das verbotene Rückzugs-Zielfeld rot,
+        # wenn der zuletzt gezogene eigene Stein aktuell ausgewählt ist
+        mark = None
+        if is_tournament and selected is not None:
+            mv = game.last_move_by.get(current_player, (-1, -1))  # (from, to)
+            if selected == mv[1]:
+                mark = mv[0]
+        regions = renderer.point_regions(state, selected, mark)
+        # top white, bottom black; a pending remote placement is already taken from the hand /
+        # oben Weiß, unten Schwarz; ein offener Gegner-Setzzug ist schon aus der Hand genommen
+        placing = pending is not None and pending[0] < 0
+        white_left = max(0, 9 - stones_set[0] - (placing and current_player == 1))
+        black_left = max(0, 9 - stones_set[1] - (placing and current_player == 2))
+        regions.append(renderer.counter_region("counter_w", counter_xs, COUNTER_Y_TOP, white_left, (255,255,255)))
+        regions.append(renderer.counter_region("counter_b", counter_xs, COUNTER_Y_BOT, black_left, (0,0,0)))
         # tournament overlay: left white (player 1), right black (player 2) /
         # Turnier-Overlay: links Weiß (Spieler 1), rechts Schwarz (Spieler 2)
-        if is_tournament and not setzphase:
-            rep_w = rep_counts.get((tuple(state), 1), 0)
-            rep_s = rep_counts.get((tuple(state), 2), 0)
-            col_inactive = (80,60,40)
-            col_active = (200,140,60)
+        if is_tournament and not game.in_placement():
+            halfmove_count = game.halfmove_clock
             mid_y = HEIGHT//2
-            color_w = col_active if current_player==1 else col_inactive
-            color_s = col_active if current_player==2 else col_inactive
-            left_x = 12
-            right_x = WIDTH - 12
-            label_w = render_fit_text(tr("Weiß (Spieler 1)"), color_w, max_width=160, base_size=16, min_size=12)
-            rep_w_surf = render_fit_text(f"{tr('Rep:')} {rep_w}/3", color_w, max_width=160, base_size=16, min_size=12)
-            hz_w_surf = render_fit_text(f"{tr('HZ:')} {halfmove_count}", color_w, max_width=160, base_size=16, min_size=12)
-            screen.blit(label_w, (left_x, mid_y - 28))
-            screen.blit(rep_w_surf, (left_x, mid_y - 8))
-            screen.blit(hz_w_surf, (left_x, mid_y + 10))
-            label_s = render_fit_text(tr("Schwarz (Spieler 2)"), color_s, max_width=160, base_size=16, min_size=12)
-            rep_s_surf = render_fit_text(f"{tr('Rep:')} {rep_s}/3", color_s, max_width=160, base_size=16, min_size=12)
-            hz_s_surf = render_fit_text(f"{tr('HZ:')} {halfmove_count}", color_s, max_width=160, base_size=16, min_size=12)
-            screen.blit(label_s, (right_x - label_s.get_width(), mid_y - 28))
-            screen.blit(rep_s_surf, (right_x - rep_s_surf.get_width(), mid_y - 8))
-            screen.blit(hz_s_surf, (right_x - hz_s_surf.get_width(), mid_y + 10))
+            for p, label, x, right in ((1, "Weiß (Spieler 1)", 12, False), (2, "Schwarz (Spieler 2)", WIDTH - 12, True)):
+                color = (200,140,60) if current_player == p else (80,60,40)
+                items = ((tr(label), 160), (f"{tr('Rep:')} {game.repetition_count(p)}/3", 160),
+                         (f"{tr('HZ:')} {halfmove_count}", 160))
+                regions.append(renderer.column_region(("tournament", p), items, color, x, mid_y, right))
         # easy info line if not given /
         # einfache Infozeile
         if info_text is None:
@@ -2224,7 +2080,7 @@ def network_game_simple(screen, font, clock, conn_state):
             # localized YOU/DU /
             # Lokalisiertes YOU/DU
             you = tr(" (DU)") if current_player==local_color else ""
-            if setzphase:
+            if game.in_placement():
                 phase = tr("Setzphase:")
                 action = tr("setzt Stein ")
                 count = f"({stones_set[current_player-1]+1}/9)" if stones_set[current_player-1] < 9 else "(9/9)"
@@ -2233,77 +2089,19 @@ def network_game_simple(screen, font, clock, conn_state):
                 phase = tr("Zugphase:")
                 action = tr("bewegt einen Stein")
                 info_text = f"{phase} {who}{you} {action}"
-        # safety: translate full line /
-        # Sicherheit: Gesamtsatz übersetzen
-        info_surf = render_fit_text(tr(info_text), (60,40,20), max_width=WIDTH-80, base_size=FONT_SIZE, min_size=16)
-        screen.blit(info_surf, (WIDTH//2 - info_surf.get_width()//2, INFO_Y))
-        pygame.display.flip()
-    def update_mills(pos, player):
-        cur = {i for i,m in enumerate(muhlen) if all(state[k]==player for k in m)}
-        created = {i for i in cur if pos in muhlen[i]} - last_mills[player]
-        last_mills[player] = cur
-        return len(created)>0
-    def get_adjacent(p):
-        adj=[]
-        for a,b in lines:
-            if a==p: adj.append(b)
-            elif b==p: adj.append(a)
-        return adj
-    def has_moves(player):
-        stones = [i for i, v in enumerate(state) if v == player]
-        lm_from, lm_to = last_move_by_player.get(player, (-1, -1))
-        if len(stones) == 3:
-            # flying: any free spot as target, except immediate return pendulum of same stone /
-            # Fliegen: jedes freie Feld als Ziel, außer sofortiges Zurückpendeln desselben Steins
-            freie = [i for i, v in enumerate(state) if v == 0]
-            for s in stones:
-                for t in freie:
-                    if is_tournament and s == lm_to and t == lm_from:
-                        continue
-                    return True
-            return False
-        for s in stones:
-            for j in get_adjacent(s):
-                if state[j] != 0:
-                    continue
-                if is_tournament and s == lm_to and j == lm_from:
-                    # anti pendulum: immediate return of same stone forbidden /
-                    # Anti-Pendeln: gleicher Stein sofort zurück verboten
-                    continue
-                return True
-        return False
-    def check_win():
-        if sum(1 for v in state if v==1)<3: return 2
-        if sum(1 for v in state if v==2)<3: return 1
-        if not has_moves(1): return 2
-        if not has_moves(2): return 1
-        return None
-    def position_key():
-        return (tuple(state), current_player)
+        # safety: translate full line; drawn only where the frame changed /
+        # Sicherheit: Gesamtsatz übersetzen; gezeichnet wird nur, wo sich der Frame geändert hat
+        regions.append(renderer.text_region("info", tr(info_text), (60,40,20), INFO_Y, FONT_SIZE, WIDTH-80, min_size=16))
+        renderer.draw(regions)
     def wait_for_escape():
         waiting=True
         while waiting:
-            for ev in pygame.event.get():
+            for ev in wait_events():
                 if ev.type==pygame.QUIT:
                     pygame.quit(); sys.exit()
                 elif ev.type==pygame.KEYDOWN and ev.key==pygame.K_ESCAPE:
                     waiting=False
             clock.tick(FPS)
-    def update_repetition_and_draws(capture=False):
-        nonlocal halfmove_count
-        if setzphase:
-            return False
-        if capture:
-            halfmove_count = 0
-        else:
-            halfmove_count += 1
-        key = position_key()
-        rep_counts[key] = rep_counts.get(key, 0) + 1
-        if is_tournament and (rep_counts[key] >= 3 or halfmove_count >= 100):
-            # tournament ending signal draw; actual display/query takes place centrally /
-            # Turnierende durch Remis signalisieren; eigentliche Anzeige/Abfrage erfolgt zentral
-            return True
-        return False
     def prompt_end_and_return(win_color=None, is_draw=False):
         """Zeige Abschluss-Overlay und liefere Rückgabewert:
         - win_color in {1,2} für Sieger
@@ -2311,6 +2109,8 @@ def network_game_simple(screen, font, clock, conn_state):
         - ESC im Match => None (Abbruch), SPACE => weiter (1/2/0)
         - außerhalb Match: ESC schließt, Rückgabe (1/2/0)
         """
+        nonlocal selected
+        selected = None
         if not is_draw:
             # existing final rendering (show last frame), then prompt /
             # Bestehendes finales Rendern (letzten Frame zeigen), danach Prompt
@@ -2318,45 +2118,14 @@ def network_game_simple(screen, font, clock, conn_state):
             base_info_y = 30
             y_hint = max(0, base_hint_y - 3)
             y_info = max(0, base_info_y - 8)
-            screen.fill((240, 220, 180))
-            for a,b in lines:
-                pygame.draw.line(screen, (120,100,80), positions[a], positions[b], LINE_W)
-            for idx,(x,y) in enumerate(positions):
-                color = (200,180,120)
-                if state[idx]==1: color=(255,255,255)
-                elif state[idx]==2: color=(0,0,0)
-                if selected == idx:
-                    pygame.draw.circle(screen, (0,220,0), (x,y), max(PIECE_R+6, int(28*board_scale)), 3)
-                pygame.draw.circle(screen, color, (x,y), PIECE_R if state[idx] else NODE_R, 0 if state[idx] else 3)
-            # draw storage / 
-            # Lager zeichnen
-            white_left = max(0, 9 - stones_set[0]); black_left = max(0, 9 - stones_set[1])
-            rr = PIECE_R; left_margin, right_margin = 50, 50; steps = 8
-            width_avail = max(1, WIDTH - left_margin - right_margin)
-            spacing = width_avail / steps; start_x = left_margin
-            y_top = COUNTER_Y_TOP; y_bot = COUNTER_Y_BOT
-            for i in range(9):
-                x = int(round(start_x + i*spacing))
-                pygame.draw.circle(screen, (185,180,160), (x, y_top), rr, 0)
-                pygame.draw.circle(screen, (140,130,110), (x, y_top), rr, 1)
-            for i in range(white_left):
-                x = int(round(start_x + i*spacing))
-                pygame.draw.circle(screen, (255,255,255), (x, y_top), rr, 0)
-                pygame.draw.circle(screen, (100,90,70), (x, y_top), rr, 2)
-            for i in range(9):
-                x = int(round(start_x + i*spacing))
-                pygame.draw.circle(screen, (185,180,160), (x, y_bot), rr, 0)
-                pygame.draw.circle(screen, (140,130,110), (x, y_bot), rr, 1)
-            for i in range(black_left):
-                x = int(round(start_x + i*spacing))
-                pygame.draw.circle(screen, (0,0,0), (x, y_bot), rr, 0)
-                pygame.draw.circle(screen, (100,90,70), (x, y_bot), rr, 2)
+            # board without info line; overlay is drawn on top /
+            # Brett ohne Infozeile; Overlay wird darüber gezeichnet
+            draw_board("")
             # optimized note for tournament end /
             # Optionaler Hinweis bei Zugnot
             if is_tournament and win_color in (1,2):
                 loser = 2 if win_color == 1 else 1
-                stones_loser = sum(1 for v in state if v == loser)
-                if stones_loser >= 3 and not has_moves(loser):
+                if game.stones_on_board(loser) >= 3 and not game.has_moves(loser):
                     hint_surf = render_fit_text(tr("Keine legalen Züge"), (200,60,40), max_width=WIDTH-160, base_size=28, min_size=16)
                     screen.blit(hint_surf, (WIDTH//2 - hint_surf.get_width()//2, y_hint))
                     y_info = max(y_info, y_hint + hint_surf.get_height() + 5)
@@ -2376,7 +2145,7 @@ def network_game_simple(screen, font, clock, conn_state):
         aborted = False
         waiting = True
         while waiting:
-            for ev in pygame.event.get():
+            for ev in wait_events():
                 if ev.type == pygame.QUIT:
                     pygame.quit(); sys.exit()
                 elif ev.type == pygame.KEYDOWN:
@@ -2388,9 +2157,56 @@ def network_game_simple(screen, font, clock, conn_state):
         if aborted and is_match:
             return None
         return (0 if is_draw else win_color)
-    # setting phase / 
-    # Setzphase
-    setzphase = True
+    # local player picks the stone to remove after a mill; None if aborted /
+    # lokaler Spieler wählt nach einer Mühle den Stein zum Entfernen; None bei Abbruch
+    def choose_removal():
+        candidates = game.removal_candidates(current_player)
+        if not candidates:
+            return -1
+        while True:
+            draw_board(tr("Mühle! Wähle einen gegnerischen Stein zum Entfernen."))
+            for ev2 in wait_events():
+                if ev2.type==pygame.QUIT:
+                    pygame.quit(); sys.exit()
+                elif ev2.type==pygame.KEYDOWN and ev2.key==pygame.K_ESCAPE:
+                    if confirm_abort(tr("Netzwerkspiel wirklich beenden?")):
+                        return None
+                elif ev2.type==pygame.MOUSEBUTTONDOWN and ev2.button==1:
+                    mx2,my2 = ev2.pos
+                    for oi in candidates:
+                        ox,oy = positions[oi]
+                        if (mx2-ox)**2+(my2-oy)**2 < HIT_R**2:
+                            return oi
+            clock.tick(FPS)
+    # send own move (SET/MOVE, then REM after a mill) and apply it; False on abort/error /
+    # eigenen Zug senden (SET/MOVE, nach Mühle REM) und ausführen; False bei Abbruch/Fehler
+    def local_move(frm, to):
+        nonlocal pending
+        pl = current_player
+        try:
+            if frm < 0:
+                sock.sendall(f"SET {pl} {to}\n".encode())
+            else:
+                sock.sendall(f"MOVE {pl} {frm} {to}\n".encode())
+        except Exception:
+            return False
+        rem = -1
+        if game.forms_mill(frm, to):
+            # show own stone while choosing the removal /
+            # eigenen Stein während der Entfernen-Auswahl zeigen
+            pending = (frm, to)
+            refresh()
+            rem = choose_removal()
+            pending = None
+            if rem is None:
+                return False
+            if rem >= 0:
+                try:
+                    sock.sendall(f"REM {pl} {rem}\n".encode())
+                except Exception:
+                    return False
+        game.apply((frm, to, rem))
+        return True
     running = True
     while running:
         # process receive (non-blocking) /
@@ -2403,71 +2219,58 @@ def network_game_simple(screen, font, clock, conn_state):
             parts = line.split()
             if not parts: continue
             cmd = parts[0]
-            if cmd == "SET" and setzphase:
+            pl = game.current_player
+            if cmd == "SET" and pending is None and game.in_placement():
                 # supported: SET pos  or  SET player pos /
                 # Unterstützt: SET pos  oder  SET player pos
-                if len(parts) >= 3:
-                    try:
-                        pl = int(parts[1]); pos = int(parts[2])
-                    except Exception:
-                        pl = current_player; pos = int(parts[-1])
-                else:
-                    pl = current_player; pos = int(parts[1])
-                if 0 <= pos < len(state) and state[pos]==0 and pl in (1,2):
-                    state[pos] = pl
-                    stones_set[pl-1]+=1
-                    mill = update_mills(pos, pl)
-                    if not mill:
-                        current_player = 2 if pl==1 else 1
-                        update_repetition_and_draws(capture=False)
-                    if stones_set[0]==9 and stones_set[1]==9:
-                        setzphase = False
-            elif cmd == "REM":
+                try:
+                    pos = int(parts[-1])
+                except Exception:
+                    continue
+                if 0 <= pos < 24 and game.state[pos] == 0:
+                    if game.forms_mill(-1, pos):
+                        pending = (-1, pos)
+                    else:
+                        game.apply((-1, pos, -1))
+            elif cmd == "REM" and pending is not None:
                 # supported: REM pos  or  REM player pos /
                 # Unterstützt: REM pos  oder  REM player pos
-                if len(parts) >= 3:
-                    try:
-                        _pl = int(parts[1]); pos = int(parts[2])
-                    except Exception:
-                        pos = int(parts[-1])
-                else:
-                    pos = int(parts[1])
-                if 0 <= pos < len(state) and state[pos] in (1,2):
-                    state[pos]=0
+                try:
+                    pos = int(parts[-1])
+                except Exception:
+                    continue
                 # after removal, turn changes /
                 # Nach Entfernen wechselt die Seite
-                current_player = 2 if current_player==1 else 1
-                update_repetition_and_draws(capture=True)
-            elif cmd == "MOVE" and not setzphase:
+                frm, to = pending
+                pending = None
+                game.apply((frm, to, pos if game.bits[3 - pl] >> pos & 1 else -1))
+            elif cmd == "MOVE" and pending is None and not game.in_placement():
                 # supported: MOVE from to  or  MOVE player from to /
                 # Unterstützt: MOVE from to  oder  MOVE player from to
-                if len(parts) >= 4:
-                    try:
-                        pl = int(parts[1]); frm = int(parts[2]); to = int(parts[3])
-                    except Exception:
-                        pl = current_player; frm = int(parts[-2]); to = int(parts[-1])
-                else:
-                    pl = current_player; frm = int(parts[1]); to = int(parts[2])
-                if 0 <= frm < len(state) and 0 <= to < len(state) and state[frm] == pl and state[to]==0:
-                    state[frm]=0; state[to]=pl
-                    mill = update_mills(to, pl)
-                    if not mill:
-                        last_move_by_player[pl] = (frm, to)
-                        current_player = 2 if pl==1 else 1
-                        if update_repetition_and_draws(capture=False):
-                            return prompt_end_and_return(is_draw=True)
+                try:
+                    frm = int(parts[-2]); to = int(parts[-1])
+                except Exception:
+                    continue
+                if 0 <= frm < 24 and to in game.targets(frm) and game.bits[pl] >> frm & 1:
+                    if game.forms_mill(frm, to):
+                        pending = (frm, to)
+                    else:
+                        game.apply((frm, to, -1))
+        refresh()
         # Render
         draw_board()
-        # victory check only after setting phase /
-        # Siegprüfung erst nach Setzphase
-        if not setzphase:
-            w = check_win()
-            if w:
-                return prompt_end_and_return(win_color=w, is_draw=False)
+        # victory check only after setting phase, draw by tournament rules /
+        # Siegprüfung erst nach Setzphase, Remis nach Turnierregeln
+        if pending is None and not game.in_placement():
+            result = game.result()
+            if result in (1, 2):
+                return prompt_end_and_return(win_color=result, is_draw=False)
+            if result == 0:
+                return prompt_end_and_return(is_draw=True)
         # input only if it's our turn /
         # Eingaben nur, wenn wir am Zug sind
-        if current_player == local_color:
-            for ev in pygame.event.get():
+        if current_player == local_color and pending is None:
+            for ev in wait_events(sock=sock):
                 if ev.type == pygame.QUIT:
                     pygame.quit(); sys.exit()
                 elif ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
@@ -2477,118 +2280,41 @@ def network_game_simple(screen, font, clock, conn_state):
                     toggle_debug_overlay()
                 elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
                     mx, my = ev.pos
-                    if setzphase:
-                        if stones_set[current_player-1] < 9:
-                            for idx,(x,y) in enumerate(positions):
-                                if (mx-x)**2 + (my-y)**2 < HIT_R**2 and state[idx]==0:
-                                    state[idx]=current_player
-                                    stones_set[current_player-1]+=1
-                                    mill = update_mills(idx, current_player)
-                                    try:
-                                        sock.sendall(f"SET {current_player} {idx}\n".encode())
-                                    except Exception:
-                                        running=False; break
-                                    if mill:
-                                        # select removal /
-                                        # entfernen wählen
-                                        removing=True
-                                        while removing:
-                                            draw_board(tr("Mühle! Wähle einen gegnerischen Stein zum Entfernen."))
-                                            for ev2 in pygame.event.get():
-                                                if ev2.type==pygame.QUIT:
-                                                    pygame.quit(); sys.exit()
-                                                elif ev2.type==pygame.KEYDOWN and ev2.key==pygame.K_ESCAPE:
-                                                    if confirm_abort(tr("Netzwerkspiel wirklich beenden?")):
-                                                        running=False; removing=False; break
-                                                elif ev2.type==pygame.MOUSEBUTTONDOWN and ev2.button==1:
-                                                    mx2,my2 = ev2.pos
-                                                    opp = 2 if current_player==1 else 1
-                                                    for oi,(ox,oy) in enumerate(positions):
-                                                        if state[oi]==opp and (mx2-ox)**2+(my2-oy)**2 < HIT_R**2:
-                                                            state[oi]=0
-                                                            try:
-                                                                sock.sendall(f"REM {current_player} {oi}\n".encode())
-                                                            except Exception:
-                                                                running=False
-                                                            # when own removal done: turn to opponent /
-                                                            # Nach eigenem Entfernen: Zug an den Gegner
-                                                            current_player = 2 if current_player==1 else 1
-                                                            removing=False
-                                                            break
-                                            clock.tick(FPS)
-                                    else:
-                                        current_player = 2 if current_player==1 else 1
-                                    if stones_set[0]==9 and stones_set[1]==9:
-                                        setzphase=False
-                                    break
+                    if game.in_placement():
+                        for idx,(x,y) in enumerate(positions):
+                            if (mx-x)**2 + (my-y)**2 < HIT_R**2 and state[idx]==0:
+                                if not local_move(-1, idx):
+                                    running=False
+                                break
                     else:
-                        stones_local = [i for i,v in enumerate(state) if v==current_player]
                         if selected is None:
                             for i,(x,y) in enumerate(positions):
                                 if state[i]==current_player and (mx-x)**2+(my-y)**2 < HIT_R**2:
                                     selected = i; break
                         else:
-                            targets = []
-                            if len(stones_local)==3:
-                                targets = [i for i,v in enumerate(state) if v==0]
-                            else:
-                                targets = [j for j in get_adjacent(selected) if state[j]==0]
-                            for idx in targets:
+                            # legal targets incl. flying; anti-pendulum filtered by the rules engine /
+                            # erlaubte Ziele inkl. Springen; Anti-Pendeln filtert die Regel-Engine
+                            moved_now = False
+                            for idx in game.targets(selected):
                                 x,y = positions[idx]
                                 if (mx-x)**2 + (my-y)**2 < HIT_R**2:
-                                    frm = selected; to = idx
-                                    # tournament: check anti-pendulum immediate retreat /
-                                    # Turnier: Anti-Pendeln – kein sofortiges Zurückziehen
-                                    if is_tournament:
-                                        stones_local_now = [i for i,v in enumerate(state) if v==current_player]
-                                        if len(stones_local_now) > 3:
-                                            lm = last_move_by_player.get(current_player)
-                                            if (lm is not None) and lm == (to, frm):
-                                                draw_board(tr("Anti-Pendeln: mit demselben Stein sofort zurück ist verboten"))
-                                                pygame.time.wait(700)
-                                                break
-                                    state[frm]=0; state[to]=current_player
-                                    mill = update_mills(to, current_player)
-                                    try:
-                                        sock.sendall(f"MOVE {current_player} {frm} {to}\n".encode())
-                                    except Exception:
-                                        running=False; break
-                                    if mill:
-                                        removing=True
-                                        while removing:
-                                            draw_board(tr("Mühle! Wähle einen gegnerischen Stein zum Entfernen."))
-                                            for ev2 in pygame.event.get():
-                                                if ev2.type==pygame.QUIT:
-                                                    pygame.quit(); sys.exit()
-                                                elif ev2.type==pygame.KEYDOWN and ev2.key==pygame.K_ESCAPE:
-                                                    if confirm_abort(tr("Netzwerkspiel wirklich beenden?")):
-                                                        running=False; removing=False; break
-                                                elif ev2.type==pygame.MOUSEBUTTONDOWN and ev2.button==1:
-                                                    mx2,my2 = ev2.pos
-                                                    opp = 2 if current_player==1 else 1
-                                                    for oi,(ox,oy) in enumerate(positions):
-                                                        if state[oi]==opp and (mx2-ox)**2+(my2-oy)**2 < HIT_R**2:
-                                                            state[oi]=0
-                                                            try:
-                                                                sock.sendall(f"REM {current_player} {oi}\n".encode())
-                                                            except Exception:
-                                                                running=False
-                                                            # when own removal done: turn to opponent: draw tracker reset /
-                                                            # Nach eigenem Entfernen: Zug an den Gegner; Draw-Tracker resetten
-                                                            current_player = 2 if current_player==1 else 1
-                                                            last_move_by_player[current_player] = last_move_by_player.get(current_player, (-1,-1))
-                                                            if update_repetition_and_draws(capture=True):
-                                                                return prompt_end_and_return(is_draw=True)
-                                                            removing=False
-                                                            break
-                                            clock.tick(FPS)
-                                    else:
-                                        last_move_by_player[current_player] = (frm, to)
-                                        current_player = 2 if current_player==1 else 1
-                                        if update_repetition_and_draws(capture=False):
-                                            return prompt_end_and_return(is_draw=True)
+                                    if not local_move(selected, idx):
+                                        running=False
                                     selected = None
+                                    moved_now = True
                                     break
+                            if moved_now:
+                                break
+                            # tournament: forbidden immediate retreat clicked /
+                            # Turnier: verbotenes sofortiges Zurückziehen angeklickt
+                            if is_tournament:
+                                lm = game.last_move_by.get(current_player)
+                                if lm[1] == selected and lm[0] >= 0 and state[lm[0]] == 0:
+                                    x,y = positions[lm[0]]
+                                    if (mx-x)**2 + (my-y)**2 < HIT_R**2:
+                                        draw_board(tr("Anti-Pendeln: mit demselben Stein sofort zurück ist verboten"))
+                                        pygame.time.wait(700)
+                                        break
                             # selection change / 
                             # Auswahl wechseln
                             for i,(x,y) in enumerate(positions):
@@ -2598,7 +2324,7 @@ def network_game_simple(screen, font, clock, conn_state):
         else:
             # not our turn: show escape/quit reactions anyway /
             # Nicht am Zug: Trotzdem ESC/QUIT reagieren
-            for ev in pygame.event.get():
+            for ev in wait_events(sock=sock):
                 if ev.type == pygame.QUIT:
                     pygame.quit(); sys.exit()
                 elif ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
@@ -2609,11 +2335,10 @@ def network_game_simple(screen, font, clock, conn_state):
         clock.tick(FPS)
 
 def select_difficulty(screen, font, clock):
-    # easy selection Easy/Medium/Hard /
-    # Einfache Auswahl Leicht/Mittel/Schwer
+    # easy selection Easy/Medium/Hard/Monte Carlo /
+    # Einfache Auswahl Leicht/Mittel/Schwer/Monte Carlo
     idx = 0
     running = True
-    title_font = pygame.font.SysFont("FreeSans", 54)
     while running:
         draw_pre_game_background(screen, overlay_alpha=125)
         title_surf = render_fit_text("Spielstärke wählen", (255,255,255), max_width=WIDTH-60, base_size=54, min_size=24)
@@ -2629,7 +2354,7 @@ def select_difficulty(screen, font, clock):
         hint = render_fit_text("↑/↓ wählen, Enter bestätigen, ESC abbrechen", (180,180,140), max_width=WIDTH-80, base_size=24, min_size=14)
         screen.blit(hint, (WIDTH//2 - hint.get_width()//2, HEIGHT-80))
         pygame.display.flip()
-        for event in pygame.event.get():
+        for event in wait_events():
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             elif event.type == pygame.KEYDOWN:
@@ -2661,7 +2386,6 @@ def select_difficulty(screen, font, clock):
 
 def select_ruleset(screen, font, clock):
     idx = 0
-    title_font = pygame.font.SysFont("FreeSans", 54)
     while True:
         draw_pre_game_background(screen, overlay_alpha=125)
         title_surf = render_fit_text("Regelset wählen", (255,255,255), max_width=WIDTH-60, base_size=54, min_size=24)
@@ -2677,7 +2401,7 @@ def select_ruleset(screen, font, clock):
         hint = render_fit_text("↑/↓ wählen, Enter bestätigen, ESC abbrechen", (180,180,140), max_width=WIDTH-80, base_size=24, min_size=14)
         screen.blit(hint, (WIDTH//2 - hint.get_width()//2, HEIGHT-80))
         pygame.display.flip()
-        for event in pygame.event.get():
+        for event in wait_events():
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             elif event.type == pygame.KEYDOWN:
@@ -2707,6 +2431,55 @@ def select_ruleset(screen, font, clock):
                         return RULESET_OPTIONS[i]
         clock.tick(FPS)
 
+def select_think_time(screen, font, clock):
+    # time budget per move for iterative deepening /
+    # Zeitbudget pro Zug für die iterative Vertiefung
+    idx = 0
+    while True:
+        draw_pre_game_background(screen, overlay_alpha=125)
+        title_surf = render_fit_text("Bedenkzeit wählen", (255,255,255), max_width=WIDTH-60, base_size=54, min_size=24)
+        screen.blit(title_surf, (WIDTH//2 - title_surf.get_width()//2, 60))
+        option_surfs = []
+        for i, opt in enumerate(THINK_TIME_OPTIONS):
+            color = (0,220,0) if i==idx else (220,220,220)
+            surf = render_fit_text(opt, color, max_width=WIDTH-120, base_size=FONT_SIZE, min_size=18)
+            option_surfs.append(surf)
+            x = WIDTH//2 - surf.get_width()//2
+            y = 180 + i*70
+            screen.blit(surf, (x,y))
+        hint = render_fit_text("↑/↓ wählen, Enter bestätigen, ESC abbrechen", (180,180,140), max_width=WIDTH-80, base_size=24, min_size=14)
+        screen.blit(hint, (WIDTH//2 - hint.get_width()//2, HEIGHT-80))
+        pygame.display.flip()
+        for event in wait_events():
+            if event.type == pygame.QUIT:
+                pygame.quit(); sys.exit()
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return None
+                elif event.key == pygame.K_UP:
+                    idx = (idx - 1) % len(THINK_TIME_OPTIONS)
+                elif event.key == pygame.K_DOWN:
+                    idx = (idx + 1) % len(THINK_TIME_OPTIONS)
+                elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_SPACE):
+                    return THINK_TIME_OPTIONS[idx]
+            elif event.type == pygame.MOUSEMOTION:
+                mx, my = event.pos
+                for i, surf in enumerate(option_surfs):
+                    x = WIDTH//2 - surf.get_width()//2
+                    y = 180 + i*70
+                    rect = pygame.Rect(x, y, surf.get_width(), surf.get_height())
+                    if rect.collidepoint(mx, my):
+                        idx = i
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                mx, my = event.pos
+                for i, surf in enumerate(option_surfs):
+                    x = WIDTH//2 - surf.get_width()//2
+                    y = 180 + i*70
+                    rect = pygame.Rect(x, y, surf.get_width(), surf.get_height())
+                    if rect.collidepoint(mx, my):
+                        return THINK_TIME_OPTIONS[i]
+        clock.tick(FPS)
+
 def simple_menu(screen, font, clock, options):
     # easy selection, returns index (0..n-1), ESC -> 0 /
     # Einfache Auswahl, gibt Index zurück (0..n-1), ESC -> 0
@@ -2727,7 +2500,7 @@ def simple_menu(screen, font, clock, options):
         hint = render_fit_text(tr("↑/↓ wählen, Enter bestätigen, ESC zurück"), (180,180,140), max_width=WIDTH-80, base_size=22, min_size=14)
         screen.blit(hint, (WIDTH//2 - hint.get_width()//2, HEIGHT-80))
         pygame.display.flip()
-        for event in pygame.event.get():
+        for event in wait_events():
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             elif event.type == pygame.KEYDOWN:
@@ -2761,7 +2534,7 @@ def pygame_text_input(screen, font, prompt, initial_value="", numeric=False):
     # easy text input in pygame (fallback without OS dialog) /
     # Einfache Text-Eingabe in Pygame (Fallback ohne OS-Dialog)
     value = str(initial_value)
-    input_font = pygame.font.SysFont("FreeSans", 28)
+    input_font = get_font(28)
     active = True
     while active:
         screen.fill((30,30,30))
@@ -2774,7 +2547,7 @@ def pygame_text_input(screen, font, prompt, initial_value="", numeric=False):
         hint_surf = input_font.render(hint, True, (160,160,120))
         screen.blit(hint_surf, (WIDTH//2 - hint_surf.get_width()//2, HEIGHT//2 + 60))
         pygame.display.flip()
-        for event in pygame.event.get():
+        for event in wait_events():
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             elif event.type == pygame.KEYDOWN:
@@ -2797,8 +2570,6 @@ def pygame_text_input(screen, font, prompt, initial_value="", numeric=False):
         pygame.time.Clock().tick(FPS)
 
 def network_wuerfeln_host(screen, font, clock):
-    info_font = pygame.font.SysFont("FreeSans", 36)
-    result_font = pygame.font.SysFont("FreeSans", 54)
     host_roll = random.randint(1,6)
     client_roll = random.randint(1,6)
     while client_roll == host_roll:
@@ -2828,15 +2599,13 @@ def network_wuerfeln_host(screen, font, clock):
     pygame.display.flip()
     waiting=True
     while waiting:
-        for e in pygame.event.get():
+        for e in wait_events():
             if e.type==pygame.QUIT: pygame.quit(); sys.exit()
             elif e.type==pygame.KEYDOWN and e.key==pygame.K_SPACE: waiting=False
         clock.tick(FPS)
     return host_roll, client_roll, host_starts
 
 def network_show_wuerfel_result(screen, font, clock, du_roll, gegner_roll, du_beginnt):
-    info_font = pygame.font.SysFont("FreeSans", 36)
-    result_font = pygame.font.SysFont("FreeSans", 54)
     screen.fill((20,20,20))
     t1 = render_fit_text(tr("Würfelergebnis"), (220,220,220), max_width=WIDTH-60, base_size=36, min_size=18)
     screen.blit(t1, (WIDTH//2 - t1.get_width()//2, 100))
@@ -2861,7 +2630,7 @@ def network_show_wuerfel_result(screen, font, clock, du_roll, gegner_roll, du_be
     pygame.display.flip()
     waiting=True
     while waiting:
-        for e in pygame.event.get():
+        for e in wait_events():
             if e.type==pygame.QUIT: pygame.quit(); sys.exit()
             elif e.type==pygame.KEYDOWN and e.key==pygame.K_SPACE: waiting=False
         clock.tick(FPS)
@@ -2989,506 +2758,6 @@ def network_spiel_view(screen, font, clock, conn_state):
     # alias for the real network game; kept for compatibility /
     # Alias für das echte Netzwerkspiel; behalten für Kompatibilität
     return network_game_simple(screen, font, clock, conn_state)
-    # when handshake rules/start, local ruleset from conn_state übernehmen
-    # Nach Handshake RULES/START: lokales ruleset aus conn_state übernehmen
-    ruleset = conn_state.get('ruleset', ruleset)
-    local_color = conn_state["color"] or 1
-    mode = conn_state.get('mode', 'host')
-    # identities host/client -> player number/color /
-    # host color depends on dice; for client side derived in handshake /
-    # Identität Host/Client -> Spieler-Nummer/Farbe
-    # Host-Farbe hängt vom Würfeln ab. Für Client-Seite wird sie im Handshake abgeleitet.
-    host_color = local_color if mode == 'host' else (1 if local_color == 2 else 2)
-    client_color = 2 if host_color == 1 else 1
-    def net_label(player):
-        ident = "Host" if player == host_color else "Client"
-        num = "Spieler 1" if player == 1 else "Spieler 2"
-        col = "Weiß" if player == 1 else "Schwarz"
-        you = " (DU)" if player == local_color else ""
-        return f"{ident} / {num} ({col}){you}"
-    current_player = 1  # Weiß beginnt
-    setzphase = True
-    selected = None
-    winner = None
-    # layout-/scaling parameters like in singleplayer /
-    # Layout-/Skalierungsparameter analog zum Einzelspieler
-    ui_scale = max(0.6, min(WIDTH, HEIGHT) / 800.0)
-    INFO_Y = max(10, int(30 * ui_scale) - 20)
-    COUNTER_MARGIN = int(40 * ui_scale)
-    COUNTER_R = max(6, int(16 * ui_scale))
-    COUNTER_Y_TOP = max(INFO_Y + 40, int(90 * ui_scale) - 20)
-    COUNTER_Y_BOT = min(HEIGHT - 20, HEIGHT - int(90 * ui_scale) + 50)
-    # fine-tuning: analog: white down 20px, black up 20px /
-    # Feinanpassung analog: Weiß 20px nach unten, Schwarz 20px nach oben
-    COUNTER_Y_TOP = min(COUNTER_Y_TOP + 20, HEIGHT - 100)
-    COUNTER_Y_BOT = max(COUNTER_Y_BOT - 20, COUNTER_Y_TOP + 100)
-    top_free = (COUNTER_Y_TOP) + COUNTER_R + int(20 * ui_scale)
-    bottom_free = COUNTER_Y_BOT - COUNTER_R - int(20 * ui_scale)
-    margin_x = int(40 * ui_scale)
-    board_scale_y = max(0.5, (bottom_free - top_free) / (2.0 * 260))
-    board_scale_x = max(0.5, (WIDTH - 2.0 * margin_x) / (2.0 * 260))
-    board_scale = min(ui_scale, board_scale_x, board_scale_y)
-    cx = WIDTH//2
-    cy = int((top_free + bottom_free)//2)
-    compact = 0.9
-    outer, mid, inner = int(260*compact*board_scale), int(180*compact*board_scale), int(100*compact*board_scale)
-    positions = [
-        (cx-outer, cy-outer), (cx, cy-outer), (cx+outer, cy-outer), (cx+outer, cy), (cx+outer, cy+outer), (cx, cy+outer), (cx-outer, cy+outer), (cx-outer, cy),
-        (cx-mid, cy-mid), (cx, cy-mid), (cx+mid, cy-mid), (cx+mid, cy), (cx+mid, cy+mid), (cx, cy+mid), (cx-mid, cy+mid), (cx-mid, cy),
-        (cx-inner, cy-inner), (cx, cy-inner), (cx+inner, cy-inner), (cx+inner, cy), (cx+inner, cy+inner), (cx, cy+inner), (cx-inner, cy+inner), (cx-inner, cy)
-    ]
-    lines_draw = [
-        (0,1),(1,2),(2,3),(3,4),(4,5),(5,6),(6,7),(7,0),
-        (8,9),(9,10),(10,11),(11,12),(12,13),(13,14),(14,15),(15,8),
-        (16,17),(17,18),(18,19),(19,20),(20,21),(21,22),(22,23),(23,16),
-        (1,9),(3,11),(5,13),(7,15),(9,17),(11,19),(13,21),(15,23)
-    ]
-    def check_muehle(pos, player):
-        neue = False
-        for idx, m in enumerate(muhlen):
-            if sorted(m) in diagonale_blacklist: continue
-            if pos in m and all(state[i]==player for i in m):
-                if idx not in last_mills[player]:
-                    last_mills[player].add(idx); neue = True
-            else:
-                if idx in last_mills[player]:
-                    last_mills[player].remove(idx)
-        return neue
-    def has_moves(player):
-        stones = [i for i,v in enumerate(state) if v==player]
-        if len(stones)==3:
-            return any(v==0 for v in state)
-        for s in stones:
-            for a,b in lines_draw:
-                if a==s and state[b]==0: return True
-                if b==s and state[a]==0: return True
-        return False
-    def check_win():
-        if sum(1 for v in state if v==1)<3: return 2
-        if sum(1 for v in state if v==2)<3: return 1
-        if not has_moves(1): return 2
-        if not has_moves(2): return 1
-        return None
-    def draw_board(info_line=""):
-        screen.fill((240,220,180))
-        for a,b in lines_draw:
-            pygame.draw.line(screen, (120,100,80), positions[a], positions[b], max(2, int(5*board_scale)))
-        node_r = max(8, int(16*board_scale))
-        piece_r = max(12, int(24*board_scale))
-        for idx,(x,y) in enumerate(positions):
-            color=(200,180,120)
-            if state[idx]==1: color=(255,255,255)
-            elif state[idx]==2: color=(0,0,0)
-            sel_r = max(30, int(28*board_scale))
-            if selected == idx:
-                # selection highlight like in human-vs-AI mode /
-                # Auswahl hervorheben wie im Mensch-vs-SL-Modus
-                pygame.draw.circle(screen, (0,220,0), (x, y), sel_r, 3)
-            rad = piece_r if state[idx] else node_r
-            pygame.draw.circle(screen, color,(x,y), rad, 0 if state[idx] else 3)
-            # anti pendulum: if last own moved piece is selected,
-            # mark only the forbidden retreat target field in red /
-            # Anti-Pendeln: wenn der zuletzt gezogene eigene Stein ausgewählt ist,
-            # markiere nur das verbotene Rückzugs-Zielfeld rot
-            if ruleset == 'Turnier' and selected is not None:
-                mv = last_move_by.get(current_player, (-1, -1))  # (from, to)
-                if selected == mv[1] and idx == mv[0]:
-                    pygame.draw.circle(screen, (220,40,40), (x, y), sel_r, 2)
-        # stone counters top/bottom (white top, black bottom) – full 9 slots, gray placeholders first /
-        # Stein-Counter oben/unten (oben Weiß, unten Schwarz) – volle 9 Slots, graue Platzhalter zuerst
-        margin_lr = 50
-        steps = 8  # 9 Slots -> 8 Abstände
-        width_avail = max(1, WIDTH - 2*margin_lr)
-        spacing = max(piece_r*2 + 6, width_avail // steps)
-        start_x = margin_lr
-        r = piece_r
-        total = 9
-        # top: first all placeholders, then remaining white stones on top /
-        # Oben: zuerst alle Platzhalter, dann verbleibende weiße Steine drüber
-        remain_w = max(0, total - stones_set[0])
-        y_top = COUNTER_Y_TOP + 20
-        for i in range(9):
-            x = start_x + i*spacing
-            pygame.draw.circle(screen, (185,180,160), (x, y_top), r, 0)
-            pygame.draw.circle(screen, (140,130,110), (x, y_top), r, 1)
-        for i in range(remain_w):
-            x = start_x + i*spacing
-            pygame.draw.circle(screen, (255,255,255), (x, y_top), r, 0)
-            pygame.draw.circle(screen, (100,90,70), (x, y_top), r, 2)
-        # bottom: same for black /
-        # Unten: analog für Schwarz
-        remain_b = max(0, total - stones_set[1])
-        y_bot = COUNTER_Y_BOT - 20
-        for i in range(9):
-            x = start_x + i*spacing
-            pygame.draw.circle(screen, (185,180,160), (x, y_bot), r, 0)
-            pygame.draw.circle(screen, (140,130,110), (x, y_bot), r, 1)
-        for i in range(remain_b):
-            x = start_x + i*spacing
-            pygame.draw.circle(screen, (0,0,0), (x, y_bot), r, 0)
-            pygame.draw.circle(screen, (100,90,70), (x, y_bot), r, 2)
-        if info_line:
-            # somewhat smaller max_width for nice margins in network mode /
-            # Etwas kleineres max_width für angenehme Ränder im Netzwerkmodus
-            surf = render_fit_text(info_line, (60,40,20), max_width=WIDTH-160, base_size=FONT_SIZE, min_size=18)
-            screen.blit(surf,(WIDTH//2 - surf.get_width()//2, INFO_Y))
-        # tournament overlay with clear left/right assignment (two-line without '|') /
-        # Turnier-Overlay mit klarer Zuordnung links/rechts (zweizeilig ohne '|')
-        if ruleset == 'Turnier':
-            tiny_font = pygame.font.SysFont('FreeSans', 16)
-            rep_w = position_counts.get((tuple(state), 1), 0)
-            rep_s = position_counts.get((tuple(state), 2), 0)
-            col_inactive = (80,60,40)
-            col_active = (200,140,60)
-            mid_y = HEIGHT//2
-            # left: white /
-            # Links: Weiß
-            color_w = col_active if current_player==1 else col_inactive
-            label_w = tiny_font.render('Weiß', True, color_w)
-            rep_w_surf = tiny_font.render(f'Rep: {rep_w}/3', True, color_w)
-            hz_w_surf = tiny_font.render(f'HZ: {halfmove_clock}', True, color_w)
-            left_x = 12
-            screen.blit(label_w, (left_x, mid_y - 28))
-            screen.blit(rep_w_surf, (left_x, mid_y - 8))
-            screen.blit(hz_w_surf, (left_x, mid_y + 10))
-            # right: black /
-            # Rechts: Schwarz
-            color_s = col_active if current_player==2 else col_inactive
-            label_s = tiny_font.render('Schwarz', True, color_s)
-            rep_s_surf = tiny_font.render(f'Rep: {rep_s}/3', True, color_s)
-            hz_s_surf = tiny_font.render(f'HZ: {halfmove_clock}', True, color_s)
-            right_x = WIDTH - 12
-            screen.blit(label_s, (right_x - label_s.get_width(), mid_y - 28))
-            screen.blit(rep_s_surf, (right_x - rep_s_surf.get_width(), mid_y - 8))
-            screen.blit(hz_s_surf, (right_x - hz_s_surf.get_width(), mid_y + 10))
-        pygame.display.flip()
-    # send securely; on error, report peer left and exit game /
-    # Sicher senden; bei Fehler Peer-Abbruch melden und Spiel verlassen
-    def send_safe(msg: str):
-        try:
-            sock.sendall(msg.encode())
-            return True
-        except Exception:
-            peer = "Client" if conn_state.get("mode") == "host" else "Host"
-            close_conn_state(conn_state)
-            show_peer_left(peer)
-            return False
-    # barrier: after mill, opponent must remove a stone / 
-    # Sperre: Nach Mühlenbildung muss der entsprechende Spieler einen gegnerischen Stein entfernen
-    removal_pending = False
-    pending_remover = None  # 1 oder 2
-    running = True
-    while running:
-        # incoming messages processing /
-        # Eingehende Nachrichten verarbeiten
-        lines_in, buffer, closed = network_receive_lines(sock, buffer)
-        if closed:
-            # determine peer role: from host view, peer is client, else host /
-            # Bestimme Peer-Rolle: aus Sicht Host ist Peer der Client, sonst der Host
-            peer = "Client" if conn_state.get("mode") == "host" else "Host"
-            close_conn_state(conn_state)
-            show_peer_left(peer)
-            return
-        for line in lines_in:
-            parts = line.split()
-            if parts[0]=="SET":
-                # SET pos  or  SET player pos
-                # SET pos  oder  SET player pos
-                if len(parts) >= 3:
-                    try:
-                        pl = int(parts[1]); pos = int(parts[2])
-                    except Exception:
-                        pl = current_player; pos = int(parts[-1])
-                else:
-                    pl = current_player; pos = int(parts[1])
-                if not removal_pending and setzphase and 0 <= pos < len(state) and state[pos]==0 and stones_set[pl-1] < 9:
-                    state[pos]=pl
-                    stones_set[pl-1]+=1
-                    mill = check_muehle(pos,pl)
-                    if mill:
-                        removal_pending = True
-                        pending_remover = pl
-                    else:
-                        current_player = 2 if pl==1 else 1
-                    if stones_set[0]==9 and stones_set[1]==9:
-                        setzphase=False
-            elif parts[0]=="REM":
-                # REM pos  or  REM player pos
-                # REM pos  oder  REM player pos
-                if len(parts) >= 3:
-                    try:
-                        _pl = int(parts[1]); pos = int(parts[2])
-                    except Exception:
-                        pos = int(parts[-1])
-                else:
-                    pos=int(parts[1])
-                if 0<=pos<len(state) and state[pos] in (1,2):
-                    state[pos]=0
-                if removal_pending:
-                    # when removal done, switch turn to opponent /
-                    # Nach Entfernen: Zug an den Gegner
-                    removal_pending = False
-                    if pending_remover is not None:
-                        current_player = 2 if pending_remover==1 else 1
-                        pending_remover = None
-                if ruleset == 'Turnier':
-                    update_draw_state(captured=True)
-            elif parts[0]=="MOVE":
-                # move from to  or  MOVE player from to
-                # MOVE from to  oder  MOVE player from to
-                if len(parts) >= 4:
-                    try:
-                        pl = int(parts[1]); frm = int(parts[2]); to = int(parts[3])
-                    except Exception:
-                        pl = current_player; frm = int(parts[-2]); to = int(parts[-1])
-                else:
-                    pl = current_player; frm=int(parts[1]); to=int(parts[2])
-                if not removal_pending and not setzphase and 0<=frm<len(state) and 0<=to<len(state) and state[frm] == pl and state[to]==0:
-                    state[frm]=0; state[to]=pl
-                    mill = check_muehle(to,pl)
-                    if mill:
-                        removal_pending = True
-                        pending_remover = pl
-                    else:
-                        current_player = 2 if pl==1 else 1
-                    # Merke letzte Bewegung des Gegners für Anti-Pendeln
-                    if ruleset == 'Turnier':
-                        last_move_by[pl] = (frm, to)
-                        if not mill:
-                            update_draw_state(captured=False)
-            elif parts[0]=="WIN":
-                winner = int(parts[1]); running=False
-            elif parts[0]=="DRAW":
-                is_draw = True; running=False
-        info = ("Setzphase" if setzphase else "Zugphase") + " - " + net_label(current_player) \
-            + ("  |  Turnierregeln" if ruleset=='Turnier' else "")
-        draw_board(info)
-        if winner or (ruleset=='Turnier' and is_draw):
-            if conn_state.get('match'):
-                prompt = (f"Spielende! {net_label(winner)} gewinnt  (SPACE=Weiter, ESC=Abbruch)" if winner
-                          else "Spielende! Remis nach Turnierregeln  (SPACE=Weiter, ESC=Abbruch)")
-                draw_board(prompt)
-                wait=True
-                aborted = False
-                while wait:
-                    for e in pygame.event.get():
-                        if e.type==pygame.QUIT:
-                            pygame.quit(); sys.exit()
-                        elif e.type==pygame.KEYDOWN and e.key==pygame.K_ESCAPE:
-                            aborted = True; wait=False
-                        elif e.type==pygame.KEYDOWN and e.key==pygame.K_SPACE:
-                            wait=False
-                    clock.tick(FPS)
-                if aborted:
-                    winner = None
-                break
-            else:
-                end = (f"Spielende! {'Weiß' if winner==1 else 'Schwarz'} gewinnt (ESC)" if winner \
-                       else "Spielende! Remis nach Turnierregeln (ESC)")
-                draw_board(end)
-                wait=True
-                while wait:
-                    for e in pygame.event.get():
-                        if e.type==pygame.QUIT: pygame.quit(); sys.exit()
-                        elif e.type==pygame.KEYDOWN and e.key==pygame.K_ESCAPE: wait=False
-                    clock.tick(FPS)
-                break
-        # local player on turn? /
-        # Lokaler Spieler am Zug?
-        if current_player == local_color:
-            # when opponent must remove, no input allowed /
-            # Wenn Gegner entfernen muss, keine Eingabe zulassen
-            if removal_pending and pending_remover != local_color:
-                draw_board(tr("Gegner entfernt einen Stein..."))
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit(); sys.exit()
-                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                        if confirm_abort("Netzwerkspiel wirklich beenden?"):
-                            close_conn_state(conn_state)
-                            return None
-                clock.tick(FPS)
-                continue
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit(); sys.exit()
-                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    if confirm_abort("Netzwerkspiel wirklich beenden?"):
-                        close_conn_state(conn_state)
-                        return None
-                elif event.type == pygame.MOUSEBUTTONDOWN and event.button==1:
-                    mx,my = event.pos
-                    if setzphase:
-                        if stones_set[current_player-1] <9 and not removal_pending:
-                            for idx,(x,y) in enumerate(positions):
-                                if (mx-x)**2+(my-y)**2 < 22**2 and state[idx]==0 and stones_set[current_player-1] < 9:
-                                    state[idx]=current_player
-                                    stones_set[current_player-1]+=1
-                                    mill = check_muehle(idx,current_player)
-                                    # Senden
-                                    if not send_safe(f"SET {current_player} {idx}\n"):
-                                        running=False; break
-                                    if mill:
-                                        # select removal
-                                        # Entfernen wählen
-                                        removing=True
-                                        while removing:
-                                            for ev2 in pygame.event.get():
-                                                if ev2.type==pygame.QUIT: pygame.quit(); sys.exit()
-                                                elif ev2.type==pygame.KEYDOWN and ev2.key==pygame.K_ESCAPE:
-                                                    if confirm_abort("Netzwerkspiel wirklich beenden?"):
-                                                        close_conn_state(conn_state)
-                                                        return None
-                                                elif ev2.type==pygame.MOUSEBUTTONDOWN and ev2.button==1:
-                                                    mx2,my2=ev2.pos
-                                                    opponents=[i for i,v in enumerate(state) if v==(2 if current_player==1 else 1)]
-                                                    for oi in opponents:
-                                                        ox,oy=positions[oi]
-                                                        if (mx2-ox)**2+(my2-oy)**2<22**2:
-                                                            state[oi]=0
-                                                            if not send_safe(f"REM {current_player} {oi}\n"):
-                                                                removing=False; running=False; break
-                                                            # when own removal done, switch turn to opponent /
-                                                            # Nach eigenem Entfernen: Zug an den Gegner
-                                                            current_player = 2 if current_player==1 else 1
-                                                            if ruleset=='Turnier':
-                                                                update_draw_state(captured=True)
-                                                            removing=False
-                                                            break
-                                            draw_board(tr("Mühle! Entferne gegnerischen Stein."))
-                                            clock.tick(FPS)
-                                    # setting phase over / player switch
-                                    # Setzphase Ende / Spielerwechsel
-                                    if stones_set[0]==9 and stones_set[1]==9:
-                                        setzphase=False
-                                    if not mill:
-                                        current_player = 2 if current_player==1 else 1
-                                        if ruleset=='Turnier':
-                                            update_draw_state(captured=False)
-                                    break
-                    else:  # moving phase / Zugphase
-                        stones_local=[i for i,v in enumerate(state) if v==current_player]
-                        if len(stones_local)==3:
-                            # Springen
-                            for idx,(x,y) in enumerate(positions):
-                                if (mx-x)**2+(my-y)**2<22**2:
-                                    if state[idx]==0 and selected is not None:
-                                        # anti pendulum immediate retreat prevention /
-                                        # Anti-Pendeln unmittelbares Zurückziehen verhindern
-                                        if ruleset=='Turnier' and last_move_by.get(current_player) == (idx, selected):
-                                            continue
-                                        state[selected]=0; state[idx]=current_player
-                                        mill = check_muehle(idx,current_player)
-                                        if not send_safe(f"MOVE {current_player} {selected} {idx}\n"):
-                                            running=False; break
-                                        if mill:
-                                            # Entfernen
-                                            removing=True
-                                            while removing:
-                                                for ev2 in pygame.event.get():
-                                                    if ev2.type==pygame.QUIT: pygame.quit(); sys.exit()
-                                                    elif ev2.type==pygame.KEYDOWN and ev2.key==pygame.K_ESCAPE:
-                                                        if confirm_abort("Netzwerkspiel wirklich beenden?"):
-                                                            close_conn_state(conn_state)
-                                                            return None
-                                                    elif ev2.type==pygame.MOUSEBUTTONDOWN and ev2.button==1:
-                                                        mx2,my2=ev2.pos
-                                                        opponents=[i for i,v in enumerate(state) if v==(2 if current_player==1 else 1)]
-                                                        for oi in opponents:
-                                                            ox,oy=positions[oi]
-                                                            if (mx2-ox)**2+(my2-oy)**2<22**2:
-                                                                state[oi]=0
-                                                                if not send_safe(f"REM {current_player} {oi}\n"):
-                                                                    removing=False; running=False; break
-                                                                removing=False
-                                                                break
-                                                draw_board(tr("Mühle! Entferne gegnerischen Stein."))
-                                                clock.tick(FPS)
-                                        last_move = (current_player, selected, idx)
-                                        selected=None
-                                        current_player = 2 if current_player==1 else 1
-                                        if ruleset=='Turnier' and not mill:
-                                            update_draw_state(captured=False)
-                                        break
-                                    elif state[idx]==current_player:
-                                        selected=idx
-                                        break
-                        else:
-                            # normal move along lines /
-                            # Normales Ziehen entlang Linien
-                            if selected is None:
-                                for idx,(x,y) in enumerate(positions):
-                                    if (mx-x)**2+(my-y)**2<22**2 and state[idx]==current_player:
-                                        selected=idx; break
-                            else:
-                                # neighbor? / Nachbar?
-                                neigh = []
-                                for a,b in lines_draw:
-                                    if a==selected: neigh.append(b)
-                                    elif b==selected: neigh.append(a)
-                                for idx,(x,y) in enumerate(positions):
-                                    if (mx-x)**2+(my-y)**2<22**2 and idx in neigh and state[idx]==0:
-                                        if ruleset=='Turnier' and last_move_by.get(current_player) == (idx, selected):
-                                            continue
-                                        state[selected]=0; state[idx]=current_player
-                                        mill = check_muehle(idx,current_player)
-                                        if not send_safe(f"MOVE {current_player} {selected} {idx}\n"):
-                                            running=False; break
-                                        if mill:
-                                            removing=True
-                                            while removing:
-                                                for ev2 in pygame.event.get():
-                                                    if ev2.type==pygame.QUIT: pygame.quit(); sys.exit()
-                                                    elif ev2.type==pygame.KEYDOWN and ev2.key==pygame.K_ESCAPE:
-                                                        if confirm_abort("Netzwerkspiel wirklich beenden?"):
-                                                            removing=False; running=False; break
-                                                    elif ev2.type==pygame.MOUSEBUTTONDOWN and ev2.button==1:
-                                                        mx2,my2=ev2.pos
-                                                        opponents=[i for i,v in enumerate(state) if v==(2 if current_player==1 else 1)]
-                                                        for oi in opponents:
-                                                            ox,oy=positions[oi]
-                                                            if (mx2-ox)**2+(my2-oy)**2<22**2:
-                                                                state[oi]=0
-                                                                if not send_safe(f"REM {current_player} {oi}\n"):
-                                                                    removing=False; running=False; break
-                                                                removing=False
-                                                                break
-                                                draw_board(tr("Mühle! Entferne gegnerischen Stein."))
-                                                clock.tick(FPS)
-                                        last_move_by[current_player] = (selected, idx)
-                                        selected=None
-                                        current_player = 2 if current_player==1 else 1
-                                        if ruleset=='Turnier' and not mill:
-                                            update_draw_state(captured=False)
-                                        break
-                                # possibility to change selection /
-                                # Möglichkeit Auswahl wechseln
-                                for idx,(x,y) in enumerate(positions):
-                                    if (mx-x)**2+(my-y)**2<22**2 and state[idx]==current_player:
-                                        selected=idx; break
-        else:
-            # if not on turn: still process events like QUIT /
-            # Wenn nicht am Zug: trotzdem Events wie QUIT verarbeiten
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit(); sys.exit()
-                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    if confirm_abort("Netzwerkspiel wirklich beenden?"):
-                        close_conn_state(conn_state)
-                        return None
-    # check win/draw only when setting phase is over
-    # Sieg prüfen erst nach der Setzphase
-        if not setzphase:
-            w = check_win()
-            if w:
-                winner = w
-                send_safe(f"WIN {w}\n")
-            elif ruleset=='Turnier' and is_draw:
-                send_safe("DRAW\n")
-                # display at the beginning of next loop /
-                # Anzeige erfolgt zu Beginn der nächsten Schleife
-        clock.tick(FPS)
-    return winner
 
 
 def spielfeld_view_rematch(screen, font, clock, starter):
@@ -3526,7 +2795,7 @@ def show_rematch_score(screen, font, siege, spiele):
     pygame.display.flip()
     waiting = True
     while waiting:
-        for event in pygame.event.get():
+        for event in wait_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -3552,7 +2821,7 @@ def show_rematch_end(screen, font, siege):
     pygame.display.flip()
     waiting = True
     while waiting:
-        for event in pygame.event.get():
+        for event in wait_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -3583,7 +2852,7 @@ def show_rematch_score_custom(screen, font, left_label, right_label, left_score,
     pygame.display.flip()
     waiting = True
     while waiting:
-        for event in pygame.event.get():
+        for event in wait_events():
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
@@ -3644,7 +2913,7 @@ def show_rematch_end_custom(screen, font, left_label, right_label, left_score, r
     tclock = pygame.time.Clock()
     gravity = 0.04
     while waiting:
-        for event in pygame.event.get():
+        for event in (pygame.event.get() if fireworks_enabled else wait_events()):
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
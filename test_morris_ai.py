@@ -0,0 +1,215 @@
+"""
+Nine Men's Morris Game - tests of the AI (morris_ai)
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+"""
+
+import random
+import threading
+import time
+
+import pytest
+
+import morris_ai
+import morris_board
+import morris_pool
+from morris_ai import WIN_SCORE, Searcher, evaluate
+from morris_game import MorrisGame
+from morris_tt import TranspositionTable
+
+
+def minimax(game, depth, ply=0):
+    """Negamax ohne Schnitte und Sortierung, mit denselben Endbedingungen wie die Suche."""
+    player = game.current_player
+    if game.stones_on_board(player) + game.in_hand(player) < 3:
+        return -WIN_SCORE + ply
+    if game.is_draw():
+        return 0
+    moves = game.legal_moves()
+    if depth <= 0 or not moves:
+        return evaluate(game, player) if moves else -WIN_SCORE + ply
+    best = -WIN_SCORE - 1
+    for move in moves:
+        game.apply(move)
+        best = max(best, -minimax(game, depth - 1, ply + 1))
+        game.undo()
+    return best
+
+
+def positions(ruleset, plies, count=4, seed=1):
+    rng = random.Random(seed)
+    for _ in range(count):
+        game = MorrisGame(ruleset)
+        for _ in range(plies):
+            if game.result() is not None:
+                break
+            game.apply(rng.choice(game.legal_moves()))
+        if game.result() is None:
+            yield game
+
+
+def children(game):
+    for move in game.legal_moves():
+        child = game.copy()
+        child.apply(move)
+        yield child
+
+
+@pytest.mark.parametrize("ruleset", ["Entschärft", "Turnier"])
+@pytest.mark.parametrize("plies", [5, 14, 30, 60])
+@pytest.mark.parametrize("depth", [1, 2, 3])
+def test_alpha_beta_matches_minimax(ruleset, plies, depth):
+    for game in positions(ruleset, plies):
+        expected = max(-minimax(child, depth - 1, 1) for child in children(game))
+        score, move = Searcher().root(game, game.legal_moves(), depth)
+        assert score == expected
+        game.apply(move)
+        assert -minimax(game, depth - 1, 1) == expected
+
+
+def test_map_move_follows_symmetry():
+    for game in positions("Entschärft", 30, seed=6):
+        for sym, perm in enumerate(morris_board.SYMMETRIES):
+            image = game.copy()
+            image.bits = [0, morris_board.transform(game.bits[1], sym), morris_board.transform(game.bits[2], sym)]
+            mapped = sorted(morris_ai.map_move(m, perm) for m in game.legal_moves())
+            assert mapped == sorted(image.legal_moves())
+
+
+@pytest.mark.parametrize("plies", [3, 8])
+def test_table_keeps_placement_scores(plies):
+    # in the placement phase every position has a fixed ply, so the table /
+    # cannot mix depths and must not change the score / in der Setzphase hat jede
+    # Stellung einen festen Halbzug, die Tabelle mischt keine Tiefen und ändert nichts
+    tt = TranspositionTable(1)
+    for game in positions("Entschärft", plies, seed=2):
+        expected = max(-minimax(child, 2, 1) for child in children(game))
+        for _ in range(2):
+            assert Searcher(tt=tt).root(game, game.legal_moves(), 3)[0] == expected
+
+
+@pytest.mark.parametrize("plies,seed", [(30, 8), (30, 12)])
+def test_table_keeps_tournament_scores(plies, seed):
+    # transpositions reach a node with another anti-pendulum move, which the key /
+    # does not know / Zugumstellungen erreichen einen Knoten mit anderem
+    # Anti-Pendel-Zug, den der Schlüssel nicht kennt
+    for game in positions("Turnier", plies, count=2, seed=seed):
+        expected = max(-minimax(child, 4, 1) for child in children(game))
+        assert Searcher(tt=TranspositionTable(1)).root(game, game.legal_moves(), 5)[0] == expected
+
+
+@pytest.mark.parametrize("batch_min", [0, 1000])
+def test_root_moves_best_first(monkeypatch, batch_min):
+    # 0: NumPy batch (if installed), 1000: one by one / 0: NumPy-Batch (falls installiert), 1000: einzeln
+    monkeypatch.setattr(morris_ai, "BATCH_ORDER_MIN", batch_min)
+    for game in positions("Entschärft", 14, seed=11):
+        moves = morris_ai._root_moves(game, random.Random(0))
+        assert sorted(moves) == sorted(game.legal_moves())
+        scores = []
+        for move in moves:
+            game.apply(move)
+            scores.append(evaluate(game, 3 - game.current_player))
+            game.undo()
+        assert scores == sorted(scores, reverse=True)
+
+
+@pytest.mark.parametrize("difficulty", ["Leicht", "Mittel", "Schwer"])
+def test_choose_move_is_legal(difficulty):
+    for game in positions("Entschärft", 20, seed=3):
+        assert morris_ai.choose_move(game, difficulty, random.Random(0), depth=2) in game.legal_moves()
+
+
+def test_iterative_deepening_reaches_max_depth():
+    for game in positions("Entschärft", 30, seed=4):
+        score, move, depth = morris_ai.iterative_deepening(game, 60, 2, random.Random(0))
+        assert depth == 2
+        assert score == max(-minimax(child, 1, 1) for child in children(game))
+        assert move in game.legal_moves()
+
+
+def test_iterative_deepening_keeps_the_budget():
+    game = next(positions("Entschärft", 10, seed=5))
+    start = time.perf_counter()
+    score, move, depth = morris_ai.iterative_deepening(game, 0.2, rng=random.Random(0))
+    assert time.perf_counter() - start < 1.0
+    assert depth >= 1 and move in game.legal_moves()
+
+
+@pytest.fixture
+def fresh_pool():
+    # new worker processes, so no table entries of earlier tests are reused /
+    # neue Worker-Prozesse, damit keine Tabelleneinträge früherer Tests genutzt werden
+    morris_pool.shutdown_executor()
+    yield
+    morris_pool.shutdown_executor()
+
+
+@pytest.mark.parametrize("plies", [4, 9])
+def test_parallel_search_matches_minimax(fresh_pool, plies):
+    for game in positions("Entschärft", plies, count=2, seed=7):
+        expected = max(-minimax(child, 2, 1) for child in children(game))
+        score, move, depth = morris_ai.parallel_search(game, None, 3, workers=2, rng=random.Random(0))
+        assert (score, depth) == (expected, 3)
+        game.apply(move)
+        assert -minimax(game, 2, 1) == expected
+
+
+def test_parallel_search_keeps_the_budget(fresh_pool):
+    game = next(positions("Entschärft", 20, seed=8))
+    start = time.perf_counter()
+    score, move, depth = morris_ai.parallel_search(game, 0.3, workers=2, rng=random.Random(0))
+    assert time.perf_counter() - start < 2.0
+    assert depth >= 1 and move in game.legal_moves()
+
+
+def test_parallel_search_keeps_the_pool(fresh_pool):
+    # two legal moves for three workers: fewer tasks, same processes /
+    # zwei legale Züge für drei Worker: weniger Aufgaben, dieselben Prozesse
+    game = next(positions("Entschärft", 50, count=1, seed=35))
+    assert len(game.legal_moves()) == 2
+    pool = morris_pool.get_executor(3)
+    morris_ai.parallel_search(game, None, 2, workers=3, rng=random.Random(0))
+    assert morris_pool.get_executor(3) is pool
+
+
+def test_parallel_search_stops_the_workers(fresh_pool):
+    game = next(positions("Entschärft", 20, seed=8))
+    morris_pool.start_workers(2)
+    stop = threading.Event()
+    threading.Timer(0.3, stop.set).start()
+    score, move, depth = morris_ai.parallel_search(game, None, 30, workers=2, rng=random.Random(0), stop=stop)
+    stopped = time.perf_counter()
+    assert move in game.legal_moves()
+    # no task of the stopped search is left running / keine Aufgabe der gestoppten Suche läuft weiter
+    morris_pool.get_executor(2).submit(int).result()
+    assert time.perf_counter() - stopped < 0.2
+
+
+def test_think_handle_result():
+    game = next(positions("Entschärft", 20, seed=9))
+    before = (list(game.bits), game.current_player)
+    handle = morris_ai.ThinkHandle(game, "Schwer", depth=2)
+    move = handle.result()
+    assert handle.done() and move in game.legal_moves()
+    assert (list(game.bits), game.current_player) == before
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_think_handle_cancel(fresh_pool, workers):
+    game = next(positions("Entschärft", 20, seed=9))
+    if workers > 1:
+        morris_pool.start_workers(workers)
+    handle = morris_ai.ThinkHandle(game, "Schwer", depth=12, workers=workers)
+    time.sleep(0.2)
+    assert not handle.done()
+    start = time.perf_counter()
+    handle.cancel()
+    assert handle.done()
+    if workers > 1:
+        morris_pool.get_executor(workers).submit(int).result()
+    assert time.perf_counter() - start < 0.5
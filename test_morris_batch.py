@@ -0,0 +1,61 @@
+"""
+Nine Men's Morris Game - tests of the batch evaluation (morris_batch)
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+"""
+
+import random
+
+import pytest
+
+import morris_batch
+from morris_eval import evaluate
+from morris_game import MorrisGame
+
+pytestmark = pytest.mark.skipif(not morris_batch.available(), reason="numpy not installed")
+
+
+def positions(ruleset, plies, count=6, seed=1):
+    rng = random.Random(seed)
+    for _ in range(count):
+        game = MorrisGame(ruleset)
+        for _ in range(plies):
+            if game.result() is not None:
+                break
+            game.apply(rng.choice(game.legal_moves()))
+        if game.result() is None and game.legal_moves():
+            yield game
+
+
+def scalar_scores(game, moves):
+    player = game.current_player
+    scores = []
+    for move in moves:
+        game.apply(move)
+        scores.append(evaluate(game, player))
+        game.undo()
+    return scores
+
+
+@pytest.mark.parametrize("plies", [0, 5, 14, 30, 60, 120])
+def test_batch_matches_evaluate(plies):
+    for game in positions("Entschärft", plies):
+        moves = game.legal_moves()
+        p = game.current_player
+        boards, hand = morris_batch.child_boards(game, moves)
+        scores = morris_batch.evaluate_batch(boards, p, hand, game.in_hand(3 - p))
+        assert list(scores) == scalar_scores(game, moves)
+
+
+def test_order_moves_sorts_by_score():
+    for game in positions("Entschärft", 30, seed=2):
+        moves = game.legal_moves()
+        ordered = morris_batch.order_moves(game, moves)
+        assert sorted(ordered) == sorted(moves)
+        scores = scalar_scores(game, ordered)
+        assert scores == sorted(scores, reverse=True)
@@ -0,0 +1,114 @@
+"""
+Nine Men's Morris Game - tests of the bitboard helpers (morris_board)
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+
+Run with:  python3 -m pytest
+"""
+
+import random
+
+import pytest
+
+import morris_board
+from morris_board import LINES, MILLS, POINTS
+
+
+def neighbours(p):
+    return {b if a == p else a for a, b in LINES if p in (a, b)}
+
+
+def random_boards(count=500, seed=1):
+    """Zufällige Stellungen als 24er-Liste (0 leer, 1 weiß, 2 schwarz)."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield [rng.choice((0, 0, 1, 2)) for _ in range(POINTS)]
+
+
+def in_mill(state, p):
+    return any(p in mill and all(state[q] == state[p] for q in mill) for mill in MILLS)
+
+
+@pytest.mark.parametrize("state", list(random_boards(50)))
+def test_state_round_trip(state):
+    bits = morris_board.from_state(state)
+    assert morris_board.to_state(bits) == state
+    assert list(morris_board.iter_bits(bits[1])) == [p for p in range(POINTS) if state[p] == 1]
+
+
+def test_adjacency_matches_lines():
+    for p in range(POINTS):
+        assert morris_board.ADJ_MASK[p] == sum(1 << q for q in neighbours(p))
+        assert sorted(morris_board.ADJACENT[p]) == sorted(neighbours(p))
+
+
+def test_mill_tables():
+    for p in range(POINTS):
+        mills = [m for m in MILLS if p in m]
+        assert sorted(MILLS[k] for k in morris_board.POINT_MILLS[p]) == sorted(mills)
+        assert sorted(morris_board.MILL_PARTNERS[p]) == sorted(sum(1 << q for q in m if q != p) for m in mills)
+
+
+def test_mill_helpers_match_lists():
+    for state in random_boards():
+        bits = morris_board.from_state(state)
+        for player in (1, 2):
+            own, opp = bits[player], bits[3 - player]
+            for p in range(POINTS):
+                if state[p] == player:
+                    assert morris_board.forms_mill(own, p) == in_mill(state, p)
+            assert morris_board.mill_count(own) == sum(all(state[q] == player for q in m) for m in MILLS)
+            assert morris_board.open_twos(own, opp) == sum(
+                sorted(state[q] for q in m) == [0, player, player] for m in MILLS)
+            free = [p for p in range(POINTS) if state[p] == 3 - player and not in_mill(state, p)]
+            expected = free or [p for p in range(POINTS) if state[p] == 3 - player]
+            assert list(morris_board.iter_bits(morris_board.removable(opp))) == expected
+
+
+def test_mobility_and_has_moves_match_lists():
+    for state in random_boards():
+        bits = morris_board.from_state(state)
+        empty = morris_board.FULL & ~(bits[1] | bits[2])
+        for player in (1, 2):
+            own = bits[player]
+            steps = [(p, q) for p in range(POINTS) if state[p] == player for q in neighbours(p) if not state[q]]
+            assert morris_board.mobility(own, empty) == len(steps)
+            assert morris_board.has_moves(own, empty) == bool(steps)
+            for frm, to in steps[:3]:
+                # after frm -> to, going straight back is forbidden /
+                # nach frm -> to ist der direkte Rückzug verboten
+                moved = own ^ (1 << frm) ^ (1 << to)
+                after = empty ^ (1 << frm) ^ (1 << to)
+                expected = any(after >> q & 1 and (p, q) != (to, frm)
+                               for p in morris_board.iter_bits(moved) for q in neighbours(p))
+                assert morris_board.has_moves(moved, after, forbidden=(frm, to)) == expected
+
+
+@pytest.mark.parametrize("sym", range(16))
+def test_symmetries_keep_lines_and_mills(sym):
+    perm = morris_board.SYMMETRIES[sym]
+    assert sorted(perm) == list(range(POINTS))
+    assert {frozenset((perm[a], perm[b])) for a, b in LINES} == {frozenset(line) for line in LINES}
+    assert {frozenset(perm[p] for p in mill) for mill in MILLS} == {frozenset(mill) for mill in MILLS}
+    inverse = morris_board.SYMMETRIES[morris_board.SYMMETRY_INVERSE[sym]]
+    assert all(inverse[perm[p]] == p for p in range(POINTS))
+
+
+def test_transform_and_canonical():
+    for state in random_boards(100, seed=2):
+        bits = morris_board.from_state(state)
+        images = []
+        for sym, perm in enumerate(morris_board.SYMMETRIES):
+            white = morris_board.transform(bits[1], sym)
+            assert white == sum(1 << perm[p] for p in morris_board.iter_bits(bits[1]))
+            images.append((white, morris_board.transform(bits[2], sym)))
+        white, black, sym = morris_board.canonical(bits[1], bits[2])
+        assert white | black << 24 == min(w | b << 24 for w, b in images)
+        assert (white, black) == images[sym]
+        # every image has the same canonical form / jedes Bild hat dieselbe kanonische Form
+        assert morris_board.canonical(*images[5])[:2] == (white, black)
@@ -0,0 +1,117 @@
+"""
+Nine Men's Morris Game - tests of the endgame database (morris_endgame)
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+
+Solves the 3v3 subspace once (about a minute in pure Python).
+Löst einmal den Teilraum 3v3 (etwa eine Minute in reinem Python).
+"""
+
+import random
+
+import pytest
+
+import morris_board
+from morris_board import POINTS
+from morris_endgame import DRAW, LOSS, WIN, CanonicalIndex, EndgameDB, _Canonicaliser, decode, encode
+from morris_game import MorrisGame
+
+
+@pytest.fixture(scope="module")
+def db():
+    db = EndgameDB()
+    db.solve([(3, 3)], log=lambda *args: None)
+    return db
+
+
+def random_positions(count, a=3, b=3, seed=1):
+    rng = random.Random(seed)
+    for _ in range(count):
+        points = rng.sample(range(POINTS), a + b)
+        yield sum(1 << p for p in points[:a]), sum(1 << p for p in points[a:])
+
+
+def expected(db, own, opp):
+    """Wert aus den Nachfolgern (Bellman-Gleichung), Züge aus MorrisGame."""
+    state = [0] * POINTS
+    for p in morris_board.iter_bits(own):
+        state[p] = 1
+    for p in morris_board.iter_bits(opp):
+        state[p] = 2
+    game = MorrisGame.from_state(state, stones_set=(9, 9))
+    loss_dists, win_dists, draw = [], [], False
+    for move in game.legal_moves():
+        game.apply(move)
+        if game.result() is not None:
+            # opponent down to two stones / Gegner nur noch zwei Steine
+            loss_dists.append(0)
+        else:
+            res, dist = db.lookup(game.bits[2], game.bits[1])
+            if res == LOSS:
+                loss_dists.append(dist)
+            elif res == WIN:
+                win_dists.append(dist)
+            else:
+                draw = True
+        game.undo()
+    if loss_dists:
+        return WIN, min(loss_dists) + 1
+    if draw:
+        return DRAW, 0
+    return LOSS, max(win_dists, default=-1) + 1
+
+
+@pytest.mark.parametrize("result,distance", [(DRAW, 0), (WIN, 1), (LOSS, 0), (WIN, 253), (LOSS, 254)])
+def test_result_byte_round_trip(result, distance):
+    assert decode(encode(result, distance)) == (result, distance)
+
+
+@pytest.mark.parametrize("result,distance", [(WIN, 255), (WIN, 301), (LOSS, 255), (LOSS, 300)])
+def test_result_byte_keeps_result_when_clamped(result, distance):
+    assert decode(encode(result, distance)) == (result, 253 if result == WIN else 254)
+
+
+def test_canonical_index_is_a_bijection():
+    canon = _Canonicaliser()
+    index = CanonicalIndex.build(3, 3, canon)
+    ranks = sorted(index.index(own, opp) for own, opp in canon.representatives(3, 3))
+    assert ranks == list(range(index.size))
+
+
+def test_bellman_consistency(db):
+    results = set()
+    for own, opp in random_positions(3000):
+        hit = db.lookup(own, opp)
+        assert hit == expected(db, own, opp)
+        results.add(hit[0])
+    assert results == {WIN, LOSS, DRAW}
+
+
+def test_lookup_is_symmetric(db):
+    for own, opp in random_positions(200, seed=2):
+        hit = db.lookup(own, opp)
+        for sym in range(len(morris_board.SYMMETRIES)):
+            assert db.lookup(morris_board.transform(own, sym), morris_board.transform(opp, sym)) == hit
+
+
+@pytest.mark.parametrize("distances", [True, False])
+def test_file_round_trip(db, tmp_path, distances):
+    saved = EndgameDB()
+    saved.tables = dict(db.tables)
+    saved.indexes = dict(db.indexes)
+    saved.save(str(tmp_path), distances)
+    loaded = EndgameDB.load(str(tmp_path))
+    try:
+        assert loaded.subspaces() == [(3, 3)]
+        for own, opp in random_positions(2000, seed=3):
+            res, dist = db.lookup(own, opp)
+            assert loaded.lookup(own, opp) == (res, dist if distances else None)
+        # 4v4 was not built / 4v4 wurde nicht gebaut
+        assert loaded.lookup(15, 15 << 8) is None
+    finally:
+        loaded.close()
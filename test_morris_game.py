@@ -0,0 +1,171 @@
+"""
+Nine Men's Morris Game - tests of the rules engine (morris_game)
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+
+Run with:  python3 -m pytest
+"""
+
+import random
+
+import pytest
+
+import morris_board
+import morris_game
+from morris_bench import PERFT_START
+from morris_game import (MorrisGame, NO_MOVE_CODE, NO_POS, STONES_PER_PLAYER, TERM_MILLS, TERM_TWOS,
+                         decode_move, encode_move)
+
+
+def snapshot(game):
+    return (list(game.bits), list(game.stones_set), game.current_player, dict(game.last_move_by),
+            game.halfmove_clock, dict(game.position_counts), game.hash, game.lines, game.terms)
+
+
+def random_games(ruleset, count=20, plies=60, seed=1):
+    """Zufallspartien als Folge von (Spiel vor dem Zug, Zug)."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        game = MorrisGame(ruleset)
+        for _ in range(plies):
+            if game.result() is not None:
+                break
+            move = rng.choice(game.legal_moves())
+            yield game, move
+            game.apply(move)
+
+
+def test_start_position():
+    game = MorrisGame()
+    moves = game.legal_moves()
+    assert len(moves) == 24
+    assert all(frm == NO_POS and rem == NO_POS for frm, _, rem in moves)
+    assert game.in_placement() and game.result() is None
+
+
+@pytest.mark.parametrize("ruleset", ["Entschärft", "Turnier"])
+@pytest.mark.parametrize("depth", [1, 2, 3, 4, 5])
+def test_perft_start(ruleset, depth):
+    assert morris_game.perft(depth, MorrisGame(ruleset)) == PERFT_START[depth]
+
+
+def test_perft_counts_move_sequences():
+    for game, _ in random_games("Turnier", count=3, plies=40, seed=7):
+        expected = 0
+        for move in game.legal_moves():
+            game.apply(move)
+            expected += len(game.legal_moves()) if game.result() is None else 0
+            game.undo()
+        before = snapshot(game)
+        assert morris_game.perft(2, game) == expected
+        assert snapshot(game) == before
+
+
+@pytest.mark.parametrize("ruleset", ["Entschärft", "Turnier"])
+def test_apply_undo_round_trip(ruleset):
+    for game, move in random_games(ruleset):
+        before = snapshot(game)
+        game.apply(move)
+        game.undo()
+        assert snapshot(game) == before
+
+
+@pytest.mark.parametrize("ruleset", ["Entschärft", "Turnier"])
+def test_incremental_state_matches_recomputation(ruleset):
+    for game, move in random_games(ruleset, seed=4):
+        game.apply(move)
+        assert game.hash == game.compute_hash()
+        assert (game.lines, game.terms) == game.compute_terms()
+        for player in (1, 2):
+            own, opp = game.bits[player], game.bits[3 - player]
+            assert game.term(TERM_MILLS, player) == morris_board.mill_count(own)
+            assert game.term(TERM_TWOS, player) == morris_board.open_twos(own, opp)
+        game.undo()
+
+
+def test_move_code_round_trip():
+    assert encode_move(None) == NO_MOVE_CODE
+    assert decode_move(NO_MOVE_CODE) is None
+    codes = set()
+    for game, _ in random_games("Entschärft", count=10, plies=80, seed=8):
+        for move in game.legal_moves():
+            code = encode_move(move)
+            assert 0 <= code < NO_MOVE_CODE
+            assert decode_move(code) == move
+            codes.add((code, move))
+    # different moves never share a code / verschiedene Züge teilen nie einen Code
+    assert len({code for code, _ in codes}) == len({move for _, move in codes})
+
+
+def test_hash_tells_positions_apart():
+    seen = {}
+    for game, _ in random_games("Entschärft", seed=5):
+        key = (game.bits[1], game.bits[2], tuple(game.stones_set), game.current_player)
+        assert seen.setdefault(game.hash, key) == key
+
+
+def test_canonical_hash_is_symmetric():
+    for game, _ in random_games("Entschärft", count=5, plies=40, seed=6):
+        key, sym = game.canonical_hash()
+        white, black, _ = morris_board.canonical(game.bits[1], game.bits[2])
+        assert morris_board.transform(game.bits[1], sym) == white
+        assert morris_board.transform(game.bits[2], sym) == black
+        for s in range(len(morris_board.SYMMETRIES)):
+            image = game.copy()
+            image.bits = [0, morris_board.transform(game.bits[1], s), morris_board.transform(game.bits[2], s)]
+            assert image.canonical_hash()[0] == key
+
+
+@pytest.mark.parametrize("ruleset", ["Entschärft", "Turnier"])
+def test_moves_follow_the_rules(ruleset):
+    for game, _ in random_games(ruleset, seed=2):
+        p = game.current_player
+        moves = game.legal_moves()
+        assert game.has_moves() == bool(moves)
+        assert len(set(moves)) == len(moves)
+        for frm, to, rem in moves:
+            assert game.state[to] == 0
+            if game.in_hand(p):
+                assert frm == NO_POS
+            else:
+                assert game.state[frm] == p and to in game.targets(frm)
+            assert (rem != NO_POS) == game.forms_mill(frm, to)
+            if rem != NO_POS:
+                assert rem in game.removal_candidates()
+
+
+def test_copy_is_independent():
+    for game, move in random_games("Turnier", count=3, seed=3):
+        copy = game.copy()
+        before = snapshot(game)
+        copy.apply(move)
+        assert snapshot(game) == before
+
+
+def test_tournament_repetition_draw():
+    # both sides shuttle a stone back and forth (no anti-pendulum: two stones each) /
+    # beide Seiten pendeln (kein Anti-Pendeln: je zwei Steine im Wechsel)
+    state = [0] * 24
+    for p in (0, 2, 4, 6):
+        state[p] = 1
+    for p in (9, 11, 13, 15):
+        state[p] = 2
+    game = MorrisGame.from_state(state, (STONES_PER_PLAYER,) * 2, ruleset="Turnier")
+    cycle = [(0, 1, NO_POS), (9, 8, NO_POS), (2, 3, NO_POS), (11, 10, NO_POS),
+             (1, 0, NO_POS), (8, 9, NO_POS), (3, 2, NO_POS), (10, 11, NO_POS)]
+    for _ in range(2):
+        for move in cycle:
+            assert game.result() is None
+            assert move in game.legal_moves()
+            game.apply(move)
+    assert game.repetition_count(1) == 2
+    for move in cycle:
+        game.apply(move)
+        if game.result() is not None:
+            break
+    assert game.result() == 0
@@ -0,0 +1,102 @@
+"""
+Nine Men's Morris Game - tests of the Monte Carlo tree search (morris_mcts)
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+"""
+
+import random
+import threading
+import time
+
+import pytest
+
+import morris_mcts
+import morris_pool
+from morris_game import MorrisGame
+from morris_mcts import Tree
+
+
+def positions(ruleset, plies, count=4, seed=1):
+    rng = random.Random(seed)
+    for _ in range(count):
+        game = MorrisGame(ruleset)
+        for _ in range(plies):
+            if game.result() is not None:
+                break
+            game.apply(rng.choice(game.legal_moves()))
+        if game.result() is None:
+            yield game
+
+
+def state(game):
+    return list(game.bits), game.current_player, game.hash, len(game.history)
+
+
+@pytest.mark.parametrize("plies", [0, 20, 60])
+def test_playout_leaves_the_game_unchanged(plies):
+    rng = random.Random(0)
+    for game in positions("Entschärft", plies):
+        before = state(game)
+        for _ in range(20):
+            assert 0.0 <= morris_mcts.playout(game, rng) <= 1.0
+        assert state(game) == before
+
+
+def test_search_counts_the_playouts():
+    for game in positions("Entschärft", 20, seed=2):
+        before = state(game)
+        root = Tree().search(game, playouts=100, rng=random.Random(0))
+        assert state(game) == before
+        assert root.visits == 100
+        assert sum(child.visits for child in root.children) == 100
+        assert {child.move for child in root.children} <= set(game.legal_moves())
+
+
+def test_tree_is_reused():
+    game = next(positions("Entschärft", 20, seed=3))
+    tree = Tree()
+    root = tree.search(game, playouts=300, rng=random.Random(0))
+    child = max(root.children, key=lambda c: c.visits)
+    grandchild = max(child.children, key=lambda c: c.visits)
+    game.apply(child.move)
+    game.apply(grandchild.move)
+    visits = grandchild.visits
+    assert tree.search(game, playouts=50, rng=random.Random(0)) is grandchild
+    assert grandchild.parent is None and grandchild.visits == visits + 50
+
+
+@pytest.mark.parametrize("plies", [6, 30])
+def test_choose_move_is_legal(plies):
+    for game in positions("Entschärft", plies, seed=4):
+        move = morris_mcts.choose_move(game, random.Random(0), playouts=64, workers=1, tree=Tree())
+        assert move in game.legal_moves()
+
+
+
+def test_parallel_choose_move_is_legal():
+    game = next(positions("Entschärft", 20, seed=5))
+    before = state(game)
+    try:
+        move = morris_mcts.choose_move(game, random.Random(0), playouts=128, workers=2)
+    finally:
+        morris_pool.shutdown_executor()
+    assert move in game.legal_moves()
+    assert state(game) == before
+
+
+def test_parallel_choose_move_stops():
+    game = next(positions("Entschärft", 20, seed=6))
+    stop = threading.Event()
+    threading.Timer(0.3, stop.set).start()
+    start = time.perf_counter()
+    try:
+        move = morris_mcts.choose_move(game, random.Random(0), time_limit=30, workers=2, stop=stop)
+    finally:
+        morris_pool.shutdown_executor()
+    assert time.perf_counter() - start < 1.5
+    assert move in game.legal_moves()
@@ -0,0 +1,56 @@
+"""
+Nine Men's Morris Game - tests of the self-play tournament (morris_tournament)
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+"""
+
+import json
+import math
+
+import pytest
+
+import morris_eval
+from morris_tournament import elo, parse_config, play_game
+
+
+def test_elo():
+    assert elo(10, 0, 10)[0] == 0.0
+    assert elo(0, 20, 0)[0] == 0.0
+    diff, error = elo(30, 0, 10)
+    # 75 % score / 75 % Punkte
+    assert diff == pytest.approx(400 * math.log10(3))
+    assert 0 < error < math.inf
+    assert elo(10, 0, 30)[0] == pytest.approx(-diff)
+    # more games, narrower interval / mehr Partien, schmaleres Intervall
+    assert elo(300, 0, 100)[1] < error
+    assert elo(5, 0, 0) == (math.inf, math.inf)
+    assert elo(0, 0, 5) == (-math.inf, math.inf)
+    assert elo(0, 0, 0) == (0.0, math.inf)
+
+
+def test_parse_config(tmp_path):
+    assert parse_config("Mittel") == ("Mittel", {})
+    assert parse_config("Schwer:depth=3,time=0.5") == ("Schwer", {"depth": 3, "time": 0.5})
+    path = tmp_path / "weights.json"
+    weights = list(range(1, len(morris_eval.DEFAULT_WEIGHTS) + 1))
+    path.write_text(json.dumps({"weights": weights}), encoding="utf-8")
+    assert parse_config(f"Leicht:weights={path}") == ("Leicht", {"weights": tuple(weights)})
+
+
+@pytest.mark.parametrize("spec", ["Unmöglich", "Schwer:tiefe=3", "Schwer:depth=drei", "Schwer:weights=/nicht/da.json"])
+def test_parse_config_rejects(spec):
+    with pytest.raises(ValueError):
+        parse_config(spec)
+
+
+def test_play_game(monkeypatch):
+    monkeypatch.setattr(morris_eval, "WEIGHTS", morris_eval.WEIGHTS)
+    config = parse_config("Schwer:depth=1")
+    result, clock = play_game(config, config, "Entschärft", seed=1)
+    assert result in (0, 1, 2)
+    assert set(clock) == {1, 2} and clock[1][1] > 0 and clock[2][1] > 0
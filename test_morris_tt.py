@@ -0,0 +1,70 @@
+"""
+Nine Men's Morris Game - tests of the transposition table (morris_tt)
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+"""
+
+import pytest
+
+from morris_game import NO_MOVE_CODE, encode_move
+from morris_tt import EXACT, LOWER, UPPER, TranspositionTable
+
+
+@pytest.fixture
+def tt():
+    return TranspositionTable(0.01)
+
+
+@pytest.mark.parametrize("score", [0, 1, -1, 99950, -99950, 123456, -123456])
+@pytest.mark.parametrize("flag", [EXACT, LOWER, UPPER])
+def test_store_probe_round_trip(tt, score, flag):
+    move = encode_move((3, 4, 17))
+    tt.store(12345, 7, flag, score, move)
+    assert tt.probe(12345) == (7, flag, score, move)
+    assert tt.probe(12346) is None
+
+
+def test_move_defaults_to_none(tt):
+    tt.store(5, 1, EXACT, 10)
+    assert tt.probe(5)[3] == NO_MOVE_CODE
+
+
+def test_depth_preferred_and_always_replace(tt):
+    # keys of one bucket / Schlüssel desselben Buckets
+    a, b, c, d = (1 + k * tt.buckets for k in range(4))
+    tt.store(a, 6, EXACT, 1)
+    # shallower entry goes to the always-replace slot / flacher Eintrag in den Immer-Slot
+    tt.store(b, 2, EXACT, 2)
+    assert tt.probe(a)[2] == 1 and tt.probe(b)[2] == 2
+    tt.store(c, 3, EXACT, 3)
+    assert tt.probe(a)[2] == 1 and tt.probe(b) is None and tt.probe(c)[2] == 3
+    # as deep or deeper replaces the depth-preferred slot / gleich tief oder tiefer ersetzt den Tiefen-Slot
+    tt.store(d, 6, EXACT, 4)
+    assert tt.probe(a) is None and tt.probe(d)[2] == 4 and tt.probe(c)[2] == 3
+    # the same position is updated in place, even when shallower /
+    # dieselbe Stellung wird an Ort und Stelle aktualisiert, auch wenn flacher
+    tt.store(d, 1, LOWER, 5)
+    assert tt.probe(d) == (1, LOWER, 5, NO_MOVE_CODE)
+
+
+def test_counters(tt):
+    a, b, c = (7 + k * tt.buckets for k in range(3))
+    tt.store(a, 4, EXACT, 0)
+    tt.store(a, 5, EXACT, 0)
+    tt.store(b, 1, EXACT, 0)
+    tt.store(c, 1, EXACT, 0)
+    tt.probe(a)
+    tt.probe(b)
+    stats = tt.stats()
+    assert stats["used"] == 2
+    assert stats["stores"] == 4
+    assert stats["overwrites"] == 1
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["used"] == sum(k is not None for k in tt.keys)
+    tt.clear()
+    assert tt.stats()["used"] == 0 and tt.probe(a) is None
@@ -0,0 +1,66 @@
+"""
+Nine Men's Morris Game - tests of the runtime translation (nine-mens-morris.py)
+
+Copyright (C) 2025 Uwe Kletscher (ScatterAdd)
+This project is licensed under the GNU General Public License Version 3 (GPL-3.0).
+You are allowed to use, modify, and distribute this project,
+provided that all modified versions are also released under the GPL-3.0 license.
+
+See LICENSE for the full license text.
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip("pygame")
+
+
+@pytest.fixture
+def game_module(monkeypatch):
+    # the file name has dashes, so it is loaded by path / der Dateiname hat Bindestriche, daher über den Pfad
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nine-mens-morris.py")
+    spec = importlib.util.spec_from_file_location("nine_mens_morris", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def replace_longest_first(text, subs):
+    """Ersetzung wie vor den kompilierten Tabellen: längste Phrase zuerst, nacheinander."""
+    for de_src, tgt in sorted(subs, key=lambda pair: len(pair[0]), reverse=True):
+        text = text.replace(de_src, tgt)
+    return text
+
+
+def test_german_is_unchanged(game_module):
+    game_module.CURRENT_LANG = "de"
+    assert game_module.tr("Mühle! Entferne gegnerischen Stein.") == "Mühle! Entferne gegnerischen Stein."
+    assert not game_module._tr_memo
+
+
+@pytest.mark.parametrize("lang", ["en", "fr", "es"])
+def test_matches_longest_first_replacement(game_module, lang):
+    game_module.CURRENT_LANG = lang
+    _, table = game_module.compile_translation(lang)
+    for de_src in table:
+        assert game_module.tr(de_src) == replace_longest_first(de_src, table.items())
+
+
+def test_results_are_memoized(game_module):
+    game_module.CURRENT_LANG = "en"
+    first = game_module.tr("Mühle! Entferne gegnerischen Stein.")
+    assert first == "Mill! Remove an opponent stone."
+    assert game_module.tr("Mühle! Entferne gegnerischen Stein.") is first
+    assert game_module._tr_memo["Mühle! Entferne gegnerischen Stein."] is first
+
+
+def test_toggle_language_clears_memo(game_module):
+    game_module.CURRENT_LANG = "en"
+    english = game_module.tr("Mühle! Entferne gegnerischen Stein.")
+    game_module.toggle_language()
+    assert game_module.CURRENT_LANG == "fr"
+    assert not game_module._tr_memo
+    assert game_module.tr("Mühle! Entferne gegnerischen Stein.") != english